@@ -12,43 +12,45 @@ import streamlit as st
 from pathlib import Path
 
 # Import config and utils
-from config import PATHS, SETTINGS
-from utils import load_projects, load_manifests, load_nyquist_status, page_divider
-
-# Import page modules
-from pages import overview, federation_health, project_tracker, nyquist_tunnel, about
-from pages.projects import whitepaper, online_voting, nursing, gene_therapy, modern_slavery, abi, dcia
+from config import SETTINGS
+from utils import load_snapshot, page_divider
+from data_layer import current_snapshot
+from git_info import get_git_info
+import compiled_snapshot
+import watcher
+import path_health
+import router
+import perf
+from page_registry import PageRegistry, PageEntry
+from css_assets import build_sheet, inject_theme, finish_rerun, set_byte_counter
 
 # ========== PAGE ROUTING ==========
 
-# Organized by category
-PAGES = {
+# Module paths only — a page is imported the first time it is visited.
+# Entries are grouped into sidebar sections by category, in this order.
+PAGES = PageRegistry([
     # === SYSTEM ===
-    "📊 Overview": overview,
-    "🏥 Federation Health": federation_health,
-    "📋 Project Tracker": project_tracker,
-    "🟢 Nyquist Tunnel": nyquist_tunnel,
+    PageEntry("📊 Overview", "pages.overview", "SYSTEM"),
+    PageEntry("🏥 Federation Health", "pages.federation_health", "SYSTEM"),
+    PageEntry("📋 Project Tracker", "pages.project_tracker", "SYSTEM"),
+    PageEntry("🟢 Nyquist Tunnel", "pages.nyquist_tunnel", "SYSTEM"),
 
     # === CORE ENGINES ===
-    "───── CORE ENGINES ─────": None,  # Separator
-    "📄 White Paper Pipeline": whitepaper,
+    PageEntry("📄 White Paper Pipeline", "pages.projects.whitepaper", "CORE ENGINES"),
 
     # === WICKED PROBLEMS ===
-    "───── WICKED PROBLEMS ─────": None,  # Separator
-    "🗳️ Online Voting": online_voting,
-    "🏥 Nursing Programs": nursing,
-    "🧬 Gene Therapy": gene_therapy,
-    "⛓️ Modern Slavery": modern_slavery,
+    PageEntry("🗳️ Online Voting", "pages.projects.online_voting", "WICKED PROBLEMS"),
+    PageEntry("🏥 Nursing Programs", "pages.projects.nursing", "WICKED PROBLEMS"),
+    PageEntry("🧬 Gene Therapy", "pages.projects.gene_therapy", "WICKED PROBLEMS"),
+    PageEntry("⛓️ Modern Slavery", "pages.projects.modern_slavery", "WICKED PROBLEMS"),
 
     # === INSTITUTIONAL REDESIGN ===
-    "───── INSTITUTIONS ─────": None,  # Separator
-    "🔍 ABI (Bureau)": abi,
-    "🌐 D.C.I.A.": dcia,
+    PageEntry("🔍 ABI (Bureau)", "pages.projects.abi", "INSTITUTIONS"),
+    PageEntry("🌐 D.C.I.A.", "pages.projects.dcia", "INSTITUTIONS"),
 
-    # === META ===
-    "───────────────────────": None,  # Separator
-    "ℹ️ About": about,
-}
+    # === META === (no heading, follows a divider)
+    PageEntry("ℹ️ About", "pages.about", None),
+])
 
 
 # ========== STYLING ==========
@@ -588,31 +590,19 @@ def get_standard_css():
     }
     """
 
+def get_theme_sheet(matrix_mode=True):
+    """Minified, content-hashed base + theme stylesheet (built once per process)."""
+    if matrix_mode:
+        return build_sheet("theme-matrix", get_base_css(), get_matrix_css())
+    return build_sheet("theme-standard", get_base_css(), get_standard_css())
+
+
 def apply_dashboard_css(matrix_mode=True):
-    """Apply Pan Handlers Dashboard theme based on mode."""
-    base_css = get_base_css()
-    theme_css = get_matrix_css() if matrix_mode else get_standard_css()
-
-    # Use unique key to force CSS re-injection on theme change
-    theme_key = "matrix" if matrix_mode else "standard"
-
-    # Force immediate CSS application with JavaScript
-    force_css = """
-    <script>
-        // Force CSS recalculation
-        document.body.style.display = 'none';
-        document.body.offsetHeight; // Trigger reflow
-        document.body.style.display = '';
-    </script>
-    """ if matrix_mode else ""
-
-    st.markdown(f"""
-    <style data-theme="{theme_key}">
-    {base_css}
-    {theme_css}
-    </style>
-    {force_css}
-    """, unsafe_allow_html=True)
+    """
+    Apply Pan Handlers Dashboard theme based on mode. The sheet reaches a
+    session once; later reruns send nothing unless the theme changes.
+    """
+    inject_theme(get_theme_sheet(matrix_mode), mode=SETTINGS['css_delivery'])
 
 
 # ========== MAIN ==========
@@ -624,104 +614,102 @@ def main():
         layout="wide",
     )
 
-    # Initialize matrix mode in session state (default: OFF - standard mode)
-    if 'matrix_mode' not in st.session_state:
-        st.session_state['matrix_mode'] = False
+    # One trace per script run: spans, bytes emitted, cache hits (perf.py)
+    set_byte_counter(perf.count_bytes)
+    perf.begin_rerun()
+    try:
+        run_dashboard()
+    finally:
+        perf.end_rerun()
+
+
+def run_dashboard():
+    with perf.span("startup"):
+        # Seed the data layer from the compiled snapshot (once per process)
+        if SETTINGS['compiled_snapshot']:
+            compiled_snapshot.warm_start()
+
+        # Background file watcher pushes data invalidations (no-op once running)
+        if SETTINGS['file_watcher']:
+            watcher.start()
+
+        # Background probe of PATHS; pages read its cached results
+        if SETTINGS['path_probe']:
+            path_health.start()
+
+    # Page and theme come from the URL (?page=...&theme=...) before anything renders
+    with perf.span("route"):
+        route = router.resolve(PAGES)
+    perf.set_page(route.page)
 
     # Apply CSS based on current mode
-    apply_dashboard_css(matrix_mode=st.session_state['matrix_mode'])
+    with perf.span("css.theme"):
+        apply_dashboard_css(matrix_mode=route.matrix_mode)
 
     # Load data into session state
-    st.session_state['projects_data'] = load_projects()
-    st.session_state['manifests'] = load_manifests()
-    st.session_state['nyquist_status'] = load_nyquist_status()
+    # Sessions share one frozen snapshot per process: store a reference and its version, not a copy
+    with perf.span("data.snapshot"):
+        previous_version = current_snapshot().version
+        snapshot = load_snapshot()
+        perf.note_cache(snapshot.version == previous_version)
+    st.session_state['snapshot'] = snapshot
+    st.session_state['snapshot_epoch'] = snapshot.version
+    with perf.span("data.git_info"):
+        st.session_state['git_info'] = get_git_info()
 
     # Sidebar navigation
-    with st.sidebar:
+    with perf.span("sidebar"), st.sidebar:
         st.markdown("### 🍳 Pan Handlers")
         st.markdown("*The Back Alley*")
 
-        # Git branch info
-        try:
-            import subprocess
-            branch = subprocess.run(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                capture_output=True, text=True, cwd=PATHS['repo_root']
-            ).stdout.strip()
-            st.caption(f"📂 Branch: `{branch}`")
-        except Exception:
-            st.caption("📂 Branch: unknown")
+        # Git branch info (read from .git on disk, cached by HEAD/ref mtime)
+        git_info = st.session_state['git_info']
+        if git_info.short_sha:
+            st.caption(f"📂 Branch: `{git_info.branch}` @ `{git_info.short_sha}`")
+        else:
+            st.caption(f"📂 Branch: {git_info.branch}")
 
         st.markdown("---")
 
-        # Matrix mode toggle button - styled like a toggle switch
-        if st.session_state['matrix_mode']:
+        # Matrix mode toggle button - styled like a toggle switch.
+        # Callbacks run before the rerun the click triggers, so that run
+        # already has the new theme and page (one run per click).
+        if route.matrix_mode:
             st.markdown("**🔴 MATRIX MODE: ON**")
-            if st.button("Exit The Matrix", use_container_width=True, key="matrix_toggle"):
-                st.session_state['matrix_mode'] = False
-                st.experimental_rerun()
+            st.button("Exit The Matrix", use_container_width=True, key="matrix_toggle",
+                      on_click=router.set_theme, args=(False,))
         else:
             st.markdown("**⚪ MATRIX MODE: OFF**")
-            if st.button("Enter The Matrix", use_container_width=True, key="matrix_toggle"):
-                st.session_state['matrix_mode'] = True
-                st.experimental_rerun()
+            st.button("Enter The Matrix", use_container_width=True, key="matrix_toggle",
+                      on_click=router.set_theme, args=(True,))
 
         st.markdown("---")
 
-        # Initialize page selection in session state
-        if 'current_page' not in st.session_state:
-            st.session_state['current_page'] = "📊 Overview"
-
-        # Navigation - single column vertical buttons
-        st.markdown("**SYSTEM**")
-        if st.button("📊 Overview", use_container_width=True):
-            st.session_state['current_page'] = "📊 Overview"
-        if st.button("🏥 Federation Health", use_container_width=True):
-            st.session_state['current_page'] = "🏥 Federation Health"
-        if st.button("📋 Project Tracker", use_container_width=True):
-            st.session_state['current_page'] = "📋 Project Tracker"
-        if st.button("🟢 Nyquist Tunnel", use_container_width=True):
-            st.session_state['current_page'] = "🟢 Nyquist Tunnel"
-
-        st.markdown("**CORE ENGINES**")
-        if st.button("📄 White Paper Pipeline", use_container_width=True):
-            st.session_state['current_page'] = "📄 White Paper Pipeline"
-
-        st.markdown("**WICKED PROBLEMS**")
-        if st.button("🗳️ Online Voting", use_container_width=True):
-            st.session_state['current_page'] = "🗳️ Online Voting"
-        if st.button("🏥 Nursing Programs", use_container_width=True):
-            st.session_state['current_page'] = "🏥 Nursing Programs"
-        if st.button("🧬 Gene Therapy", use_container_width=True):
-            st.session_state['current_page'] = "🧬 Gene Therapy"
-        if st.button("⛓️ Modern Slavery", use_container_width=True):
-            st.session_state['current_page'] = "⛓️ Modern Slavery"
-
-        st.markdown("**INSTITUTIONS**")
-        if st.button("🔍 ABI (Bureau)", use_container_width=True):
-            st.session_state['current_page'] = "🔍 ABI (Bureau)"
-        if st.button("🌐 D.C.I.A.", use_container_width=True):
-            st.session_state['current_page'] = "🌐 D.C.I.A."
-
-        st.markdown("---")
-        if st.button("ℹ️ About", use_container_width=True):
-            st.session_state['current_page'] = "ℹ️ About"
+        # Navigation - single column vertical buttons, one section per category
+        for category, entries in PAGES.categories():
+            if category:
+                st.markdown(f"**{category}**")
+            else:
+                st.markdown("---")
+            for entry in entries:
+                st.button(entry.label, use_container_width=True, key=f"nav_{entry.slug}",
+                          on_click=router.navigate, args=(PAGES, entry.label))
 
-        page_selection = st.session_state['current_page']
+        page_selection = route.page
 
         st.markdown("---")
 
         # Quick stats in sidebar
-        manifests = st.session_state.get('manifests', [])
-        projects_data = st.session_state.get('projects_data', {})
+        manifests = snapshot.manifest_models
+        projects = snapshot.project_models
 
         st.markdown(f"**Repos Connected:** {len(manifests)}")
-        if projects_data:
-            st.markdown(f"**Flagship Projects:** {len(projects_data.get('flagship_projects', []))}")
+        if projects:
+            st.markdown(f"**Flagship Projects:** {len(projects)}")
 
         # Health indicator
         st.markdown("---")
-        nyquist_connected = PATHS['nyquist_status'].exists()
+        nyquist_connected = path_health.exists('nyquist_status')
         if nyquist_connected:
             st.markdown("🟢 **Nyquist:** Connected")
         else:
@@ -731,14 +719,23 @@ def main():
         st.markdown("*System Health Monitor*")
         st.markdown("*via VUDU Network*")
 
-    # Render selected page
-    page_module = PAGES.get(page_selection)
-    if page_module and hasattr(page_module, 'render'):
-        page_module.render()
-    elif page_module is None:
+    # Render selected page (imported on first visit)
+    if page_selection not in PAGES:
         st.info("Select a page from the sidebar.")
     else:
-        st.error(f"Page '{page_selection}' not found")
+        with perf.span(f"page.{PAGES.slug_for(page_selection)}"):
+            page_module = PAGES.load(page_selection)
+            if hasattr(page_module, 'render'):
+                page_module.render()
+            else:
+                st.error(f"Page '{page_selection}' not found")
+
+    # Disable page-scoped stylesheets left over from the previous page; record what this rerun sent
+    with perf.span("css.finish"):
+        finish_rerun()
+
+    if SETTINGS['perf_overlay']:
+        perf.render_overlay()
 
 
 if __name__ == "__main__":
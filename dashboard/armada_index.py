@@ -0,0 +1,212 @@
+"""
+PAN HANDLERS DASHBOARD — S7 ARMADA RESULTS INDEX
+
+Persistent, incremental index of S7_ARMADA/armada_results/*.json.
+
+The index records the results directory's stat key and, per result file,
+its (mtime, size) plus the ships found inside; a run's time is its file
+mtime. A call costs one stat of the directory; only when that changes
+(files added, removed or renamed) is it listed again, and only new or
+changed files are parsed. The index is written to disk so a restarted
+worker does not re-read thousands of files from a network mount. Run
+count, newest run and per-ship summaries are precomputed, so reading them
+is O(1).
+
+Usage:
+    from armada_index import get_armada_index
+    index = get_armada_index()
+    index.run_count, index.newest_run, index.ships['claude-opus'].runs
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from config import PATHS, SETTINGS
+from data_layer import stat_key
+
+INDEX_FORMAT = 1
+
+
+class ShipSummary(NamedTuple):
+    """Aggregate over every result file a ship appears in."""
+    ship: str
+    runs: int
+    last_run: str               # file name of the newest run including this ship
+    last_run_time: float        # mtime (epoch seconds) of that file
+
+
+class ArmadaIndex(NamedTuple):
+    """Precomputed view of the armada results directory."""
+    results_dir: str
+    run_count: int
+    newest_run: Optional[str]   # file name
+    newest_run_time: Optional[float]
+    ships: dict                 # ship name -> ShipSummary
+    scanned_at: float
+
+
+EMPTY = ArmadaIndex(results_dir="", run_count=0, newest_run=None, newest_run_time=None, ships={}, scanned_at=0.0)
+
+_lock = threading.Lock()
+_state = {
+    'dir_key': None,
+    'files': {},        # file name -> [mtime_ns, size, [ships]]
+    'index': EMPTY,
+    'loaded': False,    # persisted index read from disk
+    'last_check': 0.0,
+}
+
+
+# ========== RESULT FILES ==========
+
+def _results_dir():
+    return str(PATHS['s7_armada_dir'] / "armada_results")
+
+
+def _ship_names(data):
+    """
+    Ship names in one result file. Accepts a mapping keyed by ship or a
+    list of records naming the ship/model, under the usual top-level keys.
+    """
+    if not isinstance(data, dict):
+        return []
+    for key in ('ships', 'results', 'fleet', 'models'):
+        value = data.get(key)
+        if isinstance(value, dict):
+            return [str(name) for name in value]
+        if isinstance(value, list):
+            names = []
+            for item in value:
+                if isinstance(item, dict):
+                    name = item.get('ship') or item.get('model') or item.get('name')
+                    if name:
+                        names.append(str(name))
+                elif isinstance(item, str):
+                    names.append(item)
+            return names
+    return []
+
+
+def _read_ships(path):
+    try:
+        with open(path, "rb") as f:
+            return _ship_names(json.loads(f.read()))
+    except Exception:
+        return []  # unreadable result files still count as runs
+
+
+# ========== PERSISTENCE ==========
+
+def _load_persisted(results_dir):
+    try:
+        with open(PATHS['armada_index'], "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None, {}
+    if data.get('format') != INDEX_FORMAT or data.get('results_dir') != results_dir:
+        return None, {}
+    dir_key = tuple(data['dir_key']) if data.get('dir_key') else None
+    return dir_key, data.get('files', {})
+
+
+def _persist(results_dir, dir_key, files):
+    path = PATHS['armada_index']
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                'format': INDEX_FORMAT,
+                'results_dir': results_dir,
+                'dir_key': list(dir_key) if dir_key else None,
+                'files': files,
+            }, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[armada_index] could not persist index: {e}", file=sys.stderr)
+
+
+# ========== INDEX ==========
+
+def _aggregate(results_dir, files):
+    ships = {}
+    newest, newest_time = None, None
+    # Oldest first so each ship's last_run ends on its newest file
+    for name, (mtime_ns, _, ship_names) in sorted(files.items(), key=lambda item: (item[1][0], item[0])):
+        run_time = mtime_ns / 1e9
+        newest, newest_time = name, run_time
+        for ship in ship_names:
+            previous = ships.get(ship)
+            ships[ship] = ShipSummary(
+                ship=ship,
+                runs=(previous.runs if previous else 0) + 1,
+                last_run=name,
+                last_run_time=run_time,
+            )
+    return ArmadaIndex(
+        results_dir=results_dir,
+        run_count=len(files),
+        newest_run=newest,
+        newest_run_time=newest_time,
+        ships=ships,
+        scanned_at=time.time(),
+    )
+
+
+def _rescan(results_dir, previous):
+    """List the directory and parse only new or changed result files."""
+    files = {}
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            cached = previous.get(entry.name)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                files[entry.name] = cached
+            else:
+                files[entry.name] = [st.st_mtime_ns, st.st_size, _read_ships(entry.path)]
+    return files
+
+
+def refresh():
+    """Stat the results directory and rebuild the index if it changed."""
+    results_dir = _results_dir()
+    with _lock:
+        if not _state['loaded']:
+            _state['dir_key'], _state['files'] = _load_persisted(results_dir)
+            _state['index'] = _aggregate(results_dir, _state['files']) if _state['files'] else EMPTY
+            _state['loaded'] = True
+
+        _state['last_check'] = time.monotonic()
+        dir_key = stat_key(results_dir)
+        if dir_key is None:
+            if _state['dir_key'] is not None or _state['files']:
+                _state.update(dir_key=None, files={}, index=EMPTY)
+            return _state['index']
+        if dir_key == _state['dir_key']:
+            return _state['index']
+
+        files = _rescan(results_dir, _state['files'])
+        _state.update(dir_key=dir_key, files=files, index=_aggregate(results_dir, files))
+        _persist(results_dir, dir_key, files)
+        return _state['index']
+
+
+def get_armada_index(max_age=None):
+    """
+    Return the armada index. Calls within `max_age` seconds of the last
+    check (default: the snapshot's max age) skip even the directory stat.
+    """
+    if max_age is None:
+        max_age = SETTINGS['snapshot_max_age']
+    if _state['loaded'] and time.monotonic() - _state['last_check'] < max_age:
+        return _state['index']
+    return refresh()
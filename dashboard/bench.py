@@ -0,0 +1,260 @@
+"""
+PAN HANDLERS DASHBOARD — PAGE LATENCY BENCHMARK
+
+Headless benchmark of every dashboard page (the `PAGES` registry in app.py)
+and every Grand Hall page (top-level pages/) using Streamlit's AppTest, over
+synthetic federations of configurable size.
+
+For each size a federation is generated by synthetic.py in a temporary
+directory: `size` manifests and projects, plus armada runs, workbooks and
+glossary terms that grow with it (capped). A fresh worker process is started
+with PAN_HANDLERS_ROOT / PAN_HANDLERS_CACHE_DIR pointing at it, so no
+process-wide cache leaks between sizes and the real .cache/ is never
+touched. Per page the worker measures:
+
+- cold_ms   first run of a new AppTest session on that page (includes the
+            page's first import and any cache fills it triggers)
+- warm_ms   median of the following reruns of the same session
+- peak_kib  tracemalloc peak over one extra rerun
+- deltas    elements in the rendered tree
+
+Results are written as JSON; compared against a baseline, any metric more
+than `--threshold` worse is flagged and the exit status is 1.
+
+The URL prober is switched off in workers (it would probe thousands of
+synthetic URLs); everything else runs with the normal SETTINGS.
+
+Usage:
+    python bench.py                                 # sizes 10, 1000, 10000
+    python bench.py --sizes 10 1000 --runs 3
+    python bench.py --save-baseline                 # write PATHS['bench_baseline']
+    python bench.py --threshold 0.25 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from config import PATHS
+from synthetic import FederationSpec, generate
+
+BENCH_FORMAT = 1
+DEFAULT_SIZES = (10, 1000, 10000)
+GRAND_HALL_PAGES = ('home', 'project_view', 'roadmap', 'glossary', 'about', 'matrix')
+METRICS = ('cold_ms', 'warm_ms', 'peak_kib', 'deltas')
+NOISE_FLOOR = {'cold_ms': 5.0, 'warm_ms': 2.0, 'peak_kib': 64.0, 'deltas': 0}
+
+DASHBOARD_DIR = Path(__file__).parent.resolve()
+GRAND_HALL_DIR = DASHBOARD_DIR.parent / "pages"
+
+
+# ========== WORKER (one federation, one process) ==========
+
+_GRAND_HALL_SCRIPT = """
+import importlib
+import importlib.util
+import sys
+import streamlit as st
+from utils import load_snapshot
+
+snapshot = load_snapshot()
+st.session_state['manifests'] = snapshot.manifests
+st.session_state['projects_data'] = snapshot.projects or {{}}
+
+# Loaded as a package (not as `pages`, which is the dashboard's own page package)
+# so the pages' relative imports of their dashboard loader resolve
+package = sys.modules.get("grand_hall")
+if package is None:
+    spec = importlib.util.spec_from_file_location("grand_hall", {init!r}, submodule_search_locations=[{directory!r}])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["grand_hall"] = package
+    spec.loader.exec_module(package)
+module = importlib.import_module("grand_hall.{name}")
+module.render()
+"""
+
+
+def _count_elements(node):
+    children = getattr(node, 'children', None)
+    if isinstance(children, dict):
+        return sum(_count_elements(child) for child in children.values())
+    return 1
+
+
+def _measure(make_app, runs):
+    at = make_app()
+    started = time.perf_counter()
+    at.run()
+    cold = (time.perf_counter() - started) * 1000
+    error = str(at.exception[0].value) if at.exception else None
+
+    warm = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        at.run()
+        warm.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'cold_ms': round(cold, 2),
+        'warm_ms': round(statistics.median(warm), 2) if warm else None,
+        'peak_kib': round(peak / 1024, 1),
+        'deltas': _count_elements(at._tree),
+        'error': error,
+    }
+
+
+def _worker(size, runs, timeout, output):
+    from streamlit.testing.v1 import AppTest
+    from config import SETTINGS
+    SETTINGS['url_probe'] = False
+    from app import PAGES
+
+    results = []
+    for label in PAGES:
+        def make_app(label=label):
+            at = AppTest.from_file(str(DASHBOARD_DIR / "app.py"), default_timeout=timeout)
+            at.session_state['current_page'] = label
+            return at
+        results.append({'size': size, 'page': f"dashboard/{PAGES.slug_for(label)}", **_measure(make_app, runs)})
+
+    for name in GRAND_HALL_PAGES:
+        script = _GRAND_HALL_SCRIPT.format(name=name, init=str(GRAND_HALL_DIR / "__init__.py"), directory=str(GRAND_HALL_DIR))
+        def make_app(script=script):
+            return AppTest.from_string(script, default_timeout=timeout)
+        results.append({'size': size, 'page': f"grand_hall/{name}", **_measure(make_app, runs)})
+
+    Path(output).write_text(json.dumps(results), encoding="utf-8")
+
+
+def _run_size(size, runs, timeout, seed):
+    with tempfile.TemporaryDirectory(prefix=f"ph-bench-{size}-") as tmp:
+        pan = generate(tmp, FederationSpec(
+            manifests=size, projects=size, armada_runs=min(size, 1000),
+            workbooks=min(size // 10, 200), glossary_terms=min(size, 2000), seed=seed,
+        ))
+        output = Path(tmp) / "results.json"
+        env = dict(os.environ,
+                   PAN_HANDLERS_ROOT=str(pan),
+                   PAN_HANDLERS_CACHE_DIR=str(Path(tmp) / "cache"))
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", "--sizes", str(size),
+             "--runs", str(runs), "--timeout", str(timeout), "--output", str(output)],
+            cwd=DASHBOARD_DIR, env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"worker for size {size} failed:\n{proc.stderr}")
+        return json.loads(output.read_text(encoding="utf-8"))
+
+
+# ========== BASELINE ==========
+
+def _environment():
+    try:
+        import streamlit
+        streamlit_version = streamlit.__version__
+    except ImportError:
+        streamlit_version = None
+    return {'python': platform.python_version(), 'streamlit': streamlit_version,
+            'machine': platform.machine(), 'system': platform.system()}
+
+
+def compare(results, baseline, threshold):
+    """[(size, page, metric, baseline, current)] for metrics worse than baseline * (1 + threshold)."""
+    previous = {(r['size'], r['page']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result['size'], result['page']))
+        if before is None:
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > NOISE_FLOOR[metric]:
+                regressions.append((result['size'], result['page'], metric, old, new))
+    return regressions
+
+
+def format_results(results):
+    lines = [f"{'size':>6} {'page':<34} {'cold ms':>9} {'warm ms':>9} {'peak KiB':>9} {'deltas':>7}"]
+    for r in results:
+        warm = f"{r['warm_ms']:>9.1f}" if r['warm_ms'] is not None else f"{'-':>9}"
+        line = f"{r['size']:>6} {r['page']:<34} {r['cold_ms']:>9.1f} {warm} {r['peak_kib']:>9.1f} {r['deltas']:>7}"
+        if r.get('error'):
+            line += f"  ERROR: {r['error']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# ========== CLI ==========
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dashboard pages over synthetic federations.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--runs", type=int, default=5, help="warm reruns per page (median is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per AppTest run")
+    parser.add_argument("--output", default=None, help="write results JSON here")
+    parser.add_argument("--baseline", default=str(PATHS['bench_baseline']))
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown flagged as a regression")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _worker(args.sizes[0], args.runs, args.timeout, args.output)
+        return 0
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking {size} manifests / projects…", file=sys.stderr)
+        results.extend(_run_size(size, args.runs, args.timeout, args.seed))
+    print(format_results(results))
+
+    report = {
+        'format': BENCH_FORMAT,
+        'created_at': time.time(),
+        'environment': _environment(),
+        'runs': args.runs,
+        'seed': args.seed,
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print("No baseline to compare against (run with --save-baseline).")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline.get('format') != BENCH_FORMAT:
+        print(f"Baseline {baseline_path} has an incompatible format; not compared.")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for size, page, metric, old, new in regressions:
+        print(f"REGRESSION {size:>6} {page:<34} {metric}: {old} -> {new} (+{(new / old - 1) * 100 if old else 0:.0f}%)")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {baseline_path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""
+PAN HANDLERS DASHBOARD — COMPILED FEDERATION SNAPSHOT
+
+Compiles every federation input (projects.json, manifests/*.json and the
+Nyquist status files) into one binary file. A cold worker maps it read-only
+and runs one `marshal.loads` over the mapping, then seeds the data layer so
+its first sweep publishes a snapshot without decoding any JSON. Workers
+started by serve.py read the same file, so its raw bytes sit once in the
+page cache; the decoded objects are not shared, and each worker unmarshals
+and keeps its own copy. What the file saves is the JSON parsing, not
+memory per worker.
+
+Each source is recorded with its stat key and a content hash. A source whose
+stat key still matches is trusted as-is; one whose stat key moved (another
+machine, a fresh checkout) is re-hashed, and only sources whose hash really
+changed are parsed again.
+
+File layout:
+    MAGIC | format version (u16) | interpreter tag length (u16) | tag | marshal payload
+
+Usage:
+    python compiled_snapshot.py build     # compile (CI / image build step)
+    python compiled_snapshot.py check     # report stale sources, exit 1 if any
+
+    import compiled_snapshot
+    compiled_snapshot.warm_start()        # on-start hook, once per process
+
+With SETTINGS['compiled_snapshot_rebuild'] off (serve.py workers) a stale
+snapshot is never rewritten by the worker: still-valid sources are seeded,
+changed ones are parsed by the data layer, and the launcher recompiles.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from config import PATHS, SETTINGS
+import data_layer
+
+MAGIC = b"PHSNAP\x00\x01"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct(">HH")
+
+# marshal output is only guaranteed readable by the interpreter that wrote it
+_INTERPRETER_TAG = importlib.util.MAGIC_NUMBER
+
+_lock = threading.Lock()
+_state = {
+    'started': False,
+    'report': None,
+}
+
+
+# ========== SOURCES ==========
+
+def _relative(path):
+    """Store paths relative to the repo root so the file survives a move."""
+    try:
+        return os.path.relpath(path, PATHS['repo_root'])
+    except ValueError:
+        return str(path)
+
+
+def _absolute(rel_path):
+    return os.path.normpath(os.path.join(PATHS['repo_root'], rel_path))
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _read_source(path):
+    """Return (stat_key, digest, value, error) for one input file."""
+    key = data_layer.stat_key(path)
+    if key is None:
+        return None, None, None, None
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return key, None, None, str(e)
+    try:
+        value, error = data_layer.parse_json_bytes(data), None
+    except Exception as e:
+        value, error = None, str(e)
+    return key, _digest(data), value, error
+
+
+def _current_inputs():
+    singles, manifests = data_layer.input_paths()
+    return list(singles.values()) + list(manifests)
+
+
+# ========== BUILD ==========
+
+def compile_snapshot(path=None, reuse=None):
+    """
+    Read and parse every input and write the compiled snapshot atomically.
+    `reuse` maps absolute path -> (stat_key, digest, value, error) for
+    sources already known to be current; those are not read again.
+    Returns the payload that was written.
+    """
+    path = Path(path or PATHS['compiled_snapshot'])
+    reuse = reuse or {}
+    sources = {}
+    for source in _current_inputs():
+        record = reuse.get(source)
+        if record is None:
+            record = _read_source(source)
+        sources[_relative(source)] = record
+
+    payload = {
+        'created_at': time.time(),
+        'sources': sources,
+    }
+    body = marshal.dumps(payload)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(FORMAT_VERSION, len(_INTERPRETER_TAG)))
+        f.write(_INTERPRETER_TAG)
+        f.write(body)
+    os.replace(tmp, path)
+    return payload
+
+
+# ========== LOAD ==========
+
+def load_compiled(path=None):
+    """
+    Map the compiled snapshot read-only and decode it into this process's
+    own objects (the mapping is closed before returning). Returns the
+    payload, or None when the file is missing, truncated or written by
+    another format or interpreter version.
+    """
+    path = Path(path or PATHS['compiled_snapshot'])
+    try:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):   # ValueError: empty file
+        return None
+
+    with data:
+        if data[:len(MAGIC)] != MAGIC:
+            return None
+        offset = len(MAGIC)
+        try:
+            version, tag_length = _HEADER.unpack_from(data, offset)
+        except struct.error:
+            return None
+        offset += _HEADER.size
+        if version != FORMAT_VERSION or data[offset:offset + tag_length] != _INTERPRETER_TAG:
+            return None
+        # The view must be released before the mapping closes
+        with memoryview(data) as view:
+            try:
+                payload = marshal.loads(view[offset + tag_length:])
+            except (EOFError, ValueError, TypeError):
+                return None
+    return payload if isinstance(payload, dict) and 'sources' in payload else None
+
+
+def validate(payload):
+    """
+    Compare a compiled payload against the files on disk.
+
+    Returns (current, stale): `current` maps absolute path ->
+    (stat_key, digest, value, error) for every source whose content still
+    matches, with the stat key refreshed; `stale` lists paths that are new
+    or changed. Unchanged stat keys cost one stat; moved ones one read+hash.
+    """
+    recorded = payload['sources']
+    current, stale = {}, []
+    for source in _current_inputs():
+        record = recorded.get(_relative(source))
+        key = data_layer.stat_key(source)
+        if record is None:
+            stale.append(source)
+            continue
+
+        old_key, digest, value, error = record
+        if old_key == key:
+            current[source] = record
+            continue
+        if key is None or old_key is None or digest is None:
+            stale.append(source)
+            continue
+        try:
+            with open(source, "rb") as f:
+                same = _digest(f.read()) == digest
+        except OSError:
+            same = False
+        if same:
+            current[source] = (key, digest, value, error)
+        else:
+            stale.append(source)
+    return current, stale
+
+
+# ========== ON-START HOOK ==========
+
+def warm_start(path=None):
+    """
+    Load the compiled snapshot into the data layer, recompiling it first if
+    it is missing or any source changed. Runs once per process; later calls
+    return the first call's report dict.
+    """
+    with _lock:
+        if _state['started']:
+            return _state['report']
+        _state['started'] = True
+
+        started = time.perf_counter()
+        payload = load_compiled(path)
+        current, stale = validate(payload) if payload is not None else ({}, None)
+
+        rebuilt = False
+        if (payload is None or stale) and SETTINGS['compiled_snapshot_rebuild']:
+            try:
+                payload = compile_snapshot(path, reuse=current)
+                current = {_absolute(rel): record for rel, record in payload['sources'].items()}
+                rebuilt = True
+            except OSError as e:
+                # Read-only deploy: keep whatever was still valid
+                print(f"[compiled_snapshot] could not write snapshot: {e}", file=sys.stderr)
+
+        data_layer.seed({
+            source: (key, value, error, digest.hex() if digest else None)
+            for source, (key, digest, value, error) in current.items()
+        })
+
+        _state['report'] = {
+            'sources': len(current),
+            'stale': len(stale) if stale is not None else None,
+            'rebuilt': rebuilt,
+            'seconds': time.perf_counter() - started,
+        }
+        return _state['report']
+
+
+# ========== CLI ==========
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile or check the federation snapshot.")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--path", default=None, help=f"snapshot file (default: {PATHS['compiled_snapshot']})")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        started = time.perf_counter()
+        payload = compile_snapshot(args.path)
+        size = Path(args.path or PATHS['compiled_snapshot']).stat().st_size
+        print(f"Compiled {len(payload['sources'])} sources ({size:,} bytes) "
+              f"in {time.perf_counter() - started:.3f}s")
+        return 0
+
+    payload = load_compiled(args.path)
+    if payload is None:
+        print("No usable compiled snapshot.")
+        return 1
+    _, stale = validate(payload)
+    for source in stale:
+        print(f"stale: {source}")
+    print(f"{len(payload['sources'])} sources, {len(stale)} stale")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
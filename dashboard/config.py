@@ -9,6 +9,7 @@ Usage:
     projects = load_json(PATHS['projects_file'])
 """
 
+import os
 from pathlib import Path
 
 # ========== PATH RESOLUTION ==========
@@ -16,12 +17,16 @@ from pathlib import Path
 # Get the absolute path to the dashboard directory (where this config.py lives)
 DASHBOARD_DIR = Path(__file__).parent.resolve()
 
-# Get the Pan Handlers root (one level up from dashboard/)
-PAN_HANDLERS_ROOT = DASHBOARD_DIR.parent.resolve()
+# Get the Pan Handlers root (one level up from dashboard/).
+# PAN_HANDLERS_ROOT points the dashboard at another federation, e.g. a synthetic one for benchmarks.
+PAN_HANDLERS_ROOT = Path(os.environ.get('PAN_HANDLERS_ROOT') or DASHBOARD_DIR.parent).resolve()
 
 # Get the Nyquist Consciousness repo root (one level up from Pan_Handlers/)
 REPO_ROOT = PAN_HANDLERS_ROOT.parent.resolve()
 
+# Build artifacts (compiled snapshot, indexes); PAN_HANDLERS_CACHE_DIR keeps benchmark runs out of the real cache
+CACHE_DIR = Path(os.environ.get('PAN_HANDLERS_CACHE_DIR') or DASHBOARD_DIR / ".cache").resolve()
+
 # ========== ALL PATHS IN ONE PLACE ==========
 
 PATHS = {
@@ -48,6 +53,25 @@ PATHS = {
 
     # Publication status
     'publication_status': REPO_ROOT / "publication_status.json",
+
+    # Markdown glossaries (glossary_store.py parses them alongside the Grand Hall's in-code GLOSSARY)
+    'glossary_md': PAN_HANDLERS_ROOT / "data" / "glossary.md",
+    'glossary_sync_out': PAN_HANDLERS_ROOT / "circle" / "SYNC_OUT" / "GLOSSARY.md",
+
+    # Compiled federation snapshot (compiled_snapshot.py) — build artifact, not committed
+    'compiled_snapshot': CACHE_DIR / "federation.snapshot",
+
+    # Persistent S7 Armada results index (armada_index.py) — build artifact, not committed
+    'armada_index': CACHE_DIR / "armada_index.json",
+
+    # Static HTML export of every page (static_export.py) — build artifact, serve with any file server
+    'static_export': CACHE_DIR / "static",
+
+    # Parsed markdown glossaries keyed by stat key + content hash (glossary_store.py) — build artifact, not committed
+    'glossary_store': CACHE_DIR / "glossary_store.json",
+
+    # Page benchmark baseline (bench.py) — machine-specific, written with --save-baseline
+    'bench_baseline': DASHBOARD_DIR / "bench_baseline.json",
 }
 
 # ========== DASHBOARD SETTINGS ==========
@@ -55,6 +79,61 @@ PATHS = {
 SETTINGS = {
     # Cache settings
     'cache_ttl': 60,  # seconds
+    'snapshot_max_age': 0.25,  # seconds — loaders in one rerun share a stat sweep
+
+    # Filesystem watcher (watcher.py) — pushes invalidations instead of polling per rerun
+    'file_watcher': True,
+    'watcher_debounce': 0.05,       # seconds of quiet before a burst counts as one change
+    'watcher_poll_interval': 1.0,   # seconds, polling backend only
+
+    # Path health probe (path_health.py) — pages read cached existence checks
+    'path_probe': True,
+    'path_probe_interval': 30.0,    # seconds between background sweeps of PATHS
+
+    # Manifest URL prober (url_health.py) — live url_repo / url_dashboard checks on Federation Health
+    'url_probe': True,
+    'url_probe_timeout': 5.0,       # seconds per request
+    'url_probe_per_host': 16,       # concurrent requests to one host; more links than this queue in rounds
+    'url_probe_keepalive': 30.0,    # seconds an idle pooled connection is kept
+    'url_probe_ttl': 300,           # seconds a result (good or bad) is reused
+    'url_probe_wait': 6.0,          # seconds check() waits for never-checked URLs by default
+    'url_probe_refresh': 1.0,       # seconds between Federation Health refreshes while links are pending
+
+    # Rerun instrumentation (perf.py) — spans, bytes emitted, cache hits; cheap enough to leave on
+    'perf_tracing': True,
+    'perf_overlay': False,          # show the ⏱️ Perf expander in the sidebar
+    'perf_ring_size': 500,          # reruns kept for JSONL export
+
+    # CSS delivery (css_assets.py) — 'head': sheet sent once per session (needs st.html scripts, else per rerun); 'inline': every rerun
+    'css_delivery': 'head',
+
+    # Manifest loading (manifest_loader.py) — parallel parse, one diagnostics report per snapshot
+    'manifest_process_threshold': 256,  # more changed files than this are parsed on a process pool
+    'manifest_max_bytes': 1024 * 1024,  # larger manifests are reported, not parsed
+
+    # Listings (pagination.py) — cards per page in Overview, Federation Health, Project Tracker
+    'page_size': 24,
+
+    # Federation Health repo list: 'page' (one delta), 'repo' (one per repo) or 'widgets' (st.expander)
+    'federation_render_mode': 'page',
+
+    # Compiled snapshot — load on start, rebuild when any source hash changed
+    'compiled_snapshot': True,
+    # serve.py workers set PAN_HANDLERS_SNAPSHOT_READONLY=1: only the launcher rewrites the shared file
+    'compiled_snapshot_rebuild': os.environ.get('PAN_HANDLERS_SNAPSHOT_READONLY') != '1',
+
+    # Multi-worker serving (serve.py) — N Streamlit workers behind a local sticky-session proxy
+    'serve_host': '127.0.0.1',      # proxy bind address; '0.0.0.0' exposes it on every interface
+    'serve_port': 8504,             # the proxy; what browsers connect to
+    'serve_workers': 0,             # 0 = one per CPU, at most 4
+    'serve_worker_port': 8600,      # worker i listens on 127.0.0.1:(serve_worker_port + i)
+    'serve_health_interval': 5.0,   # seconds between worker health checks (and restarts)
+    'serve_snapshot_interval': 2.0, # seconds between source checks for the shared snapshot
+
+    # Glossary search (glossary_search.py) — token index, prefix trie, bounded edit distance
+    'glossary_max_results': 50,
+    'glossary_fuzzy_edits': 2,      # at most this many edits per query token (1 below 8 letters)
+    'glossary_query_cache': 512,    # ranked results kept per glossary version
 
     # Theme colors (Pan Handlers green aesthetic)
     'colors': {
@@ -117,6 +196,7 @@ def print_debug_info():
     print(f"Dashboard Dir: {DASHBOARD_DIR}")
     print(f"Pan Handlers Root: {PAN_HANDLERS_ROOT}")
     print(f"Repo Root: {REPO_ROOT}")
+    print(f"Cache Dir: {CACHE_DIR}")
     print("\nAll Paths:")
     for key, path in PATHS.items():
         exists = "✓" if path.exists() else "✗"
@@ -0,0 +1,329 @@
+"""
+PAN HANDLERS DASHBOARD — CSS ASSET PIPELINE
+
+Minifies and de-duplicates stylesheets once per process, gives each one a
+content hash, and delivers it to a browser session only once.
+
+Delivery ('head' mode): the first time a session needs a sheet, a small
+st.html script (unsafe_allow_javascript) appends it to the document's
+<head> as <style id="ph-css-<digest>">. That element lives outside
+Streamlit's element tree, so it survives reruns: later reruns send nothing
+for it, and switching theme or page only sends a few bytes to enable or
+disable sheets already in the head. A sheet's digest changes only when its
+CSS does, so an edited sheet is sent again under its new id. What a rerun
+sends is recorded as delivered only when `finish_rerun()` closes that
+rerun; a rerun that was interrupted sends it again on the next one (the
+script skips ids already present).
+
+Streamlit versions whose st.html cannot run scripts get the fallback: one
+<style> element per sheet on every rerun (st.html, else st.markdown), as in
+'inline' mode, which always does that (static export, embedding hosts).
+
+Only streamlit and the stdlib are imported here so the Grand Hall pages
+can use the pipeline too; the dashboard registers perf.count_bytes with
+`set_byte_counter()` so delivered CSS shows up in its rerun traces.
+
+Usage:
+    sheet = build_sheet("theme-matrix", get_base_css(), get_matrix_css())
+    inject_theme(sheet)                 # sent once per session per theme
+    inject_page_css(sheet)              # page-scoped, disabled on leaving the page
+    finish_rerun()                      # end of main(): disable stale page sheets, record delivery
+"""
+
+import hashlib
+import inspect
+import json
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+import streamlit as st
+
+_SESSION_KEY = '_css_assets'
+_STYLE_ID = "ph-css-"
+
+_hooks = {
+    'count_bytes': None,    # callable(n) told about every payload sent
+}
+
+
+class Stylesheet(NamedTuple):
+    """A minified stylesheet and its content hash."""
+    name: str
+    css: str
+    digest: str         # first 12 hex chars of sha256(css)
+    source_bytes: int   # size before minification
+
+    @property
+    def element_id(self):
+        return _STYLE_ID + self.digest
+
+
+# ========== MINIFY / DEDUPE ==========
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_AROUND = re.compile(r"\s*([{};,>])\s*")
+_AFTER_COLON = re.compile(r":\s+")
+_TRAILING_SEMI = re.compile(r";}")
+
+
+def minify(css):
+    """
+    Strip comments and redundant whitespace. Whitespace before ':' is kept,
+    since `a :hover` and `a:hover` are different selectors.
+    """
+    css = _COMMENT.sub("", css)
+    css = _SPACE.sub(" ", css)
+    css = _AROUND.sub(r"\1", css)
+    css = _AFTER_COLON.sub(":", css)
+    css = _TRAILING_SEMI.sub("}", css)
+    return css.strip()
+
+
+def _split_rules(css):
+    """Split minified CSS into top-level rules (at-rule blocks stay whole)."""
+    rules, depth, start = [], 0, 0
+    for i, char in enumerate(css):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+    tail = css[start:].strip()
+    if tail:
+        rules.append(tail)
+    return rules
+
+
+def dedupe(css):
+    """
+    Drop repeated identical rules. The last copy is kept so the cascade
+    order of the surviving rule matches the original.
+    """
+    rules = _split_rules(css)
+    seen, kept = set(), []
+    for rule in reversed(rules):
+        if rule not in seen:
+            seen.add(rule)
+            kept.append(rule)
+    return "".join(reversed(kept))
+
+
+@lru_cache(maxsize=64)
+def build_sheet(name, *sources):
+    """
+    Concatenate, minify and de-duplicate `sources` into a Stylesheet.
+    Cached on the source strings: callers pass the same constant strings
+    on every rerun, so only the first call does any work.
+    """
+    css = dedupe(minify("\n".join(sources)))
+    return Stylesheet(
+        name=name,
+        css=css,
+        digest=hashlib.sha256(css.encode("utf-8")).hexdigest()[:12],
+        source_bytes=sum(len(s.encode("utf-8")) for s in sources),
+    )
+
+
+# ========== SESSION DELIVERY ==========
+
+@lru_cache(maxsize=None)
+def head_delivery_supported():
+    """True when st.html can run a script, which placing sheets in <head> needs."""
+    html = getattr(st, 'html', None)
+    if html is None:
+        return False
+    try:
+        return 'unsafe_allow_javascript' in inspect.signature(html).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _session():
+    state = st.session_state.get(_SESSION_KEY)
+    if state is None:
+        state = {
+            'sent': set(),          # digests in this browser's <head>, per finished reruns
+            'theme': None,          # digest of the enabled theme sheet
+            'pages_enabled': set(),
+            'rerun': None,          # what the running rerun sent; committed by finish_rerun()
+            'bytes_sent': 0,
+        }
+        st.session_state[_SESSION_KEY] = state
+    return state
+
+
+def _begin_rerun(state):
+    state['rerun'] = {'sent': set(), 'theme': None, 'pages_enabled': set(), 'pages_requested': set(), 'bytes': 0}
+    return state['rerun']
+
+
+def set_byte_counter(count_bytes):
+    """Report the size of every CSS payload sent to `count_bytes(n)` (None to stop)."""
+    _hooks['count_bytes'] = count_bytes
+
+
+def _count(n):
+    count_bytes = _hooks['count_bytes']
+    if count_bytes is not None:
+        count_bytes(n)
+
+
+# Applies one payload of add / enable / disable operations to <head>;
+# whitespace is stripped once here, since it is re-sent with every switch
+_HEAD_SCRIPT = "".join(line.strip() for line in """<script>
+(function() {
+  var doc = document, ops = OPS;
+  ops.add.forEach(function(item) {
+    if (!doc.getElementById(item[0])) {
+      var el = doc.createElement('style');
+      el.id = item[0];
+      el.textContent = item[1];
+      if (ops.group) el.setAttribute('data-ph-group', ops.group);
+      doc.head.appendChild(el);
+    }
+  });
+  if (ops.group) {
+    doc.querySelectorAll('style[data-ph-group="' + ops.group + '"]').forEach(function(el) {
+      el.disabled = ops.enable.indexOf(el.id) < 0;
+    });
+  }
+  ops.enable.forEach(function(id) { var el = doc.getElementById(id); if (el) el.disabled = false; });
+  ops.disable.forEach(function(id) { var el = doc.getElementById(id); if (el) el.disabled = true; });
+})();
+</script>""".splitlines())
+
+
+def _emit(rerun, add=(), enable=(), disable=(), group=None):
+    """
+    Send one script that adds, enables and disables sheets in the
+    document's <head>. With `group`, added sheets are tagged with it and
+    every other sheet in the group is disabled, which also cleans up after
+    a server restart reused the browser tab.
+    """
+    payload = json.dumps({
+        'group': group,
+        'add': [[sheet.element_id, sheet.css] for sheet in add],
+        'enable': [_STYLE_ID + digest for digest in enable],
+        'disable': [_STYLE_ID + digest for digest in disable],
+    }).replace("</", "<\\/")
+    script = _HEAD_SCRIPT.replace("OPS", payload, 1)
+    rerun['sent'].update(sheet.digest for sheet in add)
+    rerun['bytes'] += len(script)
+    _count(len(script))
+    st.html(script, unsafe_allow_javascript=True)
+
+
+def _style_element(sheet):
+    """Fallback delivery: the sheet as a <style> element of this rerun."""
+    html = f'<style id="{sheet.element_id}" data-sheet="{sheet.name}">{sheet.css}</style>'
+    _count(len(html))
+    emit_html = getattr(st, 'html', None)
+    if emit_html is not None:
+        emit_html(html)
+    else:
+        st.markdown(html, unsafe_allow_html=True)
+
+
+def _inline(sheet):
+    html = f'<style data-sheet="{sheet.name}">{sheet.css}</style>'
+    _count(len(html))
+    st.markdown(html, unsafe_allow_html=True)
+
+
+def inject_theme(sheet, mode="head"):
+    """
+    Make `sheet` the session's active theme. In 'head' mode the CSS crosses
+    the websocket once per session; switching back to a theme already sent
+    only toggles `disabled` on the existing <style> elements. Called first
+    in every rerun, so it also starts the rerun's delivery record.
+    """
+    if mode != "head":
+        _inline(sheet)
+        return
+    if not head_delivery_supported():
+        _style_element(sheet)
+        return
+
+    state = _session()
+    rerun = _begin_rerun(state)
+    if state['theme'] == sheet.digest:
+        return
+
+    previous = state['theme']
+    _emit(
+        rerun,
+        add=() if sheet.digest in state['sent'] else (sheet,),
+        enable=(sheet.digest,),
+        disable=(previous,) if previous else (),
+        group='theme',
+    )
+    rerun['theme'] = sheet.digest
+
+
+def inject_page_css(sheet, mode="head"):
+    """
+    Enable a page-scoped sheet for this rerun. It stays enabled while the
+    page keeps requesting it and is disabled by `finish_rerun()` otherwise.
+    """
+    if mode != "head":
+        _inline(sheet)
+        return
+    if not head_delivery_supported():
+        _style_element(sheet)
+        return
+
+    state = _session()
+    rerun = state['rerun'] or _begin_rerun(state)
+    rerun['pages_requested'].add(sheet.digest)
+    if sheet.digest in state['pages_enabled'] or sheet.digest in rerun['pages_enabled']:
+        return
+
+    _emit(rerun, add=() if sheet.digest in state['sent'] else (sheet,), enable=(sheet.digest,))
+    rerun['pages_enabled'].add(sheet.digest)
+
+
+def finish_rerun():
+    """
+    Disable page sheets that were not requested during this rerun, then
+    record everything the rerun sent as delivered.
+    """
+    if not head_delivery_supported():
+        return
+    state = _session()
+    rerun = state['rerun']
+    if rerun is None:
+        return
+
+    enabled = state['pages_enabled'] | rerun['pages_enabled']
+    stale = enabled - rerun['pages_requested']
+    if stale:
+        _emit(rerun, disable=sorted(stale))
+
+    state['sent'] |= rerun['sent']
+    if rerun['theme'] is not None:
+        state['theme'] = rerun['theme']
+    state['pages_enabled'] = enabled - stale
+    state['bytes_sent'] += rerun['bytes']
+    state['rerun'] = None
+
+
+def inline_css(sheet):
+    """
+    Emit a minified sheet with st.markdown. For hosts that cannot call
+    `finish_rerun()` and therefore cannot scope a head-injected sheet.
+    """
+    _inline(sheet)
+
+
+def delivered():
+    """Digests of the sheets finished reruns have placed in this session's <head>."""
+    return frozenset(_session()['sent'])
+
+
+def bytes_sent():
+    """Total script bytes finished reruns have sent this session for CSS delivery."""
+    return _session()['bytes_sent']
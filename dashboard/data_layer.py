@@ -0,0 +1,295 @@
+"""
+PAN HANDLERS DASHBOARD — DATA LAYER
+
+Stat-validated, versioned snapshot of every federation input.
+
+Each sweep stats projects.json, every manifest and the Nyquist status files.
+Only files whose (mtime, size, inode) changed are re-parsed; if nothing
+changed the previously published snapshot is returned as-is, so an unchanged
+rerun costs a stat sweep and no JSON decoding. While the background watcher
+runs, even the stat sweep is skipped until the watcher's data epoch moves.
+
+Parsed JSON is frozen (dicts become read-only mappings, lists become
+tuples) when a file is parsed, and every manifest and flagship project is
+scored against its schema (schema.py) when the snapshot is built, so one snapshot object can be shared by every
+session in the process: a session stores a reference and the version number,
+never a copy, and no page can mutate what another session sees.
+
+Usage:
+    from data_layer import get_snapshot
+    snapshot = get_snapshot()
+    snapshot.version, snapshot.projects, snapshot.manifests
+"""
+
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from config import PATHS
+from models import build_manifests, build_projects
+import facet_index
+import schema
+from manifest_loader import ManifestIssue, ManifestReport, EMPTY_REPORT, parse_many, assemble
+import watcher
+
+# PATHS keys of the single-file inputs; the watcher watches these plus manifests_dir
+SINGLE_FILES = ('projects_file', 'nyquist_status', 'publication_status')
+
+
+class Snapshot(NamedTuple):
+    """Immutable view of the federation inputs at one point in time."""
+    version: int
+    created_at: float
+    projects: Optional[MappingProxyType]    # None when projects.json is missing
+    manifests: tuple                        # frozen manifests, ordered by repo id
+    nyquist_status: MappingProxyType
+    publication_status: MappingProxyType
+    manifest_report: ManifestReport         # load stats + every read / parse / schema issue
+    file_errors: MappingProxyType           # PATHS key -> message for unreadable single files
+    manifest_models: tuple              # models.Manifest per manifest, same order
+    project_models: tuple               # models.Project per flagship project
+    manifest_facets: facet_index.FacetIndex     # status / owner / tag -> manifest models
+    project_facets: facet_index.FacetIndex      # status / track / owner -> project models
+
+
+EMPTY_MAPPING = MappingProxyType({})
+
+EMPTY = Snapshot(
+    version=0, created_at=0.0, projects=None, manifests=(),
+    nyquist_status=EMPTY_MAPPING, publication_status=EMPTY_MAPPING, manifest_report=EMPTY_REPORT,
+    file_errors=EMPTY_MAPPING, manifest_models=(), project_models=(),
+    manifest_facets=facet_index.EMPTY_MANIFESTS, project_facets=facet_index.EMPTY_PROJECTS,
+)
+
+_lock = threading.Lock()
+_state = {
+    'snapshot': EMPTY,
+    'last_sweep': 0.0,
+    'swept_epoch': None,   # watcher epoch observed by the last sweep
+    'files': {},          # path -> (stat_key, value, error, digest)
+    'manifest_dir': None,  # (stat_key, tuple of manifest paths)
+    'project_conformance': (None, ()),  # (frozen projects object, its Conformance results)
+}
+
+
+# ========== STAT HELPERS ==========
+
+def stat_key(path):
+    """Return the (mtime_ns, size, inode) triple for `path`, or None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def parse_json_bytes(data):
+    """Decode one JSON input from raw bytes."""
+    return json.loads(data)
+
+
+def freeze(value):
+    """Deep read-only copy of decoded JSON: dict -> MappingProxyType, list -> tuple."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _parse_json(path):
+    with open(path, "rb") as f:
+        return freeze(parse_json_bytes(f.read()))
+
+
+def _refresh_file(files, path, key):
+    """
+    Return the cached (value, error) for `path`, re-parsing it only if its
+    stat key changed. Updates `files` in place; returns (value, error, changed).
+    """
+    cached = files.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2], False
+
+    if key is None:
+        value, error = None, None
+    else:
+        try:
+            value, error = _parse_json(path), None
+        except Exception as e:
+            value, error = None, str(e)
+    files[path] = (key, value, error, None)
+    return value, error, True
+
+
+def _list_manifests(manifests_dir, previous):
+    """
+    List manifests/*.json. The listing is reused while the directory's own
+    stat key is unchanged (adds, removes and renames all touch it).
+    """
+    dir_key = stat_key(manifests_dir)
+    if dir_key is None:
+        return None, ()
+    if previous is not None and previous[0] == dir_key:
+        return previous
+
+    paths = tuple(sorted(
+        entry.path for entry in os.scandir(manifests_dir)
+        if entry.name.endswith(".json") and entry.is_file()
+    ))
+    return dir_key, paths
+
+
+def _project_conformance(projects):
+    """
+    schema.Conformance per flagship project, aligned with build_projects.
+    Reused while projects.json is the same frozen object, i.e. unchanged.
+    """
+    cached_for, results = _state['project_conformance']
+    if projects is cached_for:
+        return results
+    entries = projects.get('flagship_projects', ()) if isinstance(projects, MappingProxyType) else ()
+    if not isinstance(entries, tuple):
+        entries = ()
+    results = tuple(schema.validate('project', p) for p in entries if isinstance(p, MappingProxyType))
+    _state['project_conformance'] = (projects, results)
+    return results
+
+
+# ========== SNAPSHOT ==========
+
+def sweep():
+    """
+    Stat every input and publish a new snapshot if anything changed.
+    Returns the current snapshot.
+    """
+    with _lock:
+        epoch = watcher.data_epoch()
+        files = _state['files']
+        previous = _state['snapshot']
+        changed = False
+
+        # Single files
+        singles = {}
+        for name in SINGLE_FILES:
+            path = str(PATHS[name])
+            value, error, file_changed = _refresh_file(files, path, stat_key(path))
+            singles[name] = (path, value, error)
+            changed = changed or file_changed
+
+        # Manifest directory
+        listing = _list_manifests(str(PATHS['manifests_dir']), _state['manifest_dir'])
+        if listing != _state['manifest_dir']:
+            changed = True
+        _state['manifest_dir'] = listing
+
+        # Manifests: changed files are parsed in parallel, each failure isolated to its file
+        live = {singles[name][0] for name in singles}
+        todo = []
+        for path in listing[1]:
+            live.add(path)
+            key = stat_key(path)
+            cached = files.get(path)
+            if cached is None or cached[0] != key:
+                todo.append((path, key))
+        parsed, stats = parse_many(path for path, key in todo if key is not None)
+        for path, key in todo:
+            value, issue, digest = parsed.get(path, (None, None, None))
+            files[path] = (key, freeze(value), issue, digest)
+        changed = changed or bool(todo)
+
+        entries = []
+        for path in listing[1]:
+            _, value, issue, digest = files[path]
+            if isinstance(issue, str):  # seeded from the compiled snapshot
+                issue = ManifestIssue(os.path.basename(path), 'parse', issue)
+            entries.append((path, value, issue, digest))
+
+        # Forget files that disappeared from the directory
+        for path in list(files):
+            if path not in live:
+                del files[path]
+
+        _state['last_sweep'] = time.monotonic()
+        _state['swept_epoch'] = epoch
+
+        if not changed and previous is not EMPTY:
+            return previous
+
+        projects = singles['projects_file'][1]
+        manifests, manifest_conformance, manifest_report = assemble(entries, stats, parsed=len(parsed))
+        manifest_models = build_manifests(manifests, manifest_conformance)
+        if projects is previous.projects and previous is not EMPTY:
+            project_models, project_facets = previous.project_models, previous.project_facets
+        else:
+            project_models = build_projects(projects, _project_conformance(projects))
+            project_facets = facet_index.project_index(project_models)
+        snapshot = Snapshot(
+            version=previous.version + 1,
+            created_at=time.time(),
+            projects=projects,
+            manifests=manifests,
+            nyquist_status=singles['nyquist_status'][1] or EMPTY_MAPPING,
+            publication_status=singles['publication_status'][1] or EMPTY_MAPPING,
+            manifest_report=manifest_report,
+            file_errors=MappingProxyType({name: error for name, (_, _, error) in singles.items() if error}),
+            manifest_models=manifest_models,
+            project_models=project_models,
+            manifest_facets=facet_index.manifest_index(manifest_models),
+            project_facets=project_facets,
+        )
+        _state['snapshot'] = snapshot
+        return snapshot
+
+
+def get_snapshot(max_age=0.0):
+    """
+    Return the current snapshot, sweeping first unless the last sweep is
+    younger than `max_age` seconds. A small `max_age` lets every loader in a
+    single rerun share one sweep. While the watcher is running the sweep is
+    skipped entirely until its data epoch changes.
+    """
+    if _state['snapshot'] is not EMPTY and watcher.is_running():
+        if _state['swept_epoch'] == watcher.data_epoch():
+            return _state['snapshot']
+    if max_age and _state['snapshot'] is not EMPTY:
+        if time.monotonic() - _state['last_sweep'] < max_age:
+            return _state['snapshot']
+    return sweep()
+
+
+def current_snapshot():
+    """Return the last published snapshot without touching the filesystem."""
+    return _state['snapshot']
+
+
+def input_paths():
+    """
+    Return (single_file_paths, manifest_paths): every file a sweep reads.
+    Single files are keyed by their PATHS name.
+    """
+    singles = {name: str(PATHS[name]) for name in SINGLE_FILES}
+    listing = _list_manifests(str(PATHS['manifests_dir']), None)
+    return singles, listing[1]
+
+
+def seed(entries):
+    """
+    Pre-fill the per-file parse cache with already-decoded values, e.g. from
+    the compiled snapshot. `entries` maps path -> (stat_key, value, error,
+    digest), `digest` being the hex digest of the file's bytes.
+    Only paths not yet cached are taken; the next sweep then finds matching
+    stat keys and publishes a snapshot without decoding any JSON.
+    """
+    with _lock:
+        files = _state['files']
+        for path, (key, value, error, digest) in entries.items():
+            if path not in files:
+                files[path] = (key, freeze(value), error, digest)
+
+
+# Rebuild the snapshot on the watcher thread so no session pays for it
+watcher.subscribe(lambda epoch: sweep())
@@ -0,0 +1,149 @@
+"""
+PAN HANDLERS DASHBOARD — FACET INDEX
+
+Inverted index from facet values (status, track, owner, tag) to the
+records that carry them, built once per data_layer snapshot and stored on
+it (`snapshot.project_facets`, `snapshot.manifest_facets`).
+
+Each (facet, value) posting is a bitset — a Python int with bit i set for
+record i — and its size is counted once at build time, so the dropdowns and
+metric boxes read precomputed counts. A combined filter is a single `&` of
+a few bitsets. Only the matching bits are walked to fetch records, and the
+record tuple for a filter is memoised, so a rerun with unchanged filters
+costs one dict lookup.
+
+Usage:
+    index = snapshot.project_facets
+    index.count('status', 'Active'), index.counts('track')   # {'Core': 4, ...}
+    bits = index.select(status='Active', track='Core')
+    index.records(bits)                                       # tuple of models.Project
+"""
+
+import threading
+from types import MappingProxyType
+
+MAX_SELECTIONS = 128
+
+# facet name -> function returning the record's values for that facet
+PROJECT_FACETS = {
+    'status': lambda p: (p.status,),
+    'track': lambda p: (p.stats_track,),
+    'owner': lambda p: (p.owner,),
+}
+MANIFEST_FACETS = {
+    'status': lambda m: (m.status,),
+    'owner': lambda m: (m.owner,),
+    'tag': lambda m: m.tags,
+}
+
+
+def iter_bits(bits):
+    """Positions of the set bits of `bits`, ascending."""
+    # One C-level conversion, then str.find skips straight to the next match
+    digits = bin(bits)[:1:-1]
+    find = digits.find
+    i = find("1")
+    while i != -1:
+        yield i
+        i = find("1", i + 1)
+
+
+class FacetIndex:
+    """Bitset postings and counts for a fixed sequence of records."""
+    __slots__ = ('items', 'all', '_postings', '_counts', '_lock', '_selections')
+
+    def __init__(self, items, facets):
+        self.items = tuple(items)
+        self.all = (1 << len(self.items)) - 1
+        postings = {name: {} for name in facets}
+        for i, item in enumerate(self.items):
+            bit = 1 << i
+            for name, values_of in facets.items():
+                posting = postings[name]
+                for value in values_of(item):
+                    posting[value] = posting.get(value, 0) | bit
+        self._postings = MappingProxyType(postings)
+        self._counts = MappingProxyType({
+            name: MappingProxyType(dict(sorted(
+                ((value, bits.bit_count()) for value, bits in posting.items()),
+                key=lambda pair: (-pair[1], str(pair[0]).casefold()),
+            )))
+            for name, posting in postings.items()
+        })
+        self._lock = threading.Lock()
+        self._selections = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    # --- counts ---
+    def counts(self, facet):
+        """{value: records}, most common first."""
+        return self._counts[facet]
+
+    def count(self, facet, *values):
+        """Records carrying any of `values` for `facet`."""
+        if len(values) == 1:
+            return self._counts[facet].get(values[0], 0)
+        return self.any(facet, *values).bit_count()
+
+    def values(self, facet):
+        """Facet values, most common first."""
+        return tuple(self._counts[facet])
+
+    # --- bitsets ---
+    def any(self, facet, *values):
+        """Bitset of records carrying any of `values`."""
+        posting = self._postings[facet]
+        bits = 0
+        for value in values:
+            bits |= posting.get(value, 0)
+        return bits
+
+    def select(self, **filters):
+        """
+        Bitset of records matching every filter; a filter value of None
+        (or "All") leaves that facet unconstrained.
+        """
+        bits = self.all
+        for facet, value in filters.items():
+            if value is None or value == "All":
+                continue
+            bits &= self._postings[facet].get(value, 0)
+            if not bits:
+                break
+        return bits
+
+    def counts_within(self, facet, bits):
+        """{value: records} restricted to `bits` (e.g. track counts under a status filter)."""
+        if bits == self.all:
+            return self._counts[facet]
+        return {value: n for value, posting in self._postings[facet].items() if (n := (posting & bits).bit_count())}
+
+    # --- records ---
+    def records(self, bits):
+        """Records in `bits`, in index order (memoised per bitset)."""
+        if bits == self.all:
+            return self.items
+        cached = self._selections.get(bits)
+        if cached is not None:
+            return cached
+        items = self.items
+        result = tuple(items[i] for i in iter_bits(bits))
+        with self._lock:
+            if len(self._selections) >= MAX_SELECTIONS:
+                self._selections.clear()
+            self._selections[bits] = result
+        return result
+
+
+EMPTY_PROJECTS = FacetIndex((), PROJECT_FACETS)
+EMPTY_MANIFESTS = FacetIndex((), MANIFEST_FACETS)
+
+
+def project_index(project_models):
+    return FacetIndex(project_models, PROJECT_FACETS) if project_models else EMPTY_PROJECTS
+
+
+def manifest_index(manifest_models):
+    return FacetIndex(manifest_models, MANIFEST_FACETS) if manifest_models else EMPTY_MANIFESTS
@@ -0,0 +1,79 @@
+"""
+PAN HANDLERS DASHBOARD — RENDER FRAGMENT CACHE
+
+Process-wide cache of finished HTML for cards, tiles and other repeated
+fragments. Keys are (kind, entity fingerprint, theme, variant), so an
+unchanged card on an unchanged snapshot is never formatted twice. The whole
+cache is dropped when the data_layer snapshot version moves.
+
+`emit()` renders a finished fragment and reports its size to perf, so the
+rerun trace counts the HTML the dashboard sends.
+
+Usage:
+    from fragments import cached, emit
+    emit(cached(('repo_card', manifest.fingerprint, theme, False),
+                lambda: _repo_card_html(manifest)))
+"""
+
+import threading
+
+import streamlit as st
+
+from data_layer import current_snapshot
+import perf
+
+MAX_FRAGMENTS = 20_000  # safety valve; a snapshot never needs more than a few per entity
+
+_lock = threading.Lock()
+_state = {
+    'version': None,    # snapshot version the cached fragments belong to
+    'fragments': {},
+    'hits': 0,
+    'misses': 0,
+}
+
+
+def cached(key, render):
+    """Return the cached HTML for `key`, calling `render()` on a miss."""
+    version = current_snapshot().version
+    if _state['version'] != version:
+        with _lock:
+            if _state['version'] != version:
+                _state['fragments'] = {}
+                _state['version'] = version
+
+    fragments = _state['fragments']
+    html = fragments.get(key)
+    if html is not None:
+        _state['hits'] += 1
+        perf.note_cache(True)
+        return html
+
+    _state['misses'] += 1
+    perf.note_cache(False)
+    html = render()
+    if len(fragments) < MAX_FRAGMENTS:
+        fragments[key] = html
+    return html
+
+
+def emit(html):
+    """Render an HTML fragment with st.markdown, counting its bytes towards the open perf spans."""
+    perf.count_bytes(len(html))
+    st.markdown(html, unsafe_allow_html=True)
+
+
+def stats():
+    """Hit/miss counters and the current fragment count."""
+    return {
+        'version': _state['version'],
+        'fragments': len(_state['fragments']),
+        'hits': _state['hits'],
+        'misses': _state['misses'],
+    }
+
+
+def clear():
+    with _lock:
+        _state['fragments'] = {}
+        _state['version'] = None
@@ -0,0 +1,330 @@
+"""
+PAN HANDLERS DASHBOARD — GIT METADATA
+
+Reads branch, HEAD commit and commit time straight from the .git directory
+so the sidebar never has to spawn a `git` process on a rerun.
+
+Usage:
+    from git_info import get_git_info
+    info = get_git_info()
+    st.caption(f"📂 Branch: `{info.branch}` @ `{info.short_sha}`")
+"""
+
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from config import PATHS
+
+
+class GitInfo(NamedTuple):
+    """Snapshot of the checked-out commit."""
+    branch: str
+    sha: Optional[str]
+    short_sha: Optional[str]
+    commit_time: Optional[datetime]
+
+
+UNKNOWN = GitInfo(branch="unknown", sha=None, short_sha=None, commit_time=None)
+
+# Pack object types (see gitformat-pack)
+_OBJ_COMMIT = 1
+_OBJ_OFS_DELTA = 6
+_OBJ_REF_DELTA = 7
+
+_lock = threading.Lock()
+_cache = {'key': None, 'info': UNKNOWN}
+
+
+# ========== REPOSITORY DISCOVERY ==========
+
+def find_git_dirs(start=None):
+    """
+    Walk up from `start` to the enclosing repository.
+    Returns (git_dir, common_dir) or (None, None). Handles worktrees and
+    submodules, where `.git` is a file pointing at the real directory.
+    """
+    start = Path(start or PATHS['pan_handlers_root']).resolve()
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if not content.startswith("gitdir:"):
+                continue
+            git_dir = (candidate / content[len("gitdir:"):].strip()).resolve()
+        else:
+            continue
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+        return git_dir, common_dir
+    return None, None
+
+
+# ========== REFS ==========
+
+def _read_head(git_dir):
+    """Return (ref_name, sha). One of the two is None."""
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if head.startswith("ref:"):
+        return head[len("ref:"):].strip(), None
+    return None, head
+
+
+def _resolve_ref(git_dir, common_dir, ref_name):
+    """Resolve a ref through the loose ref file, then packed-refs."""
+    for base in (git_dir, common_dir):
+        loose = base / ref_name
+        if loose.is_file():
+            value = loose.read_text(encoding="utf-8").strip()
+            if value.startswith("ref:"):
+                return _resolve_ref(git_dir, common_dir, value[len("ref:"):].strip())
+            return value
+
+    packed = common_dir / "packed-refs"
+    if packed.is_file():
+        with open(packed, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref_name:
+                    return parts[0]
+    return None
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# ========== OBJECTS ==========
+
+def _read_loose_object(common_dir, sha):
+    """Return (type_name, body) for a loose object, or None."""
+    path = common_dir / "objects" / sha[:2] / sha[2:]
+    if not path.is_file():
+        return None
+    raw = zlib.decompress(path.read_bytes())
+    header, _, body = raw.partition(b"\x00")
+    return header.split(b" ")[0].decode("ascii"), body
+
+
+def _find_in_pack_index(idx_path, sha_bytes):
+    """Look up an object offset in a version 2 pack index."""
+    with open(idx_path, "rb") as f:
+        data = f.read()
+    if data[:4] != b"\xfftOc" or struct.unpack(">I", data[4:8])[0] != 2:
+        return None
+
+    fanout = struct.unpack(">256I", data[8:8 + 1024])
+    total = fanout[255]
+    lo = fanout[sha_bytes[0] - 1] if sha_bytes[0] else 0
+    hi = fanout[sha_bytes[0]]
+    names_start = 8 + 1024
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        entry = data[names_start + mid * 20:names_start + (mid + 1) * 20]
+        if entry < sha_bytes:
+            lo = mid + 1
+        elif entry > sha_bytes:
+            hi = mid
+        else:
+            offsets_start = names_start + total * 20 + total * 4
+            offset = struct.unpack(">I", data[offsets_start + mid * 4:offsets_start + mid * 4 + 4])[0]
+            if offset & 0x80000000:
+                large_start = offsets_start + total * 4
+                index = offset & 0x7fffffff
+                offset = struct.unpack(">Q", data[large_start + index * 8:large_start + index * 8 + 8])[0]
+            return offset
+    return None
+
+
+def _apply_delta(base, delta):
+    """Apply a git delta instruction stream to `base`."""
+    def read_varint(pos):
+        value = shift = 0
+        while True:
+            byte = delta[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value, pos
+
+    _, pos = read_varint(0)  # base size
+    _, pos = read_varint(pos)  # result size
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            offset = size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (1 << (4 + i)):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[offset:offset + (size or 0x10000)]
+        else:
+            out += delta[pos:pos + op]
+            pos += op
+    return bytes(out)
+
+
+def _read_pack_entry(pack, offset, common_dir):
+    """Return (type_code, body) for the pack entry at `offset`."""
+    pack.seek(offset)
+    header = pack.read(32)
+    byte = header[0]
+    obj_type = (byte >> 4) & 0x7
+    pos = 1
+    while byte & 0x80:
+        byte = header[pos]
+        pos += 1
+
+    base_ref = None
+    base_offset = None
+    if obj_type == _OBJ_OFS_DELTA:
+        byte = header[pos]
+        pos += 1
+        rel = byte & 0x7f
+        while byte & 0x80:
+            byte = header[pos]
+            pos += 1
+            rel = ((rel + 1) << 7) | (byte & 0x7f)
+        base_offset = offset - rel
+    elif obj_type == _OBJ_REF_DELTA:
+        base_ref = header[pos:pos + 20].hex()
+        pos += 20
+
+    pack.seek(offset + pos)
+    decompressor = zlib.decompressobj()
+    body = b""
+    while not decompressor.eof:
+        chunk = pack.read(4096)
+        if not chunk:
+            break
+        body += decompressor.decompress(chunk)
+
+    if base_offset is not None:
+        base_type, base_body = _read_pack_entry(pack, base_offset, common_dir)
+        return base_type, _apply_delta(base_body, body)
+    if base_ref is not None:
+        base = _read_object(common_dir, base_ref)
+        if base is None:
+            return None, b""
+        return _OBJ_COMMIT if base[0] == "commit" else None, _apply_delta(base[1], body)
+    return obj_type, body
+
+
+def _read_packed_object(common_dir, sha):
+    pack_dir = common_dir / "objects" / "pack"
+    if not pack_dir.is_dir():
+        return None
+    sha_bytes = bytes.fromhex(sha)
+    for idx_path in pack_dir.glob("*.idx"):
+        offset = _find_in_pack_index(idx_path, sha_bytes)
+        if offset is None:
+            continue
+        with open(idx_path.with_suffix(".pack"), "rb") as pack:
+            obj_type, body = _read_pack_entry(pack, offset, common_dir)
+        return ("commit" if obj_type == _OBJ_COMMIT else "other"), body
+    return None
+
+
+def _read_object(common_dir, sha):
+    return _read_loose_object(common_dir, sha) or _read_packed_object(common_dir, sha)
+
+
+def _parse_commit_time(body):
+    """Extract the committer timestamp from a raw commit object."""
+    for line in body.split(b"\n"):
+        if not line:
+            break
+        if line.startswith(b"committer "):
+            parts = line.rsplit(b" ", 2)
+            seconds = int(parts[1])
+            tz = parts[2].decode("ascii")
+            sign = -1 if tz.startswith("-") else 1
+            offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5])) * sign
+            return datetime.fromtimestamp(seconds, timezone(offset))
+    return None
+
+
+# ========== PUBLIC API ==========
+
+def read_git_info(start=None):
+    """Read git metadata from disk without any caching."""
+    git_dir, common_dir = find_git_dirs(start)
+    if git_dir is None:
+        return UNKNOWN
+
+    ref_name, sha = _read_head(git_dir)
+    if ref_name:
+        branch = ref_name[len("refs/heads/"):] if ref_name.startswith("refs/heads/") else ref_name
+        sha = _resolve_ref(git_dir, common_dir, ref_name)
+    else:
+        branch = "HEAD"  # detached, matches `git rev-parse --abbrev-ref HEAD`
+
+    commit_time = None
+    if sha:
+        obj = _read_object(common_dir, sha)
+        if obj and obj[0] == "commit":
+            commit_time = _parse_commit_time(obj[1])
+
+    return GitInfo(
+        branch=branch,
+        sha=sha,
+        short_sha=sha[:7] if sha else None,
+        commit_time=commit_time,
+    )
+
+
+def get_git_info(start=None):
+    """
+    Return cached git metadata.
+
+    The cache key is the mtime of HEAD plus the mtime of the ref it points
+    at (loose file and packed-refs), so a checkout or a new commit is picked
+    up on the next call at the cost of a few stat calls.
+    """
+    try:
+        git_dir, common_dir = find_git_dirs(start)
+        if git_dir is None:
+            return UNKNOWN
+
+        ref_name, _ = _read_head(git_dir)
+        key = (
+            str(git_dir),
+            _mtime(git_dir / "HEAD"),
+            _mtime(git_dir / ref_name) if ref_name else None,
+            _mtime(common_dir / ref_name) if ref_name else None,
+            _mtime(common_dir / "packed-refs"),
+        )
+
+        with _lock:
+            if _cache['key'] == key:
+                return _cache['info']
+
+        info = read_git_info(start)
+        with _lock:
+            _cache['key'] = key
+            _cache['info'] = info
+        return info
+    except Exception:
+        return UNKNOWN
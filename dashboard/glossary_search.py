@@ -0,0 +1,285 @@
+"""
+PAN HANDLERS DASHBOARD — GLOSSARY SEARCH
+
+Search engine over every glossary the federation keeps: the Grand Hall's
+in-code GLOSSARY plus the markdown lexicons in PATHS['glossary_md'] and
+PATHS['glossary_sync_out'], as parsed by glossary_store.
+
+One GlossaryEngine is built per glossary version (each new Glossary
+object from the store) and shared by every session:
+
+- Terms, definitions, categories and related terms are normalised
+  (casefolded, accents stripped) and tokenised into an inverted index,
+  token -> {entry: field weight}, so a term-name hit outranks a mention in
+  a definition.
+- The vocabulary is sorted and loaded into a prefix trie whose nodes carry
+  the [lo, hi) slice of vocabulary below them. The last query token (and
+  any token with no exact match) is matched as a prefix (as-you-type) by
+  one walk down the trie.
+- A query token with no exact or prefix match is looked up fuzzily: the
+  subtree under its first letter is walked with an edit-distance row per
+  node (adjacent transpositions count as one edit), and branches that can
+  no longer come within SETTINGS['glossary_fuzzy_edits'] edits are pruned.
+- An entry must match every query token. Entries are ranked by summed
+  field weight times match quality, with a bonus when the term itself
+  equals or starts with the query. Only the best
+  SETTINGS['glossary_max_results'] are sorted, and they are cached per
+  (query, categories), so a rerun with the same search box content is one
+  dict lookup.
+
+Usage:
+    from glossary_search import get_engine
+    engine = get_engine(GLOSSARY)
+    for hit in engine.search("omeg nov"):
+        hit.entry.term, hit.entry.category, hit.score     # entry is a glossary_store.GlossaryTerm
+"""
+
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+from typing import NamedTuple
+
+from config import SETTINGS
+from glossary_store import GlossaryTerm, get_glossary
+
+# Field weights in the inverted index
+TERM_WEIGHT = 3.0
+RELATED_WEIGHT = 1.5
+CATEGORY_WEIGHT = 1.0
+DEFINITION_WEIGHT = 1.0
+
+# Match quality multipliers
+PREFIX_QUALITY = 0.6        # plus up to 0.4 for how much of the token the prefix covers
+FUZZY_QUALITY = 0.7         # minus 0.2 per edit
+
+
+class Hit(NamedTuple):
+    entry: GlossaryTerm
+    score: float
+
+
+# ========== NORMALISATION ==========
+
+_TOKEN = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Casefold and strip accents (NFKD also turns '²' into '2')."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    return _TOKEN.findall(normalize(text))
+
+
+# ========== PREFIX TRIE ==========
+
+class _Trie:
+    """
+    Trie over a sorted vocabulary. Each node is [children, lo, hi]: the
+    words below it are vocab[lo:hi], so a prefix lookup is one walk down.
+    """
+    __slots__ = ('root', 'vocab')
+
+    def __init__(self, vocab):
+        self.vocab = vocab
+        self.root = [{}, 0, len(vocab)]
+        for i, word in enumerate(vocab):
+            node = self.root
+            for ch in word:
+                child = node[0].get(ch)
+                if child is None:
+                    child = node[0][ch] = [{}, i, i + 1]
+                else:
+                    child[2] = i + 1
+                node = child
+
+    def prefix(self, prefix):
+        """Words starting with `prefix`."""
+        node = self.root
+        for ch in prefix:
+            node = node[0].get(ch)
+            if node is None:
+                return ()
+        return self.vocab[node[1]:node[2]]
+
+    def fuzzy(self, word, max_edits):
+        """
+        [(vocab word, edits)] within `max_edits` edits of `word` (optimal
+        string alignment: insert, delete, substitute, swap neighbours).
+        Only words sharing `word`'s first letter are considered.
+        """
+        start = self.root[0].get(word[:1])
+        if start is None:
+            return []
+        vocab, matches = self.vocab, []
+        columns = range(1, len(word) + 1)
+
+        def next_row(ch, depth, previous, before, previous_ch):
+            row = [depth]
+            for j in columns:
+                cost = min(row[j - 1] + 1, previous[j] + 1, previous[j - 1] + (word[j - 1] != ch))
+                if j > 1 and ch == word[j - 2] and previous_ch == word[j - 1]:
+                    cost = min(cost, before[j - 2] + 1)
+                row.append(cost)
+            return row
+
+        stack = [(start, word[0], 1, list(range(len(word) + 1)), None, None)]
+        while stack:
+            node, ch, depth, previous, before, previous_ch = stack.pop()
+            row = next_row(ch, depth, previous, before, previous_ch)
+            if row[-1] <= max_edits and len(vocab[node[1]]) == depth:
+                matches.append((vocab[node[1]], row[-1]))
+            if min(row) <= max_edits:
+                stack.extend((child, next_ch, depth + 1, row, previous, ch) for next_ch, child in node[0].items())
+        return matches
+
+
+# ========== ENGINE ==========
+
+class GlossaryEngine:
+    """Inverted index + prefix trie over one version of the glossary entries."""
+
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+        postings = {}
+        for i, entry in enumerate(self.entries):
+            fields = (
+                (entry.term, TERM_WEIGHT),
+                (" ".join(entry.related), RELATED_WEIGHT),
+                (entry.category, CATEGORY_WEIGHT),
+                (entry.definition, DEFINITION_WEIGHT),
+            )
+            for text, weight in fields:
+                for token in tokenize(text):
+                    posting = postings.setdefault(token, {})
+                    if posting.get(i, 0.0) < weight:
+                        posting[i] = weight
+        self._postings = postings
+        self._trie = _Trie(sorted(postings))
+        self._terms = tuple(normalize(entry.term) for entry in self.entries)
+        self._term_order = sorted((term, i) for i, term in enumerate(self._terms))
+        self._categories = tuple(entry.category for entry in self.entries)
+        self._lock = threading.Lock()
+        self._results = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _candidates(self, token, last):
+        """{vocab word: match quality} for one query token."""
+        matches = {}
+        if token in self._postings:
+            matches[token] = 1.0
+        if last or not matches:
+            for word in self._trie.prefix(token):
+                if word != token:
+                    matches[word] = PREFIX_QUALITY + (1 - PREFIX_QUALITY) * len(token) / len(word)
+        if not matches:
+            edits = SETTINGS['glossary_fuzzy_edits'] if len(token) >= 8 else min(1, SETTINGS['glossary_fuzzy_edits'])
+            for word, distance in self._trie.fuzzy(token, edits):
+                matches[word] = FUZZY_QUALITY - 0.2 * distance
+        return matches
+
+    def _token_scores(self, token, last):
+        """{entry: best weight x quality} over every vocabulary match of one query token."""
+        postings = self._postings
+        candidates = self._candidates(token, last)
+        if len(candidates) == 1:
+            (word, quality), = candidates.items()
+            posting = postings[word]
+            return posting if quality == 1.0 else {doc: weight * quality for doc, weight in posting.items()}
+        scores = {}
+        for word, quality in candidates.items():
+            for doc, weight in postings[word].items():
+                score = weight * quality
+                if scores.get(doc, 0.0) < score:
+                    scores[doc] = score
+        return scores
+
+    def _rank(self, tokens, categories, limit):
+        per_token = []
+        for n, token in enumerate(tokens):
+            scores = self._token_scores(token, last=n == len(tokens) - 1)
+            if not scores:
+                return ()
+            per_token.append(scores)
+
+        # Intersect starting from the rarest token, summing as we go
+        per_token.sort(key=len)
+        scores, rest = per_token[0], per_token[1:]
+        if rest or categories is not None:
+            category_of = self._categories
+            scores = {
+                doc: score + sum(other[doc] for other in rest)
+                for doc, score in scores.items()
+                if all(doc in other for other in rest)
+                and (categories is None or category_of[doc] in categories)
+            }
+            if not scores:
+                return ()
+        else:
+            scores = dict(scores)
+
+        # Term-name bonuses: terms equal to / starting with the query are one bisect away
+        needle = " ".join(tokens)
+        order, terms = self._term_order, self._terms
+        i = bisect.bisect_left(order, (needle,))
+        while i < len(order) and order[i][0].startswith(needle):
+            term, doc = order[i]
+            if doc in scores:
+                scores[doc] += 5.0 if term == needle else 2.0
+            i += 1
+
+        # Top `limit` by score; ties broken by shorter, then alphabetical, term
+        if len(scores) > limit:
+            floor = heapq.nlargest(limit, scores.values())[-1]
+            ranked = [doc for doc, score in scores.items() if score >= floor]
+        else:
+            ranked = list(scores)
+        ranked.sort(key=lambda doc: (-scores[doc], len(terms[doc]), terms[doc]))
+        return tuple(Hit(self.entries[doc], round(scores[doc], 3)) for doc in ranked[:limit])
+
+    def search(self, query, limit=None, categories=None):
+        """Ranked Hits for `query`, best first, optionally restricted to `categories`."""
+        tokens = tuple(tokenize(query))
+        if not tokens:
+            return ()
+        limit = SETTINGS['glossary_max_results'] if limit is None else limit
+        categories = frozenset(categories) if categories is not None else None
+        key = (tokens, categories, limit)
+        hits = self._results.get(key)
+        if hits is None:
+            hits = self._rank(tokens, categories, limit)
+            with self._lock:
+                if len(self._results) >= SETTINGS['glossary_query_cache']:
+                    self._results.clear()
+                self._results[key] = hits
+        return hits
+
+
+# ========== VERSIONED INSTANCE ==========
+
+_lock = threading.Lock()
+_state = {
+    'glossary': None,   # the glossary_store.Glossary the engine was built from
+    'engine': None,
+}
+
+
+def get_engine(builtin=None):
+    """
+    Engine over glossary_store.get_glossary(builtin); rebuilt only when the
+    store hands out a new Glossary (the dict or a markdown file changed).
+    """
+    glossary = get_glossary(builtin)
+    if _state['glossary'] is glossary:
+        return _state['engine']
+    with _lock:
+        if _state['glossary'] is not glossary:
+            _state['engine'] = GlossaryEngine(glossary.terms)
+            _state['glossary'] = glossary
+        return _state['engine']
@@ -0,0 +1,262 @@
+"""
+PAN HANDLERS DASHBOARD — GLOSSARY STORE
+
+Structured glossary terms (category, term, definition, related terms)
+from every glossary source: the markdown lexicons in PATHS['glossary_md']
+and PATHS['glossary_sync_out'], plus an in-code dict such as the Grand
+Hall's GLOSSARY. Every glossary view (the Grand Hall page, glossary_search)
+reads the same Glossary object.
+
+Each markdown file is parsed only when its content changes. A call stats
+both files; a file whose (mtime, size, inode) is unchanged is not read. A
+file whose stat changed is read and hashed, and re-parsed only if the hash
+differs too (a touch or a checkout that rewrites identical bytes costs one
+read). Parsed terms are persisted to PATHS['glossary_store'] with their
+stat key and hash, so a restarted worker parses nothing. While no source
+changed, the same Glossary object is returned, and it can key downstream
+caches by identity.
+
+Markdown layouts understood:
+    ## 1. Category                      ('## ' headings name the category)
+    ### Term                            (followed by definition paragraphs)
+    - **Term** — definition             (indented lines continue it)
+    Related: A, B / See also: A, B      (explicit related terms)
+Bold phrases inside a definition are also recorded as related terms.
+
+Usage:
+    from glossary_store import get_glossary
+    glossary = get_glossary(GLOSSARY)
+    for term in glossary.by_category['Core Concepts']:
+        term.term, term.definition, term.related
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from types import MappingProxyType
+from typing import NamedTuple
+
+from config import PATHS
+from data_layer import stat_key
+
+STORE_FORMAT = 1
+MARKDOWN_SOURCES = ('glossary_md', 'glossary_sync_out')
+BUILTIN = 'builtin'
+
+
+class GlossaryTerm(NamedTuple):
+    """One glossary entry."""
+    term: str
+    definition: str         # markdown
+    category: str
+    related: tuple          # related term names
+    source: str             # BUILTIN or a PATHS key
+
+
+class Glossary(NamedTuple):
+    """Every term from every source; replaced as a whole when any source changes."""
+    terms: tuple                    # GlossaryTerm, in source order
+    by_category: MappingProxyType   # category -> tuple of GlossaryTerm, categories in first-seen order
+    sources: MappingProxyType       # source -> number of terms
+    digests: tuple                  # per markdown source content hash (None when missing)
+
+
+EMPTY = Glossary(terms=(), by_category=MappingProxyType({}), sources=MappingProxyType({}), digests=())
+
+_lock = threading.Lock()
+_state = {
+    'files': {},        # path -> {'key': stat key, 'digest': hex, 'terms': tuple of GlossaryTerm}
+    'loaded': False,    # persisted store read from disk
+    'glossary': EMPTY,
+    'version': None,    # (id of the builtin dict, digests) the glossary was assembled from
+}
+
+
+# ========== PARSING ==========
+
+_HEADING = re.compile(r"^(#{2,3})\s+(.*?)\s*$")
+_BULLET = re.compile(r"^[-*]\s+\*\*(.+?)\*\*\s*(?:[—–:-]\s*)?(.*)$")
+_SECTION_NUMBER = re.compile(r"^\d+\.\s*")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_RELATED = re.compile(r"^(?:related|see also)\s*:\s*(.+)$", re.IGNORECASE)
+
+
+def _related(term, lines, explicit):
+    """
+    Explicit related terms first, then bold phrases of the definition
+    (minus the term itself and short lowercase emphasis such as **not**).
+    """
+    names = list(explicit)
+    for line in lines:
+        names.extend(
+            phrase for phrase in (match.strip() for match in _BOLD.findall(line))
+            if len(phrase) > 3 or not phrase.islower()
+        )
+    own = term.casefold()
+    return tuple(name for name in dict.fromkeys(names) if name and name.casefold() != own)
+
+
+def parse_markdown(text, source):
+    """GlossaryTerms of one markdown glossary (layouts in the module docstring)."""
+    terms, category, current = [], "", None
+
+    def close():
+        if current is not None:
+            term, lines, explicit = current
+            terms.append(GlossaryTerm(
+                term=term,
+                definition="\n".join(lines).strip(),
+                category=category,
+                related=_related(term, lines, explicit),
+                source=source,
+            ))
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        heading = _HEADING.match(line)
+        if heading:
+            close()
+            current = None
+            if heading.group(1) == "##":
+                category = _SECTION_NUMBER.sub("", heading.group(2))
+            else:
+                current = (heading.group(2), [], [])
+            continue
+        if line.startswith(("---", ">", "# ")) or (line.startswith("_") and line.endswith("_")):
+            close()
+            current = None
+            continue
+        bullet = _BULLET.match(line)
+        if bullet:
+            close()
+            current = (bullet.group(1).strip(), [bullet.group(2)] if bullet.group(2) else [], [])
+            continue
+        if current is None or not line.strip():
+            continue
+        related = _RELATED.match(line.strip())
+        if related:
+            current[2].extend(name.strip(" `*") for name in related.group(1).split(","))
+        else:
+            current[1].append(line.strip())
+    close()
+    return terms
+
+
+def builtin_terms(glossary):
+    """GlossaryTerms of an in-code {category: [{term, definition, related}]} dict."""
+    return [
+        GlossaryTerm(item['term'], item.get('definition', ''), category, tuple(item.get('related', ())), BUILTIN)
+        for category, items in glossary.items()
+        for item in items
+    ]
+
+
+# ========== PERSISTENCE ==========
+
+def _load_persisted():
+    try:
+        with open(PATHS['glossary_store'], "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('format') != STORE_FORMAT:
+        return {}
+    return {
+        path: {
+            'key': tuple(record['key']) if record.get('key') else None,
+            'digest': record.get('digest'),
+            'terms': tuple(GlossaryTerm(t[0], t[1], t[2], tuple(t[3]), t[4]) for t in record.get('terms', ())),
+        }
+        for path, record in data.get('files', {}).items()
+    }
+
+
+def _persist(files):
+    path = PATHS['glossary_store']
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                'format': STORE_FORMAT,
+                'files': {
+                    source: {'key': list(record['key']) if record['key'] else None,
+                             'digest': record['digest'],
+                             'terms': [list(term) for term in record['terms']]}
+                    for source, record in files.items()
+                },
+            }, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[glossary_store] could not persist store: {e}", file=sys.stderr)
+
+
+# ========== STORE ==========
+
+def _refresh_file(files, path, source):
+    """Bring files[path] up to date; returns True if its terms were re-parsed."""
+    key = stat_key(path)
+    record = files.get(path)
+    if record is not None and record['key'] == key:
+        return False
+    if key is None:
+        files[path] = {'key': None, 'digest': None, 'terms': ()}
+        return record is not None and record['digest'] is not None
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        files[path] = {'key': None, 'digest': None, 'terms': ()}
+        return True
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if record is not None and record['digest'] == digest:
+        record['key'] = key     # same bytes, new stat: nothing to parse
+        return False
+    files[path] = {'key': key, 'digest': digest, 'terms': tuple(parse_markdown(data.decode("utf-8", "replace"), source))}
+    return True
+
+
+def _assemble(builtin, files, paths, digests):
+    terms = list(builtin_terms(builtin)) if builtin else []
+    for path in paths:
+        terms.extend(files[path]['terms'])
+    by_category, sources = {}, {}
+    for term in terms:
+        by_category.setdefault(term.category, []).append(term)
+        sources[term.source] = sources.get(term.source, 0) + 1
+    return Glossary(
+        terms=tuple(terms),
+        by_category=MappingProxyType({name: tuple(items) for name, items in by_category.items()}),
+        sources=MappingProxyType(sources),
+        digests=digests,
+    )
+
+
+def get_glossary(builtin=None):
+    """
+    The current Glossary: `builtin` (an in-code glossary dict, optional)
+    followed by every markdown source. Returns the same object until the
+    dict or a source's content changes.
+    """
+    with _lock:
+        files = _state['files']
+        if not _state['loaded']:
+            files.update(_load_persisted())
+            _state['loaded'] = True
+
+        paths = [str(PATHS[name]) for name in MARKDOWN_SOURCES]
+        before = {path: (files.get(path) or {}).get('key') for path in paths}
+        parsed = [_refresh_file(files, path, name) for name, path in zip(MARKDOWN_SOURCES, paths)]
+        if any(parsed) or any(files[path]['key'] != before[path] for path in paths):
+            _persist({path: files[path] for path in paths})
+
+        digests = tuple(files[path]['digest'] for path in paths)
+        version = (id(builtin), digests)
+        if _state['version'] != version:
+            _state['glossary'] = _assemble(builtin, files, paths, digests)
+            _state['version'] = version
+        return _state['glossary']
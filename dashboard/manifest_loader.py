@@ -0,0 +1,208 @@
+"""
+PAN HANDLERS DASHBOARD — PARALLEL MANIFEST LOADER
+
+Parses manifests/*.json for the data layer, in parallel and with every
+failure isolated to its own file.
+
+- Files are parsed on a shared thread pool; when more than
+  SETTINGS['manifest_process_threshold'] files need parsing at once (a cold
+  start over a large federation) on a multi-core machine, they are parsed
+  in batches on a process pool using every core instead, since JSON
+  decoding holds the GIL.
+- A file that cannot be read, is larger than SETTINGS['manifest_max_bytes']
+  or is not valid JSON becomes one ManifestIssue; it is never retried until
+  it changes and never raises into the render. A broken process pool falls
+  back to the thread pool.
+- `assemble()` orders manifests by repo id (then file name), so the
+  order does not depend on the file system or on which worker finished
+  first, validates each one against the manifest schema (schema.py, cached
+  by the raw-bytes digest taken while reading) and adds schema and
+  duplicate-id issues. Everything ends up in one ManifestReport on the
+  snapshot, which Federation Health shows as a single diagnostics panel.
+
+Usage:
+    from manifest_loader import parse_many, assemble
+    parsed, stats = parse_many(paths)                # path -> (value, issue, digest)
+    manifests, conformance, report = assemble([(path, value, issue, digest), ...], stats)
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+from config import SETTINGS
+import schema
+
+
+class ManifestIssue(NamedTuple):
+    """One problem with one manifest file."""
+    file: str           # file name within manifests/
+    kind: str           # 'read', 'parse', 'schema' or 'duplicate'
+    message: str
+
+
+class ManifestReport(NamedTuple):
+    """Diagnostics for one manifest load, kept on the snapshot."""
+    files: int                  # manifest files listed
+    loaded: int                 # manifests in the snapshot
+    parsed: int                 # files (re)parsed by this load
+    mode: str                   # 'cached', 'threads' or 'processes'
+    workers: int
+    seconds: float
+    issues: tuple               # ManifestIssue, ordered by file name
+    conformance: float          # mean schema conformance of the loaded manifests
+
+    @property
+    def has_issues(self):
+        return bool(self.issues)
+
+
+EMPTY_REPORT = ManifestReport(files=0, loaded=0, parsed=0, mode='cached', workers=0, seconds=0.0,
+                              issues=(), conformance=1.0)
+
+_lock = threading.Lock()
+_state = {
+    'threads': None,
+}
+
+
+# ========== PARSING (runs in pool workers) ==========
+
+def content_digest(data):
+    """Hex digest of a manifest's raw bytes (the same hash compiled_snapshot stores)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_file(path, max_bytes):
+    """Return (value, issue, digest) for one file; never raises."""
+    name = os.path.basename(path)
+    try:
+        size = os.path.getsize(path)
+        if size > max_bytes:
+            return None, ManifestIssue(name, 'read', f"{size:,} bytes exceeds the {max_bytes:,} byte limit"), None
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return None, ManifestIssue(name, 'read', e.strerror or str(e)), None
+    digest = content_digest(data)
+    try:
+        return json.loads(data), None, digest
+    except ValueError as e:     # JSONDecodeError and UnicodeDecodeError
+        return None, ManifestIssue(name, 'parse', str(e)), digest
+
+
+def _parse_batch(paths, max_bytes):
+    return [_parse_file(path, max_bytes) for path in paths]
+
+
+# ========== POOLS ==========
+
+_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def _thread_pool():
+    with _lock:
+        if _state['threads'] is None:
+            _state['threads'] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_THREADS, thread_name_prefix="pan-handlers-manifests")
+        return _state['threads']
+
+
+def _parse_threads(paths, max_bytes):
+    if len(paths) == 1:   # the common edit-one-file case: no hand-off
+        return [_parse_file(paths[0], max_bytes)], 1
+    pool = _thread_pool()
+    return list(pool.map(lambda path: _parse_file(path, max_bytes), paths)), _THREADS
+
+
+def _parse_processes(paths, max_bytes):
+    workers = os.cpu_count() or 1
+    batch = max(16, -(-len(paths) // (workers * 4)))
+    chunks = [paths[i:i + batch] for i in range(0, len(paths), batch)]
+    # spawn: the dashboard process has threads running, which fork does not survive safely
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        results = pool.map(_parse_batch, chunks, [max_bytes] * len(chunks))
+        return [result for chunk in results for result in chunk], workers
+
+
+def parse_many(paths):
+    """
+    Parse manifest files. Returns ({path: (value, issue, digest)}, stats) where
+    `stats` is (mode, workers, seconds). Values are plain decoded JSON;
+    the caller freezes them.
+    """
+    started = time.perf_counter()
+    paths = list(paths)
+    if not paths:
+        return {}, ('cached', 0, 0.0)
+
+    max_bytes = SETTINGS['manifest_max_bytes']
+    mode = 'threads'
+    if len(paths) > SETTINGS['manifest_process_threshold'] and (os.cpu_count() or 1) > 1:
+        try:
+            results, workers = _parse_processes(paths, max_bytes)
+            mode = 'processes'
+        except (OSError, RuntimeError, BrokenProcessPool):
+            results, workers = _parse_threads(paths, max_bytes)
+    else:
+        results, workers = _parse_threads(paths, max_bytes)
+
+    return dict(zip(paths, results)), (mode, workers, time.perf_counter() - started)
+
+
+# ========== ASSEMBLY ==========
+
+def _repo_id(value):
+    repo = value.get('repo') if isinstance(value, Mapping) else None
+    return repo if isinstance(repo, str) and repo else None
+
+
+def assemble(entries, stats=('cached', 0, 0.0), parsed=0):
+    """
+    Build the snapshot's manifest tuple, the aligned tuple of
+    schema.Conformance results and the ManifestReport from
+    [(path, value, issue, digest), ...]. Manifests are ordered by repo id,
+    then file name; non-object manifests are left out.
+    """
+    issues, keyed, seen = [], [], {}
+    for path, value, issue, digest in entries:
+        name = os.path.basename(path)
+        if issue is not None:
+            issues.append(issue)
+            continue
+        if value is None:
+            continue
+        result = schema.validate('manifest', value, digest)
+        issues.extend(ManifestIssue(name, 'schema', error) for error in result.errors)
+        if not isinstance(value, Mapping):
+            continue
+        repo = _repo_id(value)
+        if repo is not None:
+            if repo in seen:
+                issues.append(ManifestIssue(name, 'duplicate', f"repo '{repo}' is also declared in {seen[repo]}"))
+            else:
+                seen[repo] = name
+        keyed.append(((repo or "").casefold(), name, value, result))
+
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    conformance = tuple(result for _, _, _, result in keyed)
+    mode, workers, seconds = stats
+    report = ManifestReport(
+        files=len(entries),
+        loaded=len(keyed),
+        parsed=parsed,
+        mode=mode,
+        workers=workers,
+        seconds=round(seconds, 4),
+        issues=tuple(sorted(issues, key=lambda i: (i.file, i.kind))),
+        conformance=round(sum(r.score for r in conformance) / len(conformance), 4) if conformance else 1.0,
+    )
+    return tuple(value for _, _, value, _ in keyed), conformance, report
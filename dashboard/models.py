@@ -0,0 +1,178 @@
+"""
+PAN HANDLERS DASHBOARD — MODELS
+
+Frozen, __slots__-backed views of manifests and flagship projects.
+
+Built once per data_layer snapshot, so pages read plain attributes instead
+of repeating `.get(..., default)` chains in every loop. Fallbacks (display
+name, status, role ...) are resolved at construction and the strings that
+repeat across the federation (status, track, owner, tags) are interned, so
+thousands of records share one copy of each. `conformance` is the record's
+schema.Conformance (score and errors), computed by the data layer.
+`fingerprint` is a blake2b digest of the displayed fields and keys the
+render-fragment cache.
+
+Usage:
+    from models import build_manifests
+    for manifest in build_manifests(snapshot.manifests):
+        manifest.display_name, manifest.status, manifest.tags
+"""
+
+import hashlib
+import sys
+from collections.abc import Mapping
+
+from schema import Conformance
+
+UNCHECKED = Conformance(score=1.0, checks=0, errors=())
+
+
+def _text(value, default=""):
+    """Return `value` if it is a non-empty string, else `default`."""
+    return value if isinstance(value, str) and value else default
+
+
+def _fingerprint(fields):
+    """Content digest of a record's displayed fields (strings, tuples of strings, numbers)."""
+    return hashlib.blake2b(repr(fields).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _interned(value, default=""):
+    return sys.intern(_text(value, default))
+
+
+def _strings(values, intern=False):
+    """Tuple of the string entries of a JSON list (anything else is dropped)."""
+    if not isinstance(values, (list, tuple)):
+        return ()
+    if intern:
+        return tuple(sys.intern(v) for v in values if isinstance(v, str))
+    return tuple(v for v in values if isinstance(v, str))
+
+
+class _Frozen:
+    """Base for immutable slotted records."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.key!r})"
+
+
+# ========== MANIFEST ==========
+
+class Manifest(_Frozen):
+    """One repository manifest (manifests/*.json)."""
+    __slots__ = (
+        'repo', 'display_name', 'status', 'role', 'owner', 'summary', 'brief',
+        'tags', 'url_repo', 'url_dashboard', 'has_repo_url',
+        'spec_location', 'dashboard_location', 'tier', 'last_updated', 'raw',
+        'conformance', 'fingerprint',
+    )
+
+    def __init__(self, data, conformance=UNCHECKED):
+        init = object.__setattr__
+        repo = _interned(data.get('repo'), 'Unknown')
+        url_repo = _text(data.get('url_repo'))
+        init(self, 'repo', repo)
+        init(self, 'display_name', _text(data.get('display_name'), repo))
+        init(self, 'status', _interned(data.get('status'), 'Unknown'))
+        init(self, 'role', _text(data.get('role'), 'N/A'))
+        init(self, 'owner', _interned(data.get('owner'), 'N/A'))
+        init(self, 'summary', _text(data.get('summary')))
+        init(self, 'brief', _text(data.get('brief')))
+        init(self, 'tags', _strings(data.get('tags'), intern=True))
+        init(self, 'url_repo', url_repo)
+        init(self, 'url_dashboard', _text(data.get('url_dashboard')))
+        init(self, 'has_repo_url', bool(url_repo) and url_repo != 'TBD')
+        init(self, 'spec_location', data.get('spec_location'))
+        init(self, 'dashboard_location', data.get('dashboard_location'))
+        init(self, 'tier', data.get('tier'))
+        init(self, 'last_updated', _text(data.get('last_updated')))
+        init(self, 'raw', data)  # full manifest for detail views
+        init(self, 'conformance', conformance)
+        init(self, 'fingerprint', _fingerprint((
+            self.repo, self.display_name, self.status, self.role, self.owner,
+            self.summary, self.brief, self.tags, self.url_repo, self.url_dashboard,
+            self.last_updated, conformance.score,
+        )))
+
+    @property
+    def key(self):
+        return self.repo
+
+
+# ========== PROJECT ==========
+
+class Project(_Frozen):
+    """One flagship project (projects.json → flagship_projects)."""
+    __slots__ = (
+        'id', 'title', 'tagline', 'status', 'badge_status', 'owner', 'track', 'stats_track', 'repo', 'summary',
+        'why_exists', 'current_phase', 'next_action', 'vision',
+        'milestones', 'nyquist_contribution', 'raw', 'conformance', 'fingerprint',
+    )
+
+    def __init__(self, data, conformance=UNCHECKED):
+        init = object.__setattr__
+        title = _text(data.get('title'), 'Untitled')
+        init(self, 'id', _interned(data.get('id'), title))
+        init(self, 'title', title)
+        init(self, 'tagline', _text(data.get('tagline')))
+        # Each consumer kept its own fallback for a missing status / track
+        init(self, 'status', _interned(data.get('status'), 'Unknown'))          # labels, status counts
+        init(self, 'badge_status', _interned(data.get('status'), 'Concept'))    # status badges
+        init(self, 'owner', _interned(data.get('owner'), 'TBD'))
+        init(self, 'track', _interned(data.get('track'), 'TBD'))                # displayed track
+        init(self, 'stats_track', _interned(data.get('track'), 'Unknown'))      # per-track counts and filters
+        init(self, 'repo', _interned(data.get('repo')))
+        init(self, 'summary', _text(data.get('summary')))
+        init(self, 'why_exists', _text(data.get('why_exists')))
+        init(self, 'current_phase', _text(data.get('current_phase'), 'N/A'))
+        init(self, 'next_action', _text(data.get('next_action')))
+        init(self, 'vision', _text(data.get('vision')))
+        init(self, 'milestones', _strings(data.get('milestones')))
+        init(self, 'nyquist_contribution', _strings(data.get('nyquist_contribution')))
+        init(self, 'raw', data)
+        init(self, 'conformance', conformance)
+        init(self, 'fingerprint', _fingerprint((
+            self.id, self.title, self.tagline, self.status, self.badge_status, self.owner,
+            self.track, self.stats_track, self.repo, self.summary, self.why_exists, self.current_phase,
+            self.next_action, self.vision, self.milestones, self.nyquist_contribution,
+            conformance.score,
+        )))
+
+    @property
+    def key(self):
+        return self.id
+
+
+# ========== BUILDERS ==========
+
+def _aligned(records, conformance):
+    records = [r for r in records if isinstance(r, Mapping)]
+    if conformance is None or len(conformance) != len(records):
+        return [(r, UNCHECKED) for r in records]
+    return zip(records, conformance)
+
+
+def build_manifests(manifests, conformance=None):
+    """
+    Tuple of Manifest models for the parsed manifest mappings (anything else
+    skipped). `conformance` holds one schema result per mapping, same order.
+    """
+    return tuple(Manifest(m, c) for m, c in _aligned(manifests, conformance))
+
+
+def build_projects(projects_data, conformance=None):
+    """Tuple of Project models for projects.json's flagship_projects (with aligned `conformance`)."""
+    if not isinstance(projects_data, Mapping):
+        return ()
+    projects = projects_data.get('flagship_projects', ())
+    if not isinstance(projects, (list, tuple)):
+        return ()
+    return tuple(Project(p, c) for p, c in _aligned(projects, conformance))
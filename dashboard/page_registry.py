@@ -0,0 +1,134 @@
+"""
+PAN HANDLERS DASHBOARD — PAGE REGISTRY
+
+Lazy registry of dashboard pages. Each entry holds only a module path and
+sidebar metadata; the module is imported the first time someone navigates
+to it and kept for the life of the process. Every import is timed so the
+cost of each page shows up in `import_report()`.
+
+Usage:
+    from page_registry import PageRegistry, PageEntry
+    PAGES = PageRegistry([PageEntry("📊 Overview", "pages.overview", "SYSTEM"), ...])
+    PAGES.load("📊 Overview").render()
+
+    python page_registry.py      # import every page and print the report
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
+class PageEntry(NamedTuple):
+    """Static description of one page; importing it is deferred."""
+    label: str
+    module: str                 # dotted module path, e.g. "pages.overview"
+    category: Optional[str]     # sidebar heading; None for the trailing meta group
+
+    @property
+    def slug(self):
+        """URL name of the page: the last part of its module path."""
+        return self.module.rsplit(".", 1)[-1]
+
+
+class ImportRecord(NamedTuple):
+    """How long the first import of a page module took."""
+    label: str
+    module: str
+    seconds: float
+    modules_added: int          # modules newly pulled into sys.modules
+
+
+class PageRegistry:
+    """Ordered, lazily-importing mapping of page label -> module."""
+
+    def __init__(self, entries):
+        self._entries = {entry.label: entry for entry in entries}
+        self._slugs = {entry.slug: entry.label for entry in entries}
+        self._loaded = {}
+        self._imports = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, label):
+        return label in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def entries(self):
+        return list(self._entries.values())
+
+    def categories(self):
+        """[(category, [PageEntry, ...]), ...] in registration order."""
+        groups = {}
+        for entry in self._entries.values():
+            groups.setdefault(entry.category, []).append(entry)
+        return list(groups.items())
+
+    def label_for(self, slug):
+        """Page label for a URL slug, or None."""
+        return self._slugs.get(slug)
+
+    def slug_for(self, label):
+        return self._entries[label].slug
+
+    def is_loaded(self, label):
+        return label in self._loaded
+
+    def load(self, label):
+        """Import (once) and return the module for `label`, or None if unknown."""
+        module = self._loaded.get(label)
+        if module is not None:
+            return module
+        entry = self._entries.get(label)
+        if entry is None:
+            return None
+
+        with self._lock:
+            module = self._loaded.get(label)
+            if module is not None:
+                return module
+            before = len(sys.modules)
+            started = time.perf_counter()
+            module = importlib.import_module(entry.module)
+            self._imports[label] = ImportRecord(
+                label=label,
+                module=entry.module,
+                seconds=time.perf_counter() - started,
+                modules_added=len(sys.modules) - before,
+            )
+            self._loaded[label] = module
+            return module
+
+    def get(self, label, default=None):
+        """dict-style access; imports the page on first use."""
+        module = self.load(label)
+        return default if module is None else module
+
+    def import_report(self):
+        """ImportRecords for every page imported so far, slowest first."""
+        return sorted(self._imports.values(), key=lambda record: -record.seconds)
+
+
+def format_report(records):
+    """Plain-text table of ImportRecords."""
+    lines = [f"{'page':<28} {'module':<34} {'ms':>8} {'+mods':>6}"]
+    for record in records:
+        lines.append(f"{record.label:<28} {record.module:<34} "
+                     f"{record.seconds * 1000:>8.1f} {record.modules_added:>6}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Pages import streamlit and utils; the first page imported pays for
+    # those shared modules, so it is listed with its `+mods` count.
+    from app import PAGES
+
+    for label in PAGES:
+        PAGES.load(label)
+    print(format_report(PAGES.import_report()))
@@ -1,3 +1,2 @@
 # Pan Handlers Dashboard Pages
-from . import overview, federation_health, project_tracker, nyquist_tunnel, about
-from . import projects
+# Page modules are imported lazily by app.py's PAGES registry (page_registry.py).
@@ -5,18 +5,250 @@ Detailed health monitoring for all connected repositories
 in the Pan Handlers federation.
 """
 
+import html
 import streamlit as st
 from datetime import datetime
-from config import PATHS, SETTINGS
+from config import SETTINGS
+import path_health
+import url_health
 from utils import (
     page_divider, section_header, get_status_badge, repo_card,
-    load_manifests, load_nyquist_status
+    load_manifests, load_nyquist_status, current_theme, session_snapshot
 )
+from fragments import cached, emit
+from pagination import paged, REPO_SORTS, REPO_SEARCH
+
+
+# ========== REPOSITORY RENDERING ==========
+# 'page' and 'repo' modes build each repository as one collapsed <details>
+# block, so the browser only lays out a body when it is opened and the
+# websocket carries one delta per page (or per repo) instead of ~8 per repo.
+# 'widgets' keeps the original st.expander layout.
+
+def _repo_checks(manifest, url_status):
+    """
+    (name, passed) pairs; `passed` is None while a link is still being
+    probed. `url_status` is the url_health.check() result for the page.
+    """
+    checks = [
+        ("GitHub URL", manifest.has_repo_url),
+        ("Spec Document", manifest.spec_location is not None),
+        ("Dashboard", manifest.dashboard_location is not None),
+        (f"Schema {manifest.conformance.score:.0%}", manifest.conformance.valid),
+    ]
+    if not SETTINGS['url_probe']:
+        return checks
+    for name, url in (("Repo Reachable", manifest.url_repo), ("Dashboard Reachable", manifest.url_dashboard)):
+        if url in url_health.manifest_urls(manifest):
+            result = url_status.get(url)
+            checks.append((name, None if result is None else result.ok))
+    return checks
+
+
+def _check_icon(passed):
+    return "✅" if passed else "⏳" if passed is None else "⚠️"
+
+
+def _check_color(passed):
+    return "#00ff41" if passed else "#888" if passed is None else "#f4a261"
+
+
+def _status_color(status):
+    return '#00ff41' if status == 'Active' else '#f4a261' if status == 'Incubating' else '#666'
+
+
+def _repo_details_html(manifest, checks, expanded=False):
+    """Single HTML payload for one repository (no blank or indented lines, so markdown keeps it as HTML)."""
+    status = manifest.status
+    status_color = _status_color(status)
+
+    tags_html = " ".join(
+        f'<code style="background: rgba(0,255,65,0.2); color: #00ff41; padding: 2px 6px; border-radius: 3px; font-size: 0.85em;">{tag}</code>'
+        for tag in manifest.tags
+    )
+    checks_html = "".join(
+        f"<p style='margin: 0.2em 0; color: {_check_color(passed)};'>{_check_icon(passed)} {name}</p>"
+        for name, passed in checks
+    )
+    link_html = (
+        f'<p><a href="{manifest.url_repo}" target="_blank">📂 View on GitHub</a></p>'
+        if manifest.has_repo_url else ""
+    )
+
+    parts = [
+        f'<details{" open" if expanded else ""} style="border: 1px solid #333; border-radius: 8px; margin-bottom: 0.6em; padding: 0.4em 0.8em;">',
+        f'<summary style="cursor: pointer; font-weight: bold;">{manifest.display_name} — {status}</summary>',
+        '<div style="display: flex; flex-wrap: wrap; gap: 1em;">',
+        '<div style="flex: 2; min-width: 250px; padding: 1em;">',
+        f'<h4 style="color: {status_color}; margin-top: 0;">{manifest.display_name} {get_status_badge(status)}</h4>',
+        f'<p style="color: #555;"><strong>Role:</strong> {manifest.role}</p>',
+        f'<p style="color: #555;"><strong>Owner:</strong> {manifest.owner}</p>',
+        f'<p style="color: #444;">{manifest.summary or "No description available."}</p>',
+        f'<p>{tags_html}</p>' if tags_html else '',
+        '</div>',
+        '<div style="flex: 1; min-width: 180px;">',
+        '<div style="background: rgba(0,0,0,0.2); border-radius: 8px; padding: 1em;">',
+        '<h5 style="color: #2a9d8f; margin-top: 0;">Health Checks</h5>',
+        checks_html,
+        '</div>',
+        link_html,
+        '</div>',
+        '</div>',
+        '</details>',
+    ]
+    # A blank line inside a field would end markdown's HTML block
+    return "".join(parts).replace("\n", " ")
+
+
+def _repo_details_cached(manifest, theme, url_status):
+    checks = tuple(_repo_checks(manifest, url_status))
+    return cached(
+        ('federation_repo', manifest.fingerprint, theme, checks),
+        lambda: _repo_details_html(manifest, checks),
+    )
+
+
+def _repo_list_html(manifests, theme, url_status):
+    """The whole repository list as one payload; cached per snapshot and probe outcome as a unit."""
+    checks = tuple(tuple(_repo_checks(m, url_status)) for m in manifests)
+    key = ('federation_list', tuple(m.fingerprint for m in manifests), theme, checks)
+    return cached(key, lambda: "".join(_repo_details_cached(m, theme, url_status) for m in manifests))
+
+
+def _render_repo_widgets(manifest, url_status):
+    """Original widget layout: one expander and several deltas per repository."""
+    status = manifest.status
+    status_color = _status_color(status)
+
+    with st.expander(f"{manifest.display_name} — {status}", expanded=True):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown(f"""
+            <div style="padding: 1em;">
+                <h4 style="color: {status_color}; margin-top: 0;">
+                    {manifest.display_name}
+                    {get_status_badge(status)}
+                </h4>
+                <p style="color: #555;"><strong>Role:</strong> {manifest.role}</p>
+                <p style="color: #555;"><strong>Owner:</strong> {manifest.owner}</p>
+                <p style="color: #444;">{manifest.summary or 'No description available.'}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # Tags
+            tags = manifest.tags
+            if tags:
+                tags_html = " ".join([f'<code style="background: rgba(0,255,65,0.2); color: #00ff41; padding: 2px 6px; border-radius: 3px; font-size: 0.85em;">{tag}</code>' for tag in tags])
+                st.markdown(f"<p>{tags_html}</p>", unsafe_allow_html=True)
+
+        with col2:
+            # Health indicators
+            st.markdown("""
+            <div style="background: rgba(0,0,0,0.2); border-radius: 8px; padding: 1em;">
+                <h5 style="color: #2a9d8f; margin-top: 0;">Health Checks</h5>
+            """, unsafe_allow_html=True)
+
+            for check_name, passed in _repo_checks(manifest, url_status):
+                st.markdown(f"<p style='margin: 0.2em 0; color: {_check_color(passed)};'>{_check_icon(passed)} {check_name}</p>", unsafe_allow_html=True)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+            # Links
+            if manifest.has_repo_url:
+                st.markdown(f"[📂 View on GitHub]({manifest.url_repo})")
+
+
+# ========== MANIFEST DIAGNOSTICS ==========
+# Every read / parse / schema / duplicate problem from the last manifest
+# load, as one panel instead of one warning per file.
+
+MAX_DIAGNOSTIC_ROWS = 200
+_ISSUE_ICONS = {'read': '📁', 'parse': '🧩', 'schema': '📐', 'duplicate': '👯'}
+
+
+def _diagnostics_html(report):
+    rows = "".join(
+        f"<tr><td><code>{html.escape(issue.file)}</code></td>"
+        f"<td>{_ISSUE_ICONS.get(issue.kind, '⚠️')} {issue.kind}</td>"
+        f"<td>{html.escape(issue.message)}</td></tr>"
+        for issue in report.issues[:MAX_DIAGNOSTIC_ROWS]
+    )
+    more = len(report.issues) - MAX_DIAGNOSTIC_ROWS
+    more_html = f"<p style='color: #888;'>+{more:,} more issues</p>" if more > 0 else ""
+    return (
+        '<table style="width: 100%; font-size: 0.85em;">'
+        '<tr><th style="text-align: left;">File</th><th style="text-align: left;">Kind</th>'
+        f'<th style="text-align: left;">Problem</th></tr>{rows}</table>{more_html}'
+    )
+
+
+def render_diagnostics(report):
+    """Single collapsed panel summarising the snapshot's ManifestReport."""
+    issues = report.issues
+    files = len({issue.file for issue in issues})
+    title = (f"🩺 Manifest Diagnostics — {len(issues)} issue{'s' if len(issues) != 1 else ''} in {files} file{'s' if files != 1 else ''}"
+             if issues else "🩺 Manifest Diagnostics — all clear")
+    with st.expander(title, expanded=False):
+        parsed = (f"parsed {report.parsed:,} on {report.workers} {report.mode} in {report.seconds * 1000:.0f} ms"
+                  if report.parsed else "nothing re-parsed")
+        st.caption(f"{report.loaded:,} of {report.files:,} manifest files loaded · {parsed} · "
+                   f"mean schema conformance {report.conformance:.0%}")
+        if issues:
+            st.markdown(_diagnostics_html(report), unsafe_allow_html=True)
+
+
+# ========== REPOSITORY STATUS ==========
+# Only the visible page's links are probed, and never waited for: the list
+# renders at once with ⏳ for pending links. While any are pending the
+# section runs as a fragment that refreshes itself every
+# SETTINGS['url_probe_refresh'] seconds, and stops once they have all
+# answered. Streamlit builds without st.fragment get a refresh hint instead.
+
+_PENDING_KEY = "federation_links_pending"
+
+
+def _repo_status_body(manifests):
+    """The paged repository list, with link checks for the visible page only."""
+    visible = paged(manifests, key="federation_repos", sort_options=REPO_SORTS, search_fields=REPO_SEARCH).items
+    url_status = url_health.check_manifests(visible, wait=0) if SETTINGS['url_probe'] else {}
+    pending = sum(1 for result in url_status.values() if result is None)
+    live = hasattr(st, 'fragment')
+    if pending:
+        st.caption(f"⏳ {pending} link{'s' if pending != 1 else ''} being checked — "
+                   + ("this list updates when they finish." if live else "refresh the page to see the results."))
+
+    mode = SETTINGS['federation_render_mode']
+    if mode == 'page':
+        # One delta for the whole visible page
+        emit(_repo_list_html(visible, current_theme(), url_status))
+    elif mode == 'repo':
+        # One delta per repository
+        theme = current_theme()
+        for manifest in visible:
+            emit(_repo_details_cached(manifest, theme, url_status))
+    else:
+        for manifest in visible:
+            _render_repo_widgets(manifest, url_status)
+
+    # run_every is fixed when the fragment is declared, so arming or disarming it takes a full rerun
+    if live and bool(pending) != st.session_state.get(_PENDING_KEY, False):
+        st.session_state[_PENDING_KEY] = bool(pending)
+        st.rerun()
+
+
+def _render_repo_status(manifests):
+    if not hasattr(st, 'fragment'):
+        _repo_status_body(manifests)
+        return
+    every = SETTINGS['url_probe_refresh'] if st.session_state.get(_PENDING_KEY, False) else None
+    st.fragment(run_every=every)(_repo_status_body)(manifests)
 
 
 def render():
     """Render the Federation Health page."""
-    manifests = st.session_state.get('manifests', [])
+    snapshot = session_snapshot()
+    manifests = snapshot.manifest_models
 
     # Header
     st.markdown('<div class="dashboard-title">🏥 Federation Health</div>', unsafe_allow_html=True)
@@ -30,8 +262,8 @@ def render():
     col1, col2, col3, col4 = st.columns(4)
 
     total_repos = len(manifests)
-    active_repos = sum(1 for m in manifests if m.get('status') == 'Active')
-    nyquist_healthy = PATHS['nyquist_status'].exists()
+    active_repos = sum(1 for m in manifests if m.status == 'Active')
+    nyquist_healthy = path_health.exists('nyquist_status')
 
     with col1:
         health_pct = (active_repos / total_repos * 100) if total_repos > 0 else 0
@@ -68,69 +300,15 @@ def render():
         </div>
         """, unsafe_allow_html=True)
 
+    render_diagnostics(snapshot.manifest_report)
+
     page_divider()
 
     # === REPOSITORY DETAILS ===
     section_header("Repository Status", "🌌")
 
     if manifests:
-        for manifest in manifests:
-            status = manifest.get('status', 'Unknown')
-            status_color = '#00ff41' if status == 'Active' else '#f4a261' if status == 'Incubating' else '#666'
-
-            with st.expander(f"{manifest.get('display_name', manifest.get('repo', 'Unknown'))} — {status}", expanded=True):
-                col1, col2 = st.columns([2, 1])
-
-                with col1:
-                    st.markdown(f"""
-                    <div style="padding: 1em;">
-                        <h4 style="color: {status_color}; margin-top: 0;">
-                            {manifest.get('display_name', manifest.get('repo', 'Unknown'))}
-                            {get_status_badge(status)}
-                        </h4>
-                        <p style="color: #555;"><strong>Role:</strong> {manifest.get('role', 'N/A')}</p>
-                        <p style="color: #555;"><strong>Owner:</strong> {manifest.get('owner', 'N/A')}</p>
-                        <p style="color: #444;">{manifest.get('summary', 'No description available.')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    # Tags
-                    tags = manifest.get('tags', [])
-                    if tags:
-                        tags_html = " ".join([f'<code style="background: rgba(0,255,65,0.2); color: #00ff41; padding: 2px 6px; border-radius: 3px; font-size: 0.85em;">{tag}</code>' for tag in tags])
-                        st.markdown(f"<p>{tags_html}</p>", unsafe_allow_html=True)
-
-                with col2:
-                    # Health indicators
-                    st.markdown("""
-                    <div style="background: rgba(0,0,0,0.2); border-radius: 8px; padding: 1em;">
-                        <h5 style="color: #2a9d8f; margin-top: 0;">Health Checks</h5>
-                    """, unsafe_allow_html=True)
-
-                    # Check various health indicators
-                    url = manifest.get('url_repo', '')
-                    has_url = url and url != 'TBD'
-                    has_spec = manifest.get('spec_location') is not None
-                    has_dashboard = manifest.get('dashboard_location') is not None
-
-                    checks = [
-                        ("GitHub URL", has_url),
-                        ("Spec Document", has_spec),
-                        ("Dashboard", has_dashboard),
-                        ("Status Updated", True),  # Assuming if we loaded it, it's recent
-                    ]
-
-                    for check_name, passed in checks:
-                        icon = "✅" if passed else "⚠️"
-                        color = "#00ff41" if passed else "#f4a261"
-                        st.markdown(f"<p style='margin: 0.2em 0; color: {color};'>{icon} {check_name}</p>", unsafe_allow_html=True)
-
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-                    # Links
-                    if has_url:
-                        st.markdown(f"[📂 View on GitHub]({url})")
-
+        _render_repo_status(manifests)
     else:
         st.info("No repository manifests found. Add manifest JSON files to Pan_Handlers/manifests/")
 
@@ -148,17 +326,17 @@ def render():
         """, unsafe_allow_html=True)
 
         checks = [
-            ("NYQUIST_STATUS.json", PATHS['nyquist_status'].exists()),
-            ("Personas Directory", PATHS['nyquist_personas'].exists()),
-            ("Experiments Directory", PATHS['nyquist_experiments'].exists()),
-            ("S7 Armada Directory", PATHS['s7_armada_dir'].exists()),
-            ("Publication Status", PATHS['publication_status'].exists()),
+            ("NYQUIST_STATUS.json", path_health.exists('nyquist_status')),
+            ("Personas Directory", path_health.exists('nyquist_personas')),
+            ("Experiments Directory", path_health.exists('nyquist_experiments')),
+            ("S7 Armada Directory", path_health.exists('s7_armada_dir')),
+            ("Publication Status", path_health.exists('publication_status')),
         ]
 
-        for check_name, exists in checks:
-            icon = "✅" if exists else "❌"
-            color = "#00ff41" if exists else "#e74c3c"
-            st.markdown(f"<p style='margin: 0.3em 0; color: {color};'>{icon} {check_name}</p>", unsafe_allow_html=True)
+        st.markdown("".join(
+            f"<p style='margin: 0.3em 0; color: {'#00ff41' if exists else '#e74c3c'};'>{'✅' if exists else '❌'} {check_name}</p>"
+            for check_name, exists in checks
+        ), unsafe_allow_html=True)
 
         st.markdown("</div>", unsafe_allow_html=True)
 
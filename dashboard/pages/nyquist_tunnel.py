@@ -5,77 +5,81 @@ Deep integration view showing the connection between
 Pan Handlers and Nyquist Consciousness.
 """
 
+import time
+
 import streamlit as st
-from config import PATHS, SETTINGS
+from config import SETTINGS
+import path_health
 from utils import (
     page_divider, section_header, load_nyquist_status,
     load_publication_status, get_nyquist_integration_stats
 )
+from css_assets import build_sheet, inject_page_css
+
+NYQUIST_TUNNEL_CSS = """
+.matrix-title {
+    font-size: 2.5em;
+    font-weight: bold;
+    background: linear-gradient(135deg, #00ff41 0%, #00cc33 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    text-align: center;
+    margin-bottom: 0.3em;
+    font-family: 'Courier New', monospace;
+}
+.matrix-subtitle {
+    color: #00cc33;
+    font-size: 1.1em;
+    text-align: center;
+    margin-bottom: 1.5em;
+    font-family: 'Courier New', monospace;
+}
+.tunnel-status {
+    background: linear-gradient(135deg, rgba(0,255,65,0.1) 0%, rgba(0,204,51,0.05) 100%);
+    border: 2px solid #00ff41;
+    border-radius: 12px;
+    padding: 1.5em;
+    margin: 1em 0;
+    box-shadow: 0 0 20px rgba(0,255,65,0.3);
+}
+.tunnel-status h3 {
+    color: #00ff41 !important;
+    margin-top: 0;
+    font-family: 'Courier New', monospace;
+}
+.nyquist-card {
+    background: linear-gradient(135deg, rgba(244,162,97,0.15) 0%, rgba(231,111,81,0.08) 100%);
+    border: 2px solid #f4a261;
+    border-radius: 10px;
+    padding: 1.2em;
+    margin: 0.8em 0;
+}
+.nyquist-card h4 {
+    color: #f4a261 !important;
+    margin-top: 0;
+}
+.stack-layer {
+    background: rgba(0,0,0,0.3);
+    border-left: 4px solid;
+    padding: 0.5em 1em;
+    margin: 0.3em 0;
+    border-radius: 0 4px 4px 0;
+}
+"""
 
 
 def render():
     """Render the Nyquist Tunnel page."""
 
-    # Matrix theme CSS
-    st.markdown("""
-    <style>
-    .matrix-title {
-        font-size: 2.5em;
-        font-weight: bold;
-        background: linear-gradient(135deg, #00ff41 0%, #00cc33 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 0.3em;
-        font-family: 'Courier New', monospace;
-    }
-    .matrix-subtitle {
-        color: #00cc33;
-        font-size: 1.1em;
-        text-align: center;
-        margin-bottom: 1.5em;
-        font-family: 'Courier New', monospace;
-    }
-    .tunnel-status {
-        background: linear-gradient(135deg, rgba(0,255,65,0.1) 0%, rgba(0,204,51,0.05) 100%);
-        border: 2px solid #00ff41;
-        border-radius: 12px;
-        padding: 1.5em;
-        margin: 1em 0;
-        box-shadow: 0 0 20px rgba(0,255,65,0.3);
-    }
-    .tunnel-status h3 {
-        color: #00ff41 !important;
-        margin-top: 0;
-        font-family: 'Courier New', monospace;
-    }
-    .nyquist-card {
-        background: linear-gradient(135deg, rgba(244,162,97,0.15) 0%, rgba(231,111,81,0.08) 100%);
-        border: 2px solid #f4a261;
-        border-radius: 10px;
-        padding: 1.2em;
-        margin: 0.8em 0;
-    }
-    .nyquist-card h4 {
-        color: #f4a261 !important;
-        margin-top: 0;
-    }
-    .stack-layer {
-        background: rgba(0,0,0,0.3);
-        border-left: 4px solid;
-        padding: 0.5em 1em;
-        margin: 0.3em 0;
-        border-radius: 0 4px 4px 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Matrix theme CSS (sent to the browser once per session)
+    inject_page_css(build_sheet("page-nyquist-tunnel", NYQUIST_TUNNEL_CSS), mode=SETTINGS['css_delivery'])
 
     # Header
     st.markdown('<div class="matrix-title">🟢 Nyquist Tunnel</div>', unsafe_allow_html=True)
     st.markdown('<div class="matrix-subtitle">PTP-1.0 — Pan Handlers Tunnel Protocol</div>', unsafe_allow_html=True)
 
     # Connection status banner
-    nyquist_connected = PATHS['nyquist_status'].exists()
+    nyquist_connected = path_health.exists('nyquist_status')
     if nyquist_connected:
         st.markdown("""
         <div class="tunnel-status">
@@ -261,16 +265,17 @@ def render():
 
     with st.expander("View Integration Paths", expanded=False):
         paths_to_check = [
-            ("Nyquist Status", PATHS['nyquist_status']),
-            ("Personas Directory", PATHS['nyquist_personas']),
-            ("Experiments Directory", PATHS['nyquist_experiments']),
-            ("Docs Directory", PATHS['nyquist_docs']),
-            ("S7 Armada", PATHS['s7_armada_dir']),
-            ("Publication Status", PATHS['publication_status']),
+            ("Nyquist Status", 'nyquist_status'),
+            ("Personas Directory", 'nyquist_personas'),
+            ("Experiments Directory", 'nyquist_experiments'),
+            ("Docs Directory", 'nyquist_docs'),
+            ("S7 Armada", 's7_armada_dir'),
+            ("Publication Status", 'publication_status'),
         ]
 
-        for name, path in paths_to_check:
-            exists = path.exists()
+        health = path_health.table()
+        for name, key in paths_to_check:
+            exists = health[key].exists
             icon = "✅" if exists else "❌"
             color = "#00ff41" if exists else "#e74c3c"
             st.markdown(f"""
@@ -281,6 +286,9 @@ def render():
             </div>
             """, unsafe_allow_html=True)
 
+        age = time.time() - path_health.probed_at()
+        st.caption(f"Checked {age:.0f}s ago · refreshed every {SETTINGS['path_probe_interval']:.0f}s")
+
     # Footer
     page_divider()
     st.markdown("""
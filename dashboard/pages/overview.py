@@ -6,24 +6,67 @@ project status, and key metrics.
 """
 
 import streamlit as st
-from config import PATHS, SETTINGS
+from config import SETTINGS
+import path_health
 from utils import (
     page_divider, section_header, get_status_badge,
-    get_project_stats, get_nyquist_integration_stats
+    get_project_stats, get_nyquist_integration_stats, current_theme,
+    session_snapshot
 )
+from fragments import cached, emit
+from pagination import paged, REPO_SORTS, REPO_SEARCH
+
+
+# Color palette for different repo types
+REPO_COLORS = {
+    'nyquist': {'bg': 'rgba(155, 89, 182, 0.15)', 'border': '#9b59b6', 'text': '#9b59b6'},  # Purple - Core Engine
+    'cfa': {'bg': 'rgba(52, 152, 219, 0.15)', 'border': '#3498db', 'text': '#3498db'},      # Blue - Meta Framework
+    'abi': {'bg': 'rgba(231, 76, 60, 0.15)', 'border': '#e74c3c', 'text': '#e74c3c'},       # Red - Investigation
+    'dcia': {'bg': 'rgba(230, 126, 34, 0.15)', 'border': '#e67e22', 'text': '#e67e22'},     # Orange - Intelligence
+    'ndo': {'bg': 'rgba(46, 204, 113, 0.15)', 'border': '#2ecc71', 'text': '#2ecc71'},      # Green - Data
+    'avlar': {'bg': 'rgba(241, 196, 15, 0.15)', 'border': '#f1c40f', 'text': '#d4ac0d'},    # Yellow - Art/Ritual
+    'gene': {'bg': 'rgba(26, 188, 156, 0.15)', 'border': '#1abc9c', 'text': '#1abc9c'},     # Teal - Gene Therapy
+    'slavery': {'bg': 'rgba(127, 140, 141, 0.15)', 'border': '#7f8c8d', 'text': '#7f8c8d'}, # Gray - Liberation
+    'voting': {'bg': 'rgba(142, 68, 173, 0.15)', 'border': '#8e44ad', 'text': '#8e44ad'},   # Deep Purple - Voting
+    'nursing': {'bg': 'rgba(243, 156, 18, 0.15)', 'border': '#f39c12', 'text': '#f39c12'}, # Amber - Nursing
+}
+DEFAULT_COLOR = {'bg': 'rgba(0, 255, 65, 0.1)', 'border': '#00ff41', 'text': '#00ff41'}
+
+
+def get_repo_color(repo_name):
+    """Get color scheme based on repo name."""
+    repo_lower = repo_name.lower()
+    for key, colors in REPO_COLORS.items():
+        if key in repo_lower:
+            return colors
+    return DEFAULT_COLOR
+
+
+def _repo_tile_html(manifest):
+    """Overview tile for one repo (cached per snapshot by the caller)."""
+    colors = get_repo_color(manifest.repo)
+    return f"""
+    <div style="background: {colors['bg']}; border: 2px solid {colors['border']};
+                border-radius: 12px; padding: 1.2em; margin-bottom: 1em; min-height: 180px;">
+        <h4 style="color: {colors['text']}; margin: 0 0 0.5em 0; font-size: 1.1em;">{manifest.display_name}</h4>
+        <p style="color: #666; font-size: 0.85em; margin: 0.3em 0;"><strong>Role:</strong> {manifest.role[:80]}...</p>
+        <p style="margin: 0.5em 0;">{get_status_badge(manifest.status)}</p>
+    </div>
+    """
 
 
 def render():
     """Render the Overview page."""
-    projects_data = st.session_state.get('projects_data', {})
-    manifests = st.session_state.get('manifests', [])
+    snapshot = session_snapshot()
+    projects = snapshot.project_models
+    manifests = snapshot.manifest_models
 
     # Header
     st.markdown('<div class="dashboard-title">🍳 Pan Handlers Federation</div>', unsafe_allow_html=True)
     st.markdown('<div class="dashboard-subtitle">System Health Dashboard — "Neither could have done it alone."</div>', unsafe_allow_html=True)
 
     # === HEALTH STATUS BANNER ===
-    nyquist_connected = PATHS['nyquist_status'].exists()
+    nyquist_connected = path_health.exists('nyquist_status')
     if nyquist_connected:
         st.markdown("""
         <div style="background: linear-gradient(135deg, rgba(0,255,65,0.15) 0%, rgba(42,157,143,0.1) 100%);
@@ -50,7 +93,7 @@ def render():
     # === KEY METRICS ROW ===
     col1, col2, col3, col4 = st.columns(4)
 
-    project_stats = get_project_stats(projects_data)
+    project_stats = get_project_stats(snapshot.project_facets)
     nyquist_stats = get_nyquist_integration_stats()
 
     with col1:
@@ -92,51 +135,23 @@ def render():
     # === CONNECTED REPOS STATUS ===
     section_header("Connected Repositories", "🌌")
 
-    # Define color palette for different repo types
-    REPO_COLORS = {
-        'nyquist': {'bg': 'rgba(155, 89, 182, 0.15)', 'border': '#9b59b6', 'text': '#9b59b6'},  # Purple - Core Engine
-        'cfa': {'bg': 'rgba(52, 152, 219, 0.15)', 'border': '#3498db', 'text': '#3498db'},      # Blue - Meta Framework
-        'abi': {'bg': 'rgba(231, 76, 60, 0.15)', 'border': '#e74c3c', 'text': '#e74c3c'},       # Red - Investigation
-        'dcia': {'bg': 'rgba(230, 126, 34, 0.15)', 'border': '#e67e22', 'text': '#e67e22'},     # Orange - Intelligence
-        'ndo': {'bg': 'rgba(46, 204, 113, 0.15)', 'border': '#2ecc71', 'text': '#2ecc71'},      # Green - Data
-        'avlar': {'bg': 'rgba(241, 196, 15, 0.15)', 'border': '#f1c40f', 'text': '#d4ac0d'},    # Yellow - Art/Ritual
-        'gene': {'bg': 'rgba(26, 188, 156, 0.15)', 'border': '#1abc9c', 'text': '#1abc9c'},     # Teal - Gene Therapy
-        'slavery': {'bg': 'rgba(127, 140, 141, 0.15)', 'border': '#7f8c8d', 'text': '#7f8c8d'}, # Gray - Liberation
-        'voting': {'bg': 'rgba(142, 68, 173, 0.15)', 'border': '#8e44ad', 'text': '#8e44ad'},   # Deep Purple - Voting
-        'nursing': {'bg': 'rgba(243, 156, 18, 0.15)', 'border': '#f39c12', 'text': '#f39c12'}, # Amber - Nursing
-    }
-    DEFAULT_COLOR = {'bg': 'rgba(0, 255, 65, 0.1)', 'border': '#00ff41', 'text': '#00ff41'}
-
-    def get_repo_color(repo_name):
-        """Get color scheme based on repo name."""
-        repo_lower = repo_name.lower()
-        for key, colors in REPO_COLORS.items():
-            if key in repo_lower:
-                return colors
-        return DEFAULT_COLOR
-
     if manifests:
+        theme = current_theme()
+        visible = paged(manifests, key="overview_repos", sort_options=REPO_SORTS, search_fields=REPO_SEARCH).items
+
         # Display in rows of 3 for better readability
         cols_per_row = 3
-        for row_start in range(0, len(manifests), cols_per_row):
-            row_manifests = manifests[row_start:row_start + cols_per_row]
+        for row_start in range(0, len(visible), cols_per_row):
+            row_manifests = visible[row_start:row_start + cols_per_row]
             cols = st.columns(cols_per_row)
 
             for i, manifest in enumerate(row_manifests):
                 with cols[i]:
-                    repo_name = manifest.get('repo', 'Unknown')
-                    display_name = manifest.get('display_name', repo_name)
-                    status = manifest.get('status', 'Unknown')
-                    colors = get_repo_color(repo_name)
-
-                    st.markdown(f"""
-                    <div style="background: {colors['bg']}; border: 2px solid {colors['border']};
-                                border-radius: 12px; padding: 1.2em; margin-bottom: 1em; min-height: 180px;">
-                        <h4 style="color: {colors['text']}; margin: 0 0 0.5em 0; font-size: 1.1em;">{display_name}</h4>
-                        <p style="color: #666; font-size: 0.85em; margin: 0.3em 0;"><strong>Role:</strong> {manifest.get('role', 'N/A')[:80]}...</p>
-                        <p style="margin: 0.5em 0;">{get_status_badge(status)}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    html = cached(
+                        ('overview_tile', manifest.fingerprint, theme, False),
+                        lambda manifest=manifest: _repo_tile_html(manifest),
+                    )
+                    emit(html)
     else:
         st.info("No repository manifests loaded.")
 
@@ -145,9 +160,7 @@ def render():
     # === PROJECT STATUS SUMMARY ===
     section_header("Project Status Summary", "📋")
 
-    if projects_data and 'flagship_projects' in projects_data:
-        projects = projects_data['flagship_projects']
-
+    if projects:
         # Status breakdown
         col1, col2 = st.columns([1, 2])
 
@@ -157,12 +170,7 @@ def render():
                 <h4 style="color: #00ff41; margin-top: 0;">By Status</h4>
             """, unsafe_allow_html=True)
 
-            status_counts = {}
-            for p in projects:
-                s = p.get('status', 'Unknown')
-                status_counts[s] = status_counts.get(s, 0) + 1
-
-            for status, count in sorted(status_counts.items(), key=lambda x: -x[1]):
+            for status, count in project_stats['by_status'].items():
                 badge = get_status_badge(status)
                 st.markdown(f"<p style='margin: 0.3em 0;'>{badge} × {count}</p>", unsafe_allow_html=True)
 
@@ -9,13 +9,98 @@ import streamlit as st
 from config import PATHS, SETTINGS
 from utils import (
     page_divider, section_header, get_status_badge, project_card,
-    get_track_color, get_project_stats
+    get_track_color, get_project_stats, session_snapshot
 )
+from pagination import paged, PROJECT_SORTS, PROJECT_SEARCH
+
+# "By Track" tiles: the largest tracks get their own tile, the rest share one
+TRACK_TILES = 8
+TILES_PER_ROW = 4
+
+
+def render_project_detail(project):
+    """Body of one project's expander; also the static export's project page."""
+    track_color = get_track_color(project.track)
+    badge = get_status_badge(project.badge_status)
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(f"""
+        <div style="padding: 0.5em;">
+            <h3 style="color: {track_color}; margin-top: 0;">
+                {project.title} {badge}
+            </h3>
+            <p style="color: #555; font-style: italic; font-size: 1.1em;">
+                "{project.tagline}"
+            </p>
+            <p style="color: #444;"><strong>Track:</strong> {project.track}</p>
+            <p style="color: #444;"><strong>Lead:</strong> {project.owner}</p>
+            <p style="color: #444;"><strong>Current Phase:</strong> {project.current_phase}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Summary
+        st.markdown("**Summary:**")
+        st.markdown(project.summary or 'No summary available.')
+
+        # Why it exists
+        if project.why_exists:
+            st.markdown("**Why It Exists:**")
+            st.markdown(project.why_exists)
+
+    with col2:
+        # Milestones
+        st.markdown("""
+        <div style="background: rgba(0,0,0,0.2); border-radius: 8px; padding: 1em;">
+            <h5 style="color: #2a9d8f; margin-top: 0;">Milestones</h5>
+        """, unsafe_allow_html=True)
+
+        milestones = project.milestones
+        if milestones:
+            for m in milestones[:6]:  # Show first 6
+                st.markdown(f"<p style='margin: 0.2em 0; font-size: 0.9em; color: #444;'>{m}</p>", unsafe_allow_html=True)
+            if len(milestones) > 6:
+                st.markdown(f"<p style='color: #888; font-size: 0.85em;'>+{len(milestones) - 6} more...</p>", unsafe_allow_html=True)
+        else:
+            st.markdown("<p style='color: #888; font-size: 0.9em;'>No milestones defined</p>", unsafe_allow_html=True)
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # Next Action
+        if project.next_action:
+            st.markdown(f"""
+            <div style="background: rgba(244,162,97,0.1); border: 1px solid #f4a261;
+                        border-radius: 8px; padding: 0.8em; margin-top: 1em;">
+                <h5 style="color: #f4a261; margin: 0 0 0.5em 0;">⏭️ Next Action</h5>
+                <p style="color: #444; margin: 0; font-size: 0.9em;">{project.next_action}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Nyquist Contribution
+    contributions = project.nyquist_contribution
+    if contributions:
+        st.markdown("---")
+        st.markdown("**Nyquist Framework Contribution:**")
+        for c in contributions:
+            st.markdown(f"- {c}")
+
+    # Vision
+    if project.vision:
+        st.markdown("---")
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, rgba(155,89,182,0.1) 0%, rgba(52,152,219,0.05) 100%);
+                    border-left: 4px solid #9b59b6; padding: 1em; border-radius: 0 8px 8px 0;">
+            <h5 style="color: #9b59b6; margin-top: 0;">🌟 Vision</h5>
+            <p style="color: #444; font-style: italic;">{project.vision}</p>
+        </div>
+        """, unsafe_allow_html=True)
 
 
 def render():
     """Render the Project Tracker page."""
-    projects_data = st.session_state.get('projects_data', {})
+    snapshot = session_snapshot()
+    projects_data = snapshot.projects or {}
 
     # Header
     st.markdown('<div class="dashboard-title">📋 Project Tracker</div>', unsafe_allow_html=True)
@@ -27,8 +112,8 @@ def render():
         st.warning("No project data found. Check projects.json file.")
         return
 
-    projects = projects_data['flagship_projects']
-    stats = get_project_stats(projects_data)
+    facets = snapshot.project_facets
+    stats = get_project_stats(facets)
 
     # === QUICK STATS ===
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -43,7 +128,7 @@ def render():
         st.metric("Concept", stats.get('concept', 0))
     with col5:
         # Calculate completion rate (projects with milestones that are done)
-        completion = sum(1 for p in projects if p.get('status') in ['Complete', 'Active']) / len(projects) * 100 if projects else 0
+        completion = facets.count('status', 'Complete', 'Active') / len(facets) * 100 if len(facets) else 0
         st.metric("Progress Rate", f"{completion:.0f}%")
 
     page_divider()
@@ -54,13 +139,17 @@ def render():
     with col1:
         status_filter = st.selectbox(
             "Filter by Status:",
-            ["All", "In Preparation", "In Progress", "Active", "Concept", "Complete"]
+            ["All"] + list(facets.values('status')),
+            format_func=lambda s: s if s == "All" else f"{s} ({facets.count('status', s)})",
         )
 
     with col2:
+        # Track counts follow the status filter
+        track_counts = facets.counts_within('track', facets.select(status=status_filter))
         track_filter = st.selectbox(
             "Filter by Track:",
-            ["All"] + list(stats.get('by_track', {}).keys())
+            ["All"] + list(facets.values('track')),
+            format_func=lambda t: t if t == "All" else f"{t} ({track_counts.get(t, 0)})",
         )
 
     page_divider()
@@ -68,103 +157,34 @@ def render():
     # === PROJECT CARDS ===
     section_header("Flagship Projects", "🏆")
 
-    # Filter projects
-    filtered = projects
-    if status_filter != "All":
-        filtered = [p for p in filtered if p.get('status') == status_filter]
-    if track_filter != "All":
-        filtered = [p for p in filtered if p.get('track') == track_filter]
+    # Filter projects: one bitset intersection, records fetched only for the matches
+    filtered = facets.records(facets.select(status=status_filter, track=track_filter))
+
+    view = paged(
+        filtered, key="tracker_projects", sort_options=PROJECT_SORTS,
+        search_fields=PROJECT_SEARCH, filter_key=(status_filter, track_filter),
+    )
 
-    if not filtered:
+    if not view.total:
         st.info("No projects match the selected filters.")
     else:
-        for project in filtered:
-            track_color = get_track_color(project.get('track', ''))
-            badge = get_status_badge(project.get('status', 'Concept'))
-
-            with st.expander(f"{project.get('title', 'Untitled')} — {project.get('status', 'Unknown')}", expanded=False):
-                col1, col2 = st.columns([2, 1])
-
-                with col1:
-                    st.markdown(f"""
-                    <div style="padding: 0.5em;">
-                        <h3 style="color: {track_color}; margin-top: 0;">
-                            {project.get('title', 'Untitled')} {badge}
-                        </h3>
-                        <p style="color: #555; font-style: italic; font-size: 1.1em;">
-                            "{project.get('tagline', '')}"
-                        </p>
-                        <p style="color: #444;"><strong>Track:</strong> {project.get('track', 'TBD')}</p>
-                        <p style="color: #444;"><strong>Lead:</strong> {project.get('owner', 'TBD')}</p>
-                        <p style="color: #444;"><strong>Current Phase:</strong> {project.get('current_phase', 'N/A')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    # Summary
-                    st.markdown("**Summary:**")
-                    st.markdown(project.get('summary', 'No summary available.'))
-
-                    # Why it exists
-                    if project.get('why_exists'):
-                        st.markdown("**Why It Exists:**")
-                        st.markdown(project.get('why_exists'))
-
-                with col2:
-                    # Milestones
-                    st.markdown("""
-                    <div style="background: rgba(0,0,0,0.2); border-radius: 8px; padding: 1em;">
-                        <h5 style="color: #2a9d8f; margin-top: 0;">Milestones</h5>
-                    """, unsafe_allow_html=True)
-
-                    milestones = project.get('milestones', [])
-                    if milestones:
-                        for m in milestones[:6]:  # Show first 6
-                            st.markdown(f"<p style='margin: 0.2em 0; font-size: 0.9em; color: #444;'>{m}</p>", unsafe_allow_html=True)
-                        if len(milestones) > 6:
-                            st.markdown(f"<p style='color: #888; font-size: 0.85em;'>+{len(milestones) - 6} more...</p>", unsafe_allow_html=True)
-                    else:
-                        st.markdown("<p style='color: #888; font-size: 0.9em;'>No milestones defined</p>", unsafe_allow_html=True)
-
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-                    # Next Action
-                    if project.get('next_action'):
-                        st.markdown(f"""
-                        <div style="background: rgba(244,162,97,0.1); border: 1px solid #f4a261;
-                                    border-radius: 8px; padding: 0.8em; margin-top: 1em;">
-                            <h5 style="color: #f4a261; margin: 0 0 0.5em 0;">⏭️ Next Action</h5>
-                            <p style="color: #444; margin: 0; font-size: 0.9em;">{project.get('next_action')}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                # Nyquist Contribution
-                contributions = project.get('nyquist_contribution', [])
-                if contributions:
-                    st.markdown("---")
-                    st.markdown("**Nyquist Framework Contribution:**")
-                    for c in contributions:
-                        st.markdown(f"- {c}")
-
-                # Vision
-                if project.get('vision'):
-                    st.markdown("---")
-                    st.markdown(f"""
-                    <div style="background: linear-gradient(135deg, rgba(155,89,182,0.1) 0%, rgba(52,152,219,0.05) 100%);
-                                border-left: 4px solid #9b59b6; padding: 1em; border-radius: 0 8px 8px 0;">
-                        <h5 style="color: #9b59b6; margin-top: 0;">🌟 Vision</h5>
-                        <p style="color: #444; font-style: italic;">{project.get('vision')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+        for project in view.items:
+            with st.expander(f"{project.title} — {project.status}", expanded=False):
+                render_project_detail(project)
 
     page_divider()
 
     # === TRACK DISTRIBUTION ===
     section_header("By Track", "📊")
 
-    track_counts = stats.get('by_track', {})
-    if track_counts:
-        cols = st.columns(len(track_counts))
-        for i, (track, count) in enumerate(sorted(track_counts.items(), key=lambda x: -x[1])):
+    # Counts come most common first; past TRACK_TILES the tail is folded into one tile
+    tiles = list(stats.get('by_track', {}).items())
+    if len(tiles) > TRACK_TILES:
+        rest = tiles[TRACK_TILES - 1:]
+        tiles = tiles[:TRACK_TILES - 1] + [(f"{len(rest)} other tracks", sum(count for _, count in rest))]
+    for row_start in range(0, len(tiles), TILES_PER_ROW):
+        cols = st.columns(TILES_PER_ROW)
+        for i, (track, count) in enumerate(tiles[row_start:row_start + TILES_PER_ROW]):
             with cols[i]:
                 color = get_track_color(track)
                 st.markdown(f"""
@@ -1,2 +1,2 @@
 # Pan Handlers Dashboard — Project Pages
-from . import whitepaper, online_voting, nursing, gene_therapy, modern_slavery, abi, dcia
+# Imported lazily by app.py's PAGES registry (page_registry.py).
@@ -0,0 +1,163 @@
+"""
+PAN HANDLERS DASHBOARD — PAGINATION
+
+Shared windowing component for long repo / project listings. Sorting and
+search run server-side once per (snapshot, listing, sort, query, filters)
+and the resulting order is cached, so a rerun only slices out the visible
+page. Render cost stays proportional to the page size, not the federation.
+
+Usage:
+    from pagination import paged
+    window = paged(manifests, key="overview_repos", sort_options=REPO_SORTS)
+    for manifest in window.items:
+        ...
+"""
+
+import threading
+from typing import NamedTuple
+
+import streamlit as st
+
+from config import SETTINGS
+from data_layer import current_snapshot
+import perf
+
+MAX_ORDERINGS = 256
+
+_lock = threading.Lock()
+_state = {
+    'version': None,
+    'orderings': {},    # cache key -> tuple of items in display order
+}
+
+
+class Window(NamedTuple):
+    """The visible slice of a sorted, filtered listing."""
+    items: tuple
+    page: int           # 1-based
+    pages: int
+    total: int          # matches after search / filters
+    start: int          # index of the first visible item in the full ordering
+    end: int
+
+
+class SortOption(NamedTuple):
+    attr: str
+    reverse: bool = False
+
+
+# Shared sort options for models.Manifest / models.Project listings
+REPO_SORTS = {
+    "Name": SortOption('display_name'),
+    "Status": SortOption('status'),
+    "Owner": SortOption('owner'),
+    "Last updated": SortOption('last_updated', reverse=True),
+}
+PROJECT_SORTS = {
+    "Title": SortOption('title'),
+    "Status": SortOption('status'),
+    "Track": SortOption('track'),
+    "Lead": SortOption('owner'),
+}
+
+# Fields searched by the filter box
+REPO_SEARCH = ('display_name', 'repo', 'role', 'owner', 'tags')
+PROJECT_SEARCH = ('title', 'tagline', 'owner', 'track', 'summary')
+
+
+# ========== ORDERING (cached per snapshot) ==========
+
+def _search_text(item, fields):
+    parts = []
+    for field in fields:
+        value = getattr(item, field, "")
+        parts.append(" ".join(value) if isinstance(value, tuple) else str(value))
+    return " ".join(parts).lower()
+
+
+def _sort_key(attr):
+    def key(item):
+        value = getattr(item, attr, "")
+        return value.lower() if isinstance(value, str) else value
+    return key
+
+
+def ordering(items, key, sort, query="", filter_key=None, search_fields=()):
+    """
+    Return `items` searched and sorted, cached until the snapshot changes.
+    `items` must be determined by the snapshot plus `filter_key`; callers
+    that pre-filter pass their filter values as `filter_key`.
+    """
+    version = current_snapshot().version
+    cache_key = (key, sort, query, filter_key)
+    with _lock:
+        if _state['version'] != version:
+            _state['version'] = version
+            _state['orderings'] = {}
+        cached = _state['orderings'].get(cache_key)
+    perf.note_cache(cached is not None)
+    if cached is not None:
+        return cached
+
+    result = list(items)
+    if query:
+        needle = query.lower()
+        result = [item for item in result if needle in _search_text(item, search_fields)]
+    if sort is not None:
+        result.sort(key=_sort_key(sort.attr), reverse=sort.reverse)
+    result = tuple(result)
+
+    with _lock:
+        if _state['version'] == version:
+            if len(_state['orderings']) >= MAX_ORDERINGS:
+                _state['orderings'] = {}
+            _state['orderings'][cache_key] = result
+    return result
+
+
+def window(ordered, page, page_size):
+    """Slice one page out of an ordering (page is clamped to the valid range)."""
+    total = len(ordered)
+    pages = max(1, -(-total // page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    end = min(start + page_size, total)
+    return Window(items=ordered[start:end], page=page, pages=pages, total=total, start=start, end=end)
+
+
+# ========== COMPONENT ==========
+
+def paged(items, key, sort_options=None, search_fields=(), filter_key=None, page_size=None):
+    """
+    Render search / sort / page controls for a listing and return the
+    visible Window. Widget state lives under `key`; the page resets to 1
+    whenever the search, sort or filters change.
+    """
+    page_size = page_size or SETTINGS['page_size']
+    col_search, col_sort, col_page = st.columns([3, 2, 1])
+
+    with col_search:
+        query = st.text_input("Search", key=f"{key}_query", placeholder="Filter…").strip() if search_fields else ""
+    with col_sort:
+        sort_label = st.selectbox("Sort by", list(sort_options), key=f"{key}_sort") if sort_options else None
+    sort = sort_options[sort_label] if sort_options else None
+
+    ordered = ordering(items, key, sort, query, filter_key, search_fields)
+    pages = max(1, -(-len(ordered) // page_size))
+
+    # Any change to what is listed starts again at page 1
+    signature = (query, sort_label, filter_key)
+    page_key = f"{key}_page"
+    if st.session_state.get(f"{key}_signature") != signature:
+        st.session_state[f"{key}_signature"] = signature
+        st.session_state[page_key] = 1
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+
+    with col_page:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    result = window(ordered, int(page), page_size)
+    if result.total:
+        st.caption(f"Showing {result.start + 1}–{result.end} of {result.total} · page {result.page}/{result.pages}")
+    return result
@@ -0,0 +1,161 @@
+"""
+PAN HANDLERS DASHBOARD — PATH HEALTH PROBE
+
+Background service that checks every config.PATHS entry on a schedule and
+keeps a timestamped table of the results, positive and negative alike.
+Pages read the table instead of calling `Path.exists()` on every render,
+which matters on slow or automounted filesystems where each stat can take
+milliseconds. The watcher triggers an immediate re-probe when a watched
+input changes.
+
+Usage:
+    import path_health
+    path_health.start()                     # idempotent, safe on every rerun
+    path_health.exists('nyquist_status')    # cached bool
+    path_health.table()                     # {key: PathStatus}
+"""
+
+import os
+import stat
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+from config import PATHS, SETTINGS
+import watcher
+
+
+class PathStatus(NamedTuple):
+    """Result of one probe of one PATHS entry."""
+    key: str
+    path: str
+    exists: bool
+    is_dir: bool
+    checked_at: float       # epoch seconds
+    latency: float          # seconds the stat took
+
+
+_lock = threading.Lock()
+_state = {
+    'table': {},
+    'probed_at': 0.0,
+    'thread': None,
+    'stop': None,
+    'wake': None,
+}
+
+
+# ========== PROBING ==========
+
+def _probe(key, path):
+    started = time.perf_counter()
+    try:
+        st = os.stat(path)
+        exists, is_dir = True, stat.S_ISDIR(st.st_mode)
+    except OSError:
+        exists, is_dir = False, False
+    return PathStatus(
+        key=key,
+        path=str(path),
+        exists=exists,
+        is_dir=is_dir,
+        checked_at=time.time(),
+        latency=time.perf_counter() - started,
+    )
+
+
+def probe_all():
+    """Probe every PATHS entry now and publish a new table."""
+    table = {key: _probe(key, path) for key, path in PATHS.items()}
+    with _lock:
+        _state['table'] = table
+        _state['probed_at'] = time.time()
+    return table
+
+
+def _run(stop, wake, interval):
+    while not stop.is_set():
+        try:
+            probe_all()
+        except Exception as e:
+            print(f"[path_health] probe failed: {e}", file=sys.stderr)
+        wake.wait(interval)
+        wake.clear()
+
+
+# ========== READS ==========
+
+def table():
+    """
+    The latest {key: PathStatus}. Without the background thread (probe off,
+    or start() not called yet) the read itself re-probes once the table is
+    older than SETTINGS['path_probe_interval'].
+    """
+    current = _state['table']
+    if not current:
+        return probe_all()
+    if not is_running() and time.time() - _state['probed_at'] >= SETTINGS['path_probe_interval']:
+        return probe_all()
+    return current
+
+
+def status(key):
+    return table()[key]
+
+
+def exists(key):
+    """Cached `PATHS[key].exists()`."""
+    return table()[key].exists
+
+
+def probed_at():
+    """Epoch seconds of the last completed probe (0.0 if none)."""
+    return _state['probed_at']
+
+
+# ========== LIFECYCLE ==========
+
+def is_running():
+    thread = _state['thread']
+    return thread is not None and thread.is_alive()
+
+
+def start():
+    """Start the background probe thread if it is not already running."""
+    with _lock:
+        if is_running():
+            return
+        stop_event, wake_event = threading.Event(), threading.Event()
+        thread = threading.Thread(
+            target=_run,
+            args=(stop_event, wake_event, SETTINGS['path_probe_interval']),
+            name="pan-handlers-path-health",
+            daemon=True,
+        )
+        _state.update(thread=thread, stop=stop_event, wake=wake_event)
+        thread.start()
+
+
+def stop(timeout=2.0):
+    """Stop the probe thread (mainly for tests and benchmarks)."""
+    with _lock:
+        thread, stop_event, wake_event = _state['thread'], _state['stop'], _state['wake']
+        _state.update(thread=None, stop=None, wake=None)
+    if stop_event is not None:
+        stop_event.set()
+        wake_event.set()
+    if thread is not None:
+        thread.join(timeout)
+
+
+def _on_data_change(epoch):
+    wake = _state['wake']
+    if wake is not None:
+        wake.set()
+    else:
+        _state['probed_at'] = 0.0     # next table() read re-probes
+
+
+# A watched input appearing or disappearing should not wait for the next tick
+watcher.subscribe(_on_data_change)
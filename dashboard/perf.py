@@ -0,0 +1,241 @@
+"""
+PAN HANDLERS DASHBOARD — RERUN INSTRUMENTATION
+
+Per-rerun timing spans with cache hit/miss counts and bytes emitted.
+
+main() opens one trace per script run; `span()` blocks inside it record
+wall time. The dashboard's own HTML emitters (fragments.emit for cards,
+tiles and headers, css_assets for stylesheets) report their payload sizes
+through `count_bytes()`, which counts them towards every open span, and
+cache lookups report through `note_cache()`. Streamlit itself is not
+patched, so other apps in the same process are unaffected. A finished rerun becomes a plain dict appended to
+a process-wide ring buffer of SETTINGS['perf_ring_size'] entries, which can
+be exported as JSON lines.
+
+Overhead per span is two perf_counter() calls and a list append; per emitted
+element it is one len(). Outside a trace everything is a no-op.
+
+Usage:
+    import perf
+    perf.begin_rerun(page="overview")
+    with perf.span("page.overview") as s:
+        page.render()
+    record = perf.end_rerun()
+    perf.export_jsonl()        # ring buffer as JSON lines
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import streamlit as st
+
+from config import SETTINGS
+
+_trace = ContextVar('perf_trace', default=None)
+
+_lock = threading.Lock()
+_state = {
+    'ring': deque(maxlen=SETTINGS['perf_ring_size']),
+    'reruns': 0,
+    'export': (None, ""),    # (reruns when built, JSONL text) for the overlay's download
+}
+
+
+class _Span:
+    __slots__ = ('name', 'depth', 'seq', 'ms', 'bytes', 'hits', 'misses')
+
+    def __init__(self, name, depth, seq):
+        self.name = name
+        self.depth = depth
+        self.seq = seq
+        self.ms = 0.0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self):
+        return {
+            'name': self.name, 'depth': self.depth, 'ms': round(self.ms, 3),
+            'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+        }
+
+
+class _Trace:
+    __slots__ = ('page', 'started', 'wall_started', 'spans', 'stack', 'opened', 'bytes', 'hits', 'misses')
+
+    def __init__(self, page):
+        self.page = page
+        self.started = time.perf_counter()
+        self.wall_started = time.time()
+        self.spans = []         # finished spans, in completion order
+        self.stack = []         # open spans, outermost first
+        self.opened = 0         # spans started so far (orders the report)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# ========== RECORDING ==========
+
+def begin_rerun(page=None):
+    """Start tracing this script run (a no-op when SETTINGS['perf_tracing'] is off)."""
+    if not SETTINGS['perf_tracing']:
+        _trace.set(None)
+        return
+    _trace.set(_Trace(page))
+
+
+@contextmanager
+def span(name):
+    """Time a block of the current rerun; yields the open span (or None outside a trace)."""
+    trace = _trace.get()
+    if trace is None:
+        yield None
+        return
+    current = _Span(name, len(trace.stack), trace.opened)
+    trace.opened += 1
+    trace.stack.append(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.ms = (time.perf_counter() - started) * 1000
+        trace.stack.pop()
+        trace.spans.append(current)
+
+
+def count_bytes(n):
+    """Attribute `n` emitted bytes to every open span and the rerun."""
+    trace = _trace.get()
+    if trace is None:
+        return
+    trace.bytes += n
+    for open_span in trace.stack:
+        open_span.bytes += n
+
+
+def note_cache(hit):
+    """Record one cache lookup against the innermost open span and the rerun."""
+    trace = _trace.get()
+    if trace is None:
+        return
+    if hit:
+        trace.hits += 1
+    else:
+        trace.misses += 1
+    if trace.stack:
+        if hit:
+            trace.stack[-1].hits += 1
+        else:
+            trace.stack[-1].misses += 1
+
+
+def _in_start_order(trace):
+    # Parents finish after their children; list spans in the order they opened
+    return [s.as_dict() for s in sorted(trace.spans, key=lambda s: s.seq)]
+
+
+def set_page(page):
+    trace = _trace.get()
+    if trace is not None:
+        trace.page = page
+
+
+def end_rerun():
+    """Close the trace, push its record onto the ring buffer and return it (None if not tracing)."""
+    trace = _trace.get()
+    if trace is None:
+        return None
+    _trace.set(None)
+    record = {
+        'ts': round(trace.wall_started, 3),
+        'page': trace.page,
+        'total_ms': round((time.perf_counter() - trace.started) * 1000, 3),
+        'bytes': trace.bytes,
+        'hits': trace.hits,
+        'misses': trace.misses,
+        'spans': _in_start_order(trace),
+    }
+    with _lock:
+        _state['ring'].append(record)
+        _state['reruns'] += 1
+    return record
+
+
+def current():
+    """The open trace's spans so far, as dicts (for the overlay)."""
+    trace = _trace.get()
+    if trace is None:
+        return None
+    return {
+        'page': trace.page,
+        'total_ms': (time.perf_counter() - trace.started) * 1000,
+        'bytes': trace.bytes,
+        'hits': trace.hits,
+        'misses': trace.misses,
+        'spans': _in_start_order(trace),
+    }
+
+
+# ========== EXPORT ==========
+
+def records():
+    with _lock:
+        return list(_state['ring'])
+
+
+def export_jsonl(path=None):
+    """The ring buffer as JSON lines; also written to `path` when given."""
+    text = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records())
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
+
+
+def clear():
+    with _lock:
+        _state['ring'].clear()
+        _state['reruns'] = 0
+        _state['export'] = (None, "")
+
+
+# ========== STREAMLIT HOOKS ==========
+
+def _export_for_overlay():
+    """export_jsonl(), rebuilt only when a rerun was traced since the last build."""
+    reruns, text = _state['export']
+    if reruns != _state['reruns']:
+        reruns, text = _state['reruns'], export_jsonl()
+        _state['export'] = (reruns, text)
+    return text
+
+
+def render_overlay(data=None):
+    """Sidebar table of this rerun's spans plus an on-demand JSONL download of the ring buffer."""
+    data = data or current()
+    if data is None:
+        return
+    rows = "".join(
+        f"<tr><td>{'&nbsp;' * 2 * s['depth']}{s['name']}</td><td>{s['ms']:.1f}</td>"
+        f"<td>{s['bytes']:,}</td><td>{s['hits']}/{s['misses']}</td></tr>"
+        for s in data['spans']
+    )
+    with st.sidebar.expander("⏱️ Perf", expanded=False):
+        st.markdown(
+            '<table style="font-size: 0.75em; width: 100%;">'
+            '<tr><th>span</th><th>ms</th><th>bytes</th><th>hit/miss</th></tr>'
+            f'{rows}</table>',
+            unsafe_allow_html=True,
+        )
+        st.caption(f"{data['total_ms']:.1f} ms so far · {data['bytes']:,} bytes · "
+                   f"{data['hits']} hits / {data['misses']} misses · "
+                   f"{_state['reruns']} reruns traced, {len(_state['ring'])} buffered")
+        # The JSONL is only built once asked for, not on every traced rerun
+        if st.button("Prepare JSONL export", key="perf_export", use_container_width=True):
+            st.download_button("Download JSONL", _export_for_overlay(), file_name="pan_handlers_perf.jsonl",
+                               mime="application/x-ndjson", use_container_width=True)
@@ -0,0 +1,87 @@
+"""
+PAN HANDLERS DASHBOARD — URL ROUTER
+
+Keeps the current page and theme in the URL query string
+(`?page=federation_health&theme=matrix`), so every view is deep-linkable.
+
+The route is resolved at the top of main(), before any CSS or data is
+emitted. Sidebar buttons change it through on_click callbacks, which
+Streamlit runs *before* the rerun their click triggers, so a navigation
+or theme switch costs exactly one script run — no st.experimental_rerun().
+
+Usage:
+    import router
+    route = router.resolve(PAGES)                   # top of main()
+    st.button(label, on_click=router.navigate, args=(PAGES, label))
+    st.button("Enter The Matrix", on_click=router.set_theme, args=(True,))
+"""
+
+from typing import NamedTuple
+
+import streamlit as st
+
+DEFAULT_PAGE = "📊 Overview"
+THEMES = {'standard': False, 'matrix': True}
+
+_PAGE_KEY = 'current_page'
+_THEME_KEY = 'matrix_mode'
+
+
+class Route(NamedTuple):
+    page: str           # page label in the registry
+    matrix_mode: bool
+
+
+# ========== QUERY PARAMS (st.query_params on 1.30+, experimental API before) ==========
+
+def _get_params():
+    if hasattr(st, "query_params"):
+        return {key: st.query_params.get(key) for key in ("page", "theme")}
+    params = st.experimental_get_query_params()
+    return {key: (params.get(key) or [None])[0] for key in ("page", "theme")}
+
+
+def _set_params(page_slug, theme):
+    if hasattr(st, "query_params"):
+        if st.query_params.get("page") != page_slug:
+            st.query_params["page"] = page_slug
+        if st.query_params.get("theme") != theme:
+            st.query_params["theme"] = theme
+    else:
+        st.experimental_set_query_params(page=page_slug, theme=theme)
+
+
+def _theme_name(matrix_mode):
+    return 'matrix' if matrix_mode else 'standard'
+
+
+# ========== ROUTING ==========
+
+def resolve(pages, default=DEFAULT_PAGE):
+    """
+    Work out this run's Route. Session state wins once set (callbacks write
+    it); on a session's first run the URL is read instead, so a shared link
+    opens the page and theme it names. Unknown values fall back to defaults,
+    and the URL is rewritten to the canonical form.
+    """
+    if _PAGE_KEY not in st.session_state or _THEME_KEY not in st.session_state:
+        params = _get_params()
+        label = pages.label_for(params.get("page")) or default
+        st.session_state.setdefault(_PAGE_KEY, label)
+        st.session_state.setdefault(_THEME_KEY, THEMES.get(params.get("theme"), False))
+
+    route = Route(page=st.session_state[_PAGE_KEY], matrix_mode=st.session_state[_THEME_KEY])
+    if route.page in pages:
+        _set_params(pages.slug_for(route.page), _theme_name(route.matrix_mode))
+    return route
+
+
+def navigate(pages, label):
+    """on_click callback: switch page (applied to the run the click triggers)."""
+    st.session_state[_PAGE_KEY] = label
+    _set_params(pages.slug_for(label), _theme_name(st.session_state.get(_THEME_KEY, False)))
+
+
+def set_theme(matrix_mode):
+    """on_click callback: switch theme; the triggered run already renders with it."""
+    st.session_state[_THEME_KEY] = matrix_mode
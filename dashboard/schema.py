@@ -0,0 +1,301 @@
+"""
+PAN HANDLERS DASHBOARD — SCHEMA VALIDATION
+
+Validates repository manifests (the v1 schema in PAN_HANDLERS_SPEC.md) and
+projects.json flagship entries, and scores how well each one conforms.
+
+Schemas are declared below as plain dicts in a small JSON Schema subset
+(type, required, properties, items, enum, pattern, minLength). Each is
+compiled once, at import, into nested checker closures, so validating a
+document walks precompiled rules and never re-reads the schema.
+
+Results are cached by content hash: manifests use the digest of their raw
+bytes (computed by manifest_loader / compiled_snapshot while reading the
+file), projects the digest of their canonical JSON. An unchanged file is
+never validated again in this process, whoever asks.
+
+A document's conformance score is the share of the rules evaluated on it
+that passed, so one wrong field in a rich manifest costs less than a
+missing required field in a bare one.
+
+Usage:
+    import schema
+    result = schema.validate('manifest', manifest_dict, digest)
+    result.score, result.errors         # 0.0–1.0, ("status: 'Live' is not one of ...", ...)
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from config import SETTINGS
+
+_DATE = r"^\d{4}-\d{2}-\d{2}$"
+_URL_OR_TBD = r"^(https?://\S+|TBD)$"
+_STRING = {'type': 'string'}
+_TEXT = {'type': 'string', 'minLength': 1}
+
+MANIFEST_SCHEMA = {
+    'type': 'object',
+    'required': ['repo', 'display_name', 'owner', 'url_repo', 'url_dashboard',
+                 'role', 'status', 'tags', 'summary', 'last_updated'],
+    'properties': {
+        'repo': {'type': 'string', 'pattern': r"^\S+$"},
+        'display_name': _TEXT,
+        'owner': _TEXT,
+        'url_repo': {'type': 'string', 'pattern': _URL_OR_TBD},
+        'url_dashboard': {'type': 'string', 'pattern': _URL_OR_TBD},
+        'role': _TEXT,
+        'status': {'type': 'string', 'enum': ['Active', 'Incubating', 'Archived']},
+        'tags': {'type': 'array', 'items': _TEXT},
+        'summary': _TEXT,
+        'last_updated': {'type': 'string', 'pattern': _DATE},
+        'tier': {'type': 'integer'},
+        'contact': {'type': 'object', 'properties': {'primary': _STRING, 'email': _STRING}},
+        'pillars': {'type': 'object'},
+        'projects': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'required': ['id', 'title', 'status'],
+                'properties': {
+                    'id': {'type': 'string', 'pattern': r"^\S+$"},
+                    'title': _TEXT,
+                    'status': {'type': 'string', 'enum': ['Planned', 'In Progress', 'Complete', 'Published']},
+                    'type': _STRING,
+                    'summary': _STRING,
+                    'links': {'type': 'object'},
+                },
+            },
+        },
+    },
+}
+
+PROJECT_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'title', 'status', 'owner', 'track', 'summary'],
+    'properties': {
+        'id': {'type': 'string', 'pattern': r"^\S+$"},
+        'title': _TEXT,
+        'tagline': _STRING,
+        'status': {'type': 'string', 'enum': ['In Preparation', 'In Progress', 'Active', 'Concept', 'Complete']},
+        'owner': _TEXT,
+        'track': {'type': 'string', 'enum': list(SETTINGS['tracks'])},
+        'repo': _STRING,
+        'summary': _TEXT,
+        'why_exists': _STRING,
+        'current_phase': _STRING,
+        'next_action': _STRING,
+        'vision': _STRING,
+        'milestones': {'type': 'array', 'items': _STRING},
+        'nyquist_contribution': {'type': 'array', 'items': _STRING},
+        'artifacts': {'type': 'object'},
+    },
+}
+
+SCHEMAS = {'manifest': MANIFEST_SCHEMA, 'project': PROJECT_SCHEMA}
+MAX_CACHED = 50_000
+
+
+class Conformance(NamedTuple):
+    """Validation result for one document."""
+    score: float        # passed rules / evaluated rules, 0.0–1.0
+    checks: int         # rules evaluated
+    errors: tuple       # "path: problem" strings
+
+    @property
+    def valid(self):
+        return not self.errors
+
+
+# ========== COMPILER ==========
+
+def json_type(value):
+    """JSON name of a decoded (possibly frozen) value's type."""
+    if isinstance(value, Mapping):
+        return 'object'
+    if isinstance(value, (list, tuple)):
+        return 'array'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'number'
+    if isinstance(value, str):
+        return 'string'
+    return 'null'
+
+
+def _where(path):
+    return path or "(document)"
+
+
+def _type_rule(expected):
+    accepted = {'number': ('integer', 'number')}.get(expected, (expected,))
+
+    def rule(value, path, errors):
+        if json_type(value) in accepted:
+            return True
+        errors.append(f"{_where(path)}: should be {expected}, got {json_type(value)}")
+        return False
+    return rule
+
+
+def _enum_rule(options):
+    allowed = frozenset(options)
+    listed = ", ".join(options)
+
+    def rule(value, path, errors):
+        if value in allowed:
+            return True
+        errors.append(f"{_where(path)}: {value!r} is not one of {listed}")
+        return False
+    return rule
+
+
+def _pattern_rule(pattern):
+    search = re.compile(pattern).search
+
+    def rule(value, path, errors):
+        if search(value):
+            return True
+        errors.append(f"{_where(path)}: {value!r} does not match {pattern}")
+        return False
+    return rule
+
+
+def _min_length_rule(minimum):
+    def rule(value, path, errors):
+        if len(value) >= minimum:
+            return True
+        errors.append(f"{_where(path)}: empty" if minimum == 1 else f"{_where(path)}: shorter than {minimum}")
+        return False
+    return rule
+
+
+def _compile(node):
+    """
+    Compile one schema node into check(value, path, errors) -> (evaluated, passed).
+    The type rule runs first; if it fails, nothing below it is evaluated.
+    """
+    type_rule = _type_rule(node['type']) if 'type' in node else None
+    value_rules = []
+    if 'enum' in node:
+        value_rules.append(_enum_rule(node['enum']))
+    if 'pattern' in node:
+        value_rules.append(_pattern_rule(node['pattern']))
+    if 'minLength' in node:
+        value_rules.append(_min_length_rule(node['minLength']))
+    required = tuple(node.get('required', ()))
+    properties = tuple((name, _compile(child)) for name, child in node.get('properties', {}).items())
+    items = _compile(node['items']) if 'items' in node else None
+
+    def check(value, path, errors):
+        evaluated = passed = 0
+        if type_rule is not None:
+            evaluated += 1
+            if not type_rule(value, path, errors):
+                return evaluated, passed
+            passed += 1
+        for rule in value_rules:
+            evaluated += 1
+            passed += rule(value, path, errors)
+        if required or properties:
+            prefix = f"{path}." if path else ""
+            for name in required:
+                evaluated += 1
+                if value.get(name) is None:
+                    errors.append(f"{prefix}{name}: required")
+                else:
+                    passed += 1
+            for name, child in properties:
+                item = value.get(name)
+                if item is not None:
+                    e, p = child(item, prefix + name, errors)
+                    evaluated += e
+                    passed += p
+        if items is not None:
+            for i, item in enumerate(value):
+                e, p = items(item, f"{path}[{i}]", errors)
+                evaluated += e
+                passed += p
+        return evaluated, passed
+
+    return check
+
+
+def compile_schema(schema):
+    """Compile a schema dict into validate(value) -> Conformance."""
+    check = _compile(schema)
+
+    def validate_value(value):
+        errors = []
+        evaluated, passed = check(value, "", errors)
+        return Conformance(
+            score=round(passed / evaluated, 4) if evaluated else 1.0,
+            checks=evaluated,
+            errors=tuple(errors),
+        )
+    return validate_value
+
+
+_CHECKERS = {kind: compile_schema(schema) for kind, schema in SCHEMAS.items()}
+
+
+# ========== CACHED VALIDATION ==========
+
+_lock = threading.Lock()
+_state = {
+    'results': {},      # (kind, digest) -> Conformance
+    'hits': 0,
+    'misses': 0,
+}
+
+
+def _plain(value):
+    return dict(value) if isinstance(value, Mapping) else str(value)
+
+
+def content_digest(value):
+    """Digest of a decoded document's canonical JSON (for documents without raw bytes, e.g. projects)."""
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=_plain)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def validate(kind, value, digest=None):
+    """
+    Conformance of `value` against SCHEMAS[kind]. `digest` identifies its
+    content (raw-bytes hash); without it the canonical JSON is hashed.
+    """
+    if digest is None:
+        digest = content_digest(value)
+    key = (kind, digest)
+    result = _state['results'].get(key)
+    if result is not None:
+        _state['hits'] += 1
+        return result
+
+    result = _CHECKERS[kind](value)
+    with _lock:
+        results = _state['results']
+        if len(results) >= MAX_CACHED:
+            # Oldest first: drop a quarter rather than one entry per call
+            for stale in list(results)[:MAX_CACHED // 4]:
+                del results[stale]
+        results[key] = result
+        _state['misses'] += 1
+    return result
+
+
+def cache_stats():
+    return {'entries': len(_state['results']), 'hits': _state['hits'], 'misses': _state['misses']}
+
+
+def clear():
+    with _lock:
+        _state['results'] = {}
+        _state['hits'] = _state['misses'] = 0
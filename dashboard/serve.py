@@ -0,0 +1,332 @@
+"""
+PAN HANDLERS DASHBOARD — MULTI-WORKER LAUNCHER
+
+Runs N Streamlit workers behind a local reverse proxy with sticky
+sessions, so concurrent reruns are spread over N interpreters instead of
+queueing on one GIL.
+
+- The federation snapshot is compiled once, by the launcher, into
+  PATHS['compiled_snapshot']. Workers start with
+  PAN_HANDLERS_SNAPSHOT_READONLY=1, map that file read-only and seed their
+  data layer from it (compiled_snapshot.warm_start), so no worker parses
+  the JSON inputs at start-up. Only the file's bytes are shared (once,
+  in the page cache); each worker unmarshals and holds its own frozen
+  copy of the data. The launcher rechecks the sources every
+  SETTINGS['serve_snapshot_interval'] seconds and recompiles on change.
+- The proxy reads only the request head of each client connection. A
+  `ph_worker` cookie pins a browser to one worker (its websocket, session
+  state and widget callbacks live there); new browsers go to the healthy
+  worker with the fewest open connections. After the head, bytes are
+  spliced both ways, so websocket upgrades pass through untouched.
+- Every SETTINGS['serve_health_interval'] seconds each worker's own
+  /_stcore/health endpoint is probed with url_health's client. Dead
+  workers are restarted; unhealthy ones get no new browsers, and a
+  browser pinned to one is moved.
+- GET /_ph/health lists every worker as JSON; /_ph/health/<i> reports
+  worker i and answers 503 while it is unhealthy, for external checks.
+
+Usage:
+    python serve.py                         # SETTINGS['serve_workers'] workers on 127.0.0.1:8504
+    python serve.py --workers 4 --port 8080
+    python serve.py --host 0.0.0.0          # expose the proxy on every interface
+    curl http://localhost:8504/_ph/health
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from http.cookies import SimpleCookie
+from pathlib import Path
+
+from config import PATHS, SETTINGS
+import compiled_snapshot
+from url_health import HttpClient
+
+COOKIE = "ph_worker"
+HEALTH_PREFIX = "/_ph/health"
+MAX_HEAD = 64 * 1024
+MIN_RESTART_GAP = 10.0      # seconds; a worker that keeps dying is restarted at most this often
+
+DASHBOARD_DIR = Path(__file__).parent.resolve()
+
+
+class _Worker:
+    """One Streamlit process and what the proxy knows about it."""
+    __slots__ = ('index', 'port', 'process', 'healthy', 'status', 'latency', 'checked_at',
+                 'connections', 'restarts', 'started_at')
+
+    def __init__(self, index, port):
+        self.index = index
+        self.port = port
+        self.process = None
+        self.healthy = False
+        self.status = "starting"
+        self.latency = None
+        self.checked_at = None
+        self.connections = 0
+        self.restarts = -1          # the first start is not a restart
+        self.started_at = 0.0
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def as_dict(self):
+        return {
+            'index': self.index, 'port': self.port,
+            'pid': self.process.pid if self.process else None,
+            'alive': self.alive, 'healthy': self.healthy, 'status': self.status,
+            'latency': self.latency, 'checked_at': self.checked_at,
+            'connections': self.connections, 'restarts': max(self.restarts, 0),
+        }
+
+
+# ========== WORKERS ==========
+
+def _worker_command(port):
+    return [
+        sys.executable, "-m", "streamlit", "run", str(DASHBOARD_DIR / "app.py"),
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.headless", "true",
+        "--browser.gatherUsageStats", "false",
+    ]
+
+
+def _start(worker):
+    env = dict(os.environ, PAN_HANDLERS_SNAPSHOT_READONLY="1", PAN_HANDLERS_WORKER=str(worker.index))
+    worker.process = subprocess.Popen(_worker_command(worker.port), cwd=DASHBOARD_DIR, env=env)
+    worker.started_at = time.monotonic()
+    worker.restarts += 1
+    worker.healthy = False
+    worker.status = "starting"
+
+
+def _stop_all(workers, timeout=10.0):
+    for worker in workers:
+        if worker.alive:
+            worker.process.terminate()
+    deadline = time.monotonic() + timeout
+    for worker in workers:
+        if worker.process is None:
+            continue
+        try:
+            worker.process.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            worker.process.kill()
+
+
+def refresh_snapshot():
+    """Recompile the shared snapshot if any source changed; returns True if it was rewritten."""
+    payload = compiled_snapshot.load_compiled()
+    current, stale = compiled_snapshot.validate(payload) if payload is not None else ({}, None)
+    if payload is not None and not stale:
+        return False
+    compiled_snapshot.compile_snapshot(reuse=current)
+    return True
+
+
+# ========== PROXY ==========
+
+class Launcher:
+    """Supervises the workers and proxies browser connections to them."""
+
+    def __init__(self, workers, port, host):
+        self.workers = [_Worker(i, SETTINGS['serve_worker_port'] + i) for i in range(workers)]
+        self.port = port
+        self.host = host
+        self.snapshot_built_at = None
+        self._client = None
+
+    # --- routing ---
+    def _pinned(self, head):
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "cookie":
+                morsel = SimpleCookie(value).get(COOKIE)
+                if morsel and morsel.value.isdigit() and int(morsel.value) < len(self.workers):
+                    return self.workers[int(morsel.value)]
+        return None
+
+    def _pick(self):
+        ready = [w for w in self.workers if w.healthy and w.alive]
+        return min(ready, key=lambda w: w.connections) if ready else None
+
+    # --- health endpoint ---
+    def _health(self, path):
+        rest = path[len(HEALTH_PREFIX):].strip("/")
+        if not rest:
+            body = {
+                'workers': [w.as_dict() for w in self.workers],
+                'snapshot': {'path': str(PATHS['compiled_snapshot']), 'built_at': self.snapshot_built_at},
+            }
+            return 200, body
+        if rest.isdigit() and int(rest) < len(self.workers):
+            worker = self.workers[int(rest)]
+            return (200 if worker.healthy else 503), worker.as_dict()
+        return 404, {'error': f"no worker {rest}"}
+
+    @staticmethod
+    async def _respond(writer, status, body, content_type="application/json"):
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 502: "Bad Gateway",
+                  503: "Service Unavailable"}.get(status, "")
+        payload = (json.dumps(body, indent=1) if content_type == "application/json" else body).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\nCache-Control: no-store\r\nConnection: close\r\n\r\n".encode("latin-1")
+            + payload
+        )
+        await writer.drain()
+
+    # --- splicing ---
+    @staticmethod
+    async def _pipe(reader, writer):
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        try:
+            path = head.split(b" ", 2)[1].decode("latin-1")
+        except IndexError:
+            await self._respond(writer, 400, {'error': "malformed request"})
+            writer.close()
+            return
+        if path.split("?", 1)[0].startswith(HEALTH_PREFIX):
+            await self._respond(writer, *self._health(path.split("?", 1)[0]))
+            writer.close()
+            return
+
+        worker = self._pinned(head)
+        pin = worker is None or not (worker.healthy and worker.alive)
+        if pin:
+            worker = self._pick()
+        if worker is None:
+            await self._respond(writer, 503, "No dashboard worker is ready yet; retry shortly.\n", "text/plain")
+            writer.close()
+            return
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            worker.healthy = False
+            await self._respond(writer, 502, f"Worker {worker.index} is unreachable.\n", "text/plain")
+            writer.close()
+            return
+
+        worker.connections += 1
+        try:
+            upstream_writer.write(head)
+            # Request bodies flow while the response head is awaited
+            to_worker = asyncio.ensure_future(self._pipe(reader, upstream_writer))
+            if pin:
+                try:
+                    response_head = await upstream_reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    to_worker.cancel()
+                    writer.close()
+                    return
+                cookie = f"Set-Cookie: {COOKIE}={worker.index}; Path=/; HttpOnly; SameSite=Lax\r\n"
+                writer.write(response_head[:-2] + cookie.encode("latin-1") + b"\r\n")
+            await asyncio.gather(to_worker, self._pipe(upstream_reader, writer))
+        finally:
+            worker.connections -= 1
+            upstream_writer.close()
+
+    # --- supervision ---
+    async def _check(self, worker):
+        if not worker.alive:
+            gap = time.monotonic() - worker.started_at
+            if gap < MIN_RESTART_GAP:
+                worker.healthy, worker.status = False, "exited; restart pending"
+                return
+            _start(worker)
+            return
+        result = await self._client.probe(f"http://127.0.0.1:{worker.port}/_stcore/health")
+        worker.healthy = result.ok
+        worker.status = "ok" if result.ok else (result.error or f"HTTP {result.status}")
+        worker.latency = round(result.latency, 4)
+        worker.checked_at = result.checked_at
+
+    async def _supervise(self):
+        while True:
+            await asyncio.gather(*(self._check(w) for w in self.workers))
+            # Poll faster while any worker is not (yet) healthy
+            waiting = any(not w.healthy for w in self.workers)
+            await asyncio.sleep(0.5 if waiting else SETTINGS['serve_health_interval'])
+
+    async def _watch_snapshot(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(SETTINGS['serve_snapshot_interval'])
+            try:
+                if await loop.run_in_executor(None, refresh_snapshot):
+                    self.snapshot_built_at = time.time()
+            except OSError as e:
+                print(f"[serve] could not recompile snapshot: {e}", file=sys.stderr)
+
+    async def run(self):
+        refresh_snapshot()
+        self.snapshot_built_at = time.time()
+        for worker in self.workers:
+            _start(worker)
+
+        self._client = HttpClient(timeout=2.0, per_host=1, keepalive=SETTINGS['serve_health_interval'] * 2)
+        server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEAD)
+        print(f"[serve] {len(self.workers)} workers on ports "
+              f"{self.workers[0].port}-{self.workers[-1].port}; proxy on http://{self.host}:{self.port}")
+        tasks = [asyncio.ensure_future(self._supervise()), asyncio.ensure_future(self._watch_snapshot())]
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._client.close()
+
+
+# ========== CLI ==========
+
+def main(argv=None):
+    default_workers = SETTINGS['serve_workers'] or min(4, os.cpu_count() or 1)
+    parser = argparse.ArgumentParser(description="Serve the dashboard from several Streamlit workers.")
+    parser.add_argument("--workers", type=int, default=default_workers)
+    parser.add_argument("--port", type=int, default=SETTINGS['serve_port'], help="proxy port browsers connect to")
+    parser.add_argument("--host", default=SETTINGS['serve_host'], help="proxy bind address (0.0.0.0 for every interface)")
+    args = parser.parse_args(argv)
+
+    launcher = Launcher(max(1, args.workers), args.port, args.host)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)   # stop workers on SIGTERM too
+    try:
+        asyncio.run(launcher.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _stop_all(launcher.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,714 @@
+"""
+PAN HANDLERS DASHBOARD — STATIC EXPORT
+
+Pre-renders the dashboard to plain HTML for anonymous viewers: every page
+in the app.py registry, plus one page per flagship project and per
+repository manifest. The output directory can be served by any file
+server with no Python per request; Streamlit is only needed for
+interactive sessions.
+
+Pages are rendered by their normal render() against a small recording
+stand-in for the `streamlit` module, installed in this process before any
+page is imported (so the export must run in its own process). Markdown
+becomes HTML, columns and expanders become flex rows and <details>,
+widgets take their default values, and listings are exported unpaged.
+
+- The theme stylesheet (base + theme + static layout) is written once as
+  assets/<name>-<digest>.css and linked from every page; page-scoped
+  sheets get their own hashed file. A name changes only when its CSS
+  does, so browsers can cache assets indefinitely.
+- Every output file has a key over its inputs: the dashboard code, the
+  stylesheet and the data it shows (PAGE_INPUTS for registry pages, the
+  record itself for detail pages). Keys are kept in .build.json; a rerun
+  renders only files whose key changed and deletes files that are no
+  longer produced.
+
+Usage:
+    python static_export.py                       # -> PATHS['static_export']
+    python static_export.py --out site/ --theme matrix
+    python static_export.py --force               # rebuild everything
+    python -m http.server -d .cache/static 8080
+"""
+
+import argparse
+import functools
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import textwrap
+import types
+from collections.abc import Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+from config import PATHS, SETTINGS
+
+EXPORT_FORMAT = 1
+BUILD_FILE = ".build.json"
+ASSET_DIR = "assets"
+
+# Data each registry page shows, by slug. Pages not listed depend on every group.
+PAGE_INPUTS = {
+    'overview': ('projects', 'manifests', 'nyquist', 'paths'),
+    'federation_health': ('manifests', 'nyquist', 'paths'),
+    'project_tracker': ('projects',),
+    'nyquist_tunnel': ('nyquist', 'paths'),
+    'whitepaper': ('nyquist',),
+    'online_voting': (),
+    'nursing': (),
+    'gene_therapy': (),
+    'modern_slavery': (),
+    'abi': (),
+    'dcia': (),
+    'about': (),
+}
+INPUT_GROUPS = ('projects', 'manifests', 'nyquist', 'paths')
+
+STATIC_CSS = """
+body { margin: 0; }
+.static-export { display: flex; min-height: 100vh; }
+.static-nav { width: 15rem; flex: none; padding: 1.5rem 1rem; border-right: 1px solid rgba(128,128,128,0.3); }
+.static-nav h3 { margin: 0 0 0.2em 0; }
+.static-nav h4 { margin: 1.2em 0 0.3em 0; font-size: 0.75em; text-transform: uppercase; letter-spacing: 0.05em; opacity: 0.7; }
+.static-nav a { display: block; padding: 0.3em 0.5em; border-radius: 6px; text-decoration: none; }
+.static-nav a.current { font-weight: bold; background: rgba(128,128,128,0.15); }
+.static-main { flex: 1; min-width: 0; max-width: 80rem; padding: 2rem 3rem; }
+.st-columns { display: flex; flex-wrap: wrap; gap: 1rem; }
+.st-column { min-width: 10rem; }
+.st-expander { border: 1px solid rgba(128,128,128,0.3); border-radius: 8px; padding: 0.5em 1em; margin: 0.5em 0; }
+.st-expander > summary { cursor: pointer; font-weight: bold; }
+.st-metric-label { font-size: 0.85em; opacity: 0.8; }
+.st-metric-value { font-size: 1.8em; font-weight: bold; }
+.st-metric-delta { font-size: 0.85em; color: #2a9d8f; }
+.st-caption { font-size: 0.85em; opacity: 0.7; }
+.st-alert { border-radius: 8px; padding: 0.8em 1em; margin: 0.5em 0; }
+.st-info { background: rgba(28,131,225,0.1); }
+.st-success { background: rgba(0,255,65,0.1); }
+.st-warning { background: rgba(255,193,7,0.15); }
+.st-error { background: rgba(231,76,60,0.12); }
+.static-footer { margin-top: 3em; font-size: 0.8em; opacity: 0.6; text-align: center; }
+"""
+
+
+class ExportResult(NamedTuple):
+    """What one export run did (paths relative to the output directory)."""
+    written: list
+    unchanged: list
+    removed: list
+    errors: list        # (path, message) for pages whose render raised
+
+
+# ========== MARKDOWN ==========
+# The subset the pages use: headings, rules, lists, quotes, fenced code,
+# bold / italic / code / links, with raw HTML blocks passed through as
+# st.markdown(unsafe_allow_html=True) does.
+
+_HEADING = re.compile(r"(#{1,6})\s+(.*?)\s*#*$")
+_RULE = re.compile(r"(?:-{3,}|\*{3,}|_{3,})$")
+_BULLET = re.compile(r"[-*+]\s+(.*)$")
+_ORDERED = re.compile(r"\d+[.)]\s+(.*)$")
+_CODE_SPAN = re.compile(r"`([^`]+)`")
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_BOLD = re.compile(r"\*\*(.+?)\*\*|(?<!\w)__(.+?)__(?!\w)")
+_ITALIC = re.compile(r"(?<![\w*])\*(?![\s*])(.+?)(?<![\s*])\*(?![\w*])|(?<![\w_])_(?![\s_])(.+?)(?<![\s_])_(?![\w_])")
+_STASHED = re.compile("\x00(\\d+)\x00")
+
+
+def inline_markdown(text):
+    """Inline markdown of one paragraph; code spans are escaped, everything else passes through."""
+    codes = []
+
+    def stash(match):
+        codes.append(f"<code>{html.escape(match.group(1), quote=False)}</code>")
+        return f"\x00{len(codes) - 1}\x00"
+
+    text = _CODE_SPAN.sub(stash, text)
+    text = _LINK.sub(r'<a href="\2">\1</a>', text)
+    text = _BOLD.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = _ITALIC.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    return _STASHED.sub(lambda m: codes[int(m.group(1))], text)
+
+
+def markdown_to_html(text):
+    """Block-level conversion of dedented markdown."""
+    blocks, paragraph, items = [], [], []
+    list_tag = None
+    lines = text.split("\n")
+
+    def close_paragraph():
+        if paragraph:
+            blocks.append(f"<p>{inline_markdown(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            blocks.append(f"<{list_tag}>{''.join(f'<li>{inline_markdown(i)}</li>' for i in items)}</{list_tag}>")
+            items.clear()
+            list_tag = None
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        i += 1
+
+        if not stripped:
+            close_paragraph()
+            close_list()
+        elif stripped.startswith("```"):
+            close_paragraph()
+            close_list()
+            code = []
+            while i < len(lines) and not lines[i].strip().startswith("```"):
+                code.append(lines[i])
+                i += 1
+            i += 1
+            blocks.append(f"<pre><code>{html.escape(chr(10).join(code), quote=False)}</code></pre>")
+        elif stripped.startswith("<") and not paragraph:
+            # HTML block: runs to the next blank line, untouched
+            close_list()
+            raw = [line]
+            while i < len(lines) and lines[i].strip():
+                raw.append(lines[i])
+                i += 1
+            blocks.append("\n".join(raw))
+        elif _RULE.match(stripped):
+            close_paragraph()
+            close_list()
+            blocks.append("<hr>")
+        elif _HEADING.match(stripped):
+            close_paragraph()
+            close_list()
+            hashes, title = _HEADING.match(stripped).groups()
+            blocks.append(f"<h{len(hashes)}>{inline_markdown(title)}</h{len(hashes)}>")
+        elif stripped.startswith(">"):
+            close_paragraph()
+            close_list()
+            quoted = [stripped[1:].lstrip()]
+            while i < len(lines) and lines[i].strip().startswith(">"):
+                quoted.append(lines[i].strip()[1:].lstrip())
+                i += 1
+            blocks.append(f"<blockquote>{markdown_to_html(chr(10).join(quoted))}</blockquote>")
+        elif _BULLET.match(stripped) or _ORDERED.match(stripped):
+            close_paragraph()
+            tag = "ul" if _BULLET.match(stripped) else "ol"
+            if list_tag != tag:
+                close_list()
+                list_tag = tag
+            items.append((_BULLET.match(stripped) or _ORDERED.match(stripped)).group(1))
+        elif list_tag and line[:1].isspace():
+            items[-1] += " " + stripped     # continuation of the last item
+        else:
+            close_list()
+            paragraph.append(stripped)
+
+    close_paragraph()
+    close_list()
+    return "\n".join(blocks)
+
+
+# ========== STREAMLIT STAND-IN ==========
+
+class UnsupportedStreamlitAPI(AttributeError):
+    """A page used a streamlit API the recorder does not implement."""
+
+
+def _unsupported(name):
+    """
+    Fail the page's export on any streamlit name outside _API, rather than
+    exporting it with an element silently missing. The page is reported in
+    ExportResult.errors and the CLI exits 1. Being an AttributeError,
+    feature checks such as getattr(st, 'html', None) still fall back.
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    raise UnsupportedStreamlitAPI(f"static export does not implement st.{name}; add it to static_export._Recorder")
+
+class _SessionState(dict):
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+class _Block:
+    """A recorded container: the page body, a column, an expander or the (discarded) sidebar."""
+
+    def __init__(self, recorder, kind, label="", width=1, expanded=False):
+        self._recorder = recorder
+        self.kind = kind
+        self.label = label
+        self.width = width
+        self.expanded = expanded
+        self.children = []      # HTML strings and nested blocks
+
+    def __enter__(self):
+        self._recorder.stack.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        self._recorder.stack.pop()
+
+    def __getattr__(self, name):
+        # col.markdown(...) / st.sidebar.expander(...) write into this block
+        if name not in _API:
+            _unsupported(name)
+        function = getattr(self._recorder, name)
+
+        def within(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+        return within
+
+    def to_html(self):
+        inner = "".join(c if isinstance(c, str) else c.to_html() for c in self.children)
+        if self.kind == "columns":
+            return f'<div class="st-columns">{inner}</div>'
+        if self.kind == "column":
+            return f'<div class="st-column" style="flex: {self.width:g} 1 0;">{inner}</div>'
+        if self.kind == "expander":
+            return (f'<details class="st-expander"{" open" if self.expanded else ""}>'
+                    f'<summary>{inline_markdown(html.escape(self.label, quote=False))}</summary>{inner}</details>')
+        return inner
+
+
+_INLINE_SHEET = re.compile(r'<style data-sheet="([^"]+)">(.*)</style>', re.S)
+
+
+class _Recorder:
+    """
+    The streamlit API subset the pages call. Each element is recorded as
+    one <div class="st-el">, so an unbalanced tag in one st.markdown call is
+    closed at its own element, as in the live app.
+    """
+
+    def __init__(self):
+        self.session_state = _SessionState()
+        self.query_params = {}
+        self.sidebar = _Block(self, "sidebar")   # navigation is rebuilt by the export; nothing kept
+        self.reset()
+
+    def reset(self, state=None):
+        self.root = _Block(self, "main")
+        self.stack = [self.root]
+        self.sheets = []        # (name, css) requested through css_assets' inline delivery
+        self.session_state.clear()
+        self.session_state.update(state or {})
+
+    def _emit(self, body):
+        if self.stack[-1] is not self.sidebar:
+            self.stack[-1].children.append(f'<div class="st-el">{body}</div>')
+
+    # --- text elements ---
+    def markdown(self, body="", unsafe_allow_html=False, **_):
+        text = textwrap.dedent(str(body)).strip()
+        sheet = _INLINE_SHEET.fullmatch(text)
+        if sheet:
+            self.sheets.append(sheet.groups())
+            return
+        if not unsafe_allow_html:
+            text = text.replace("&", "&amp;").replace("<", "&lt;")
+        self._emit(markdown_to_html(text))
+
+    def write(self, *args, **_):
+        for arg in args:
+            self.markdown(str(arg))
+
+    def caption(self, body="", unsafe_allow_html=False, **_):
+        self._emit(f'<div class="st-caption">{inline_markdown(str(body))}</div>')
+
+    def _alert(self, kind, body):
+        self._emit(f'<div class="st-alert st-{kind}">{markdown_to_html(textwrap.dedent(str(body)).strip())}</div>')
+
+    def info(self, body="", **_):
+        self._alert("info", body)
+
+    def success(self, body="", **_):
+        self._alert("success", body)
+
+    def warning(self, body="", **_):
+        self._alert("warning", body)
+
+    def error(self, body="", **_):
+        self._alert("error", body)
+
+    def metric(self, label, value, delta=None, **_):
+        delta_html = f'<div class="st-metric-delta">{html.escape(str(delta))}</div>' if delta is not None else ""
+        self._emit(
+            f'<div class="st-metric"><div class="st-metric-label">{inline_markdown(str(label))}</div>'
+            f'<div class="st-metric-value">{html.escape(str(value))}</div>{delta_html}</div>'
+        )
+
+    def divider(self):
+        self._emit("<hr>")
+
+    # --- layout ---
+    def columns(self, spec, **_):
+        widths = [1] * spec if isinstance(spec, int) else list(spec)
+        row = _Block(self, "columns")
+        if self.stack[-1] is not self.sidebar:
+            self.stack[-1].children.append(row)
+        row.children = [_Block(self, "column", width=w) for w in widths]
+        return list(row.children)
+
+    def expander(self, label, expanded=False, **_):
+        block = _Block(self, "expander", label=label, expanded=expanded)
+        if self.stack[-1] is not self.sidebar:
+            self.stack[-1].children.append(block)
+        return block
+
+    # --- widgets: default values, nothing emitted ---
+    def selectbox(self, label, options, index=0, key=None, **_):
+        options = list(options)
+        value = self.session_state.get(key) if key else None
+        if value not in options:
+            value = options[index] if options and index is not None else None
+        if key:
+            self.session_state[key] = value
+        return value
+
+    def text_input(self, label, value="", key=None, **_):
+        if key:
+            return self.session_state.setdefault(key, value)
+        return value
+
+    def number_input(self, label, min_value=None, max_value=None, value=None, step=None, key=None, **_):
+        default = value if value is not None else (min_value if min_value is not None else 0)
+        if key:
+            return self.session_state.setdefault(key, default)
+        return default
+
+    def button(self, *args, **kwargs):
+        return False
+
+    def download_button(self, *args, **kwargs):
+        return False
+
+    # --- app plumbing ---
+    def set_page_config(self, **_):
+        pass
+
+    def cache_resource(self, func=None, **_):
+        if func is None:
+            return self.cache_resource
+        wrapper = functools.lru_cache(maxsize=None)(func)
+        wrapper.clear = wrapper.cache_clear
+        return wrapper
+
+    cache_data = cache_resource
+
+
+_API = (
+    'markdown', 'write', 'caption', 'info', 'success', 'warning', 'error', 'metric', 'divider',
+    'columns', 'expander', 'selectbox', 'text_input', 'number_input', 'button', 'download_button',
+    'set_page_config', 'cache_resource', 'cache_data',
+)
+
+_recorder = _Recorder()
+
+
+def _install_streamlit():
+    """Put the recorder in sys.modules as `streamlit` (and streamlit.components.v1)."""
+    installed = sys.modules.get("streamlit")
+    if installed is not None:
+        if getattr(installed, '__static_export__', False):
+            return
+        raise RuntimeError("static export needs its own process: streamlit is already imported")
+
+    module = types.ModuleType("streamlit")
+    module.__static_export__ = True
+    for name in _API:
+        setattr(module, name, getattr(_recorder, name))
+    module.session_state = _recorder.session_state
+    module.query_params = _recorder.query_params
+    module.sidebar = _recorder.sidebar
+    module.__getattr__ = _unsupported
+
+    # Components cannot be rendered into a static page: any use fails the export
+    components = types.ModuleType("streamlit.components")
+    v1 = types.ModuleType("streamlit.components.v1")
+    v1.__getattr__ = lambda name: _unsupported(f"components.v1.{name}" if not name.startswith("__") else name)
+    components.v1 = v1
+    module.components = components
+    sys.modules.update({"streamlit": module, "streamlit.components": components, "streamlit.components.v1": v1})
+
+
+# ========== INPUT KEYS ==========
+
+def _plain(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _digest(*parts):
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=_plain)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _code_digest():
+    """Hash of every dashboard module: any code change re-renders everything."""
+    h = hashlib.sha256(f"format {EXPORT_FORMAT}".encode())
+    root = PATHS['dashboard_dir']
+    for path in sorted(root.rglob("*.py")):
+        if ".cache" in path.parts or "__pycache__" in path.parts:
+            continue
+        h.update(str(path.relative_to(root)).encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _group_digests(snapshot):
+    import path_health
+    from armada_index import get_armada_index
+
+    armada = get_armada_index()
+    return {
+        'projects': _digest(snapshot.projects, snapshot.file_errors.get('projects_file')),
+        'manifests': _digest(snapshot.manifests, snapshot.manifest_report.issues),
+        'nyquist': _digest(snapshot.nyquist_status, snapshot.publication_status,
+                           armada.run_count, armada.newest_run, sorted(armada.ships.items())),
+        'paths': _digest(sorted((key, s.exists, s.is_dir) for key, s in path_health.table().items())),
+    }
+
+
+# ========== PAGE ASSEMBLY ==========
+
+def _file_slug(text, taken):
+    base = re.sub(r"[^A-Za-z0-9._-]+", "-", text).strip("-.").lower() or "item"
+    slug, n = base, 2
+    while slug in taken:
+        slug, n = f"{base}-{n}", n + 1
+    taken.add(slug)
+    return slug
+
+
+class _Target(NamedTuple):
+    path: str           # relative to the output directory
+    title: str
+    key: str
+    render: object      # callable emitting through the recorder
+    current: str        # nav href marked as current
+
+
+def _nav_html(pages, prefix, current):
+    def link(href, label):
+        cls = ' class="current"' if href == current else ""
+        return f'<a href="{prefix}{href}"{cls}>{html.escape(label)}</a>'
+
+    parts = ['<nav class="static-nav"><h3>🍳 Pan Handlers</h3><p><em>The Back Alley</em></p>']
+    for category, entries in pages.categories():
+        parts.append(f"<h4>{html.escape(category)}</h4>" if category else "<hr>")
+        parts.extend(link(f"{entry.slug}.html", entry.label) for entry in entries)
+    parts.append("<h4>DETAILS</h4>")
+    parts.append(link("projects/index.html", "🏆 All Projects"))
+    parts.append(link("repos/index.html", "📂 All Repositories"))
+    parts.append("</nav>")
+    return "".join(parts)
+
+
+def _document(title, body, stylesheets, nav, prefix):
+    links = "".join(f'<link rel="stylesheet" href="{prefix}{ASSET_DIR}/{name}">' for name in stylesheets)
+    return (
+        '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{html.escape(title)} — Pan Handlers Dashboard</title>{links}</head>"
+        f'<body><div class="stApp static-export">{nav}<main class="static-main">{body}'
+        '<div class="static-footer">Static snapshot of the Pan Handlers dashboard</div>'
+        "</main></div></body></html>\n"
+    )
+
+
+def _asset_name(sheet):
+    return f"{sheet.name}-{sheet.digest}.css"
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _load_build(out):
+    try:
+        with open(out / BUILD_FILE, "r", encoding="utf-8") as f:
+            build = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return build.get('files', {}) if build.get('format') == EXPORT_FORMAT else {}
+
+
+# ========== EXPORT ==========
+
+def export(out=None, theme="standard", force=False):
+    """
+    Render the dashboard into `out` (default PATHS['static_export']) and
+    return an ExportResult. Only files whose input key changed are written.
+    """
+    _install_streamlit()
+    SETTINGS.update(url_probe=False, css_delivery='inline', federation_render_mode='page',
+                    page_size=sys.maxsize)
+
+    # Imported only now, so every `import streamlit` below gets the recorder
+    from app import PAGES, get_base_css, get_matrix_css, get_standard_css
+    from css_assets import build_sheet
+    from router import DEFAULT_PAGE
+    from utils import load_snapshot, get_status_badge
+
+    out = Path(out or PATHS['static_export'])
+    matrix_mode = theme == "matrix"
+    theme_sheet = build_sheet(
+        f"static-{theme}", get_base_css(),
+        get_matrix_css() if matrix_mode else get_standard_css(), STATIC_CSS,
+    )
+
+    _recorder.reset()
+    snapshot = load_snapshot()      # load errors go to the (discarded) recorder
+    state = {'snapshot': snapshot, 'snapshot_epoch': snapshot.version, 'matrix_mode': matrix_mode}
+    groups = _group_digests(snapshot)
+    code = _code_digest()
+
+    def key(*parts):
+        return _digest(code, theme_sheet.digest, *parts)
+
+    targets = []
+    for entry in PAGES.entries():
+        inputs = PAGE_INPUTS.get(entry.slug, INPUT_GROUPS)
+        targets.append(_Target(
+            f"{entry.slug}.html", entry.label,
+            key('page', entry.slug, [groups[g] for g in inputs]),
+            lambda label=entry.label: PAGES.load(label).render(),
+            f"{entry.slug}.html",
+        ))
+
+    # Detail views reuse the live pages' rendering
+    from pages.project_tracker import render_project_detail
+    from pages.federation_health import _repo_details_html, _repo_checks
+
+    taken, project_links = set(), []
+    for project in snapshot.project_models:
+        path = f"projects/{_file_slug(project.id, taken)}.html"
+        project_links.append((path, project.title, project.status))
+        targets.append(_Target(path, project.title, key('project', project.raw),
+                               lambda p=project: render_project_detail(p), "projects/index.html"))
+
+    taken, repo_links = set(), []
+    for manifest in snapshot.manifest_models:
+        path = f"repos/{_file_slug(manifest.repo, taken)}.html"
+        repo_links.append((path, manifest.display_name, manifest.status))
+        targets.append(_Target(
+            path, manifest.display_name, key('repo', manifest.raw),
+            lambda m=manifest: _recorder.markdown(
+                _repo_details_html(m, _repo_checks(m, {}), expanded=True), unsafe_allow_html=True),
+            "repos/index.html",
+        ))
+
+    def index(title, links):
+        def render():
+            _recorder.markdown(f'<div class="dashboard-title">{title}</div>', unsafe_allow_html=True)
+            rows = "".join(
+                f'<li><a href="../{path}">{html.escape(name)}</a> {get_status_badge(status)}</li>'
+                for path, name, status in links
+            )
+            _recorder.markdown(f"<ul>{rows}</ul>", unsafe_allow_html=True)
+        return render
+
+    targets.append(_Target("projects/index.html", "Flagship Projects", key('index', project_links),
+                           index("🏆 Flagship Projects", project_links), "projects/index.html"))
+    targets.append(_Target("repos/index.html", "Repositories", key('index', repo_links),
+                           index("📂 Repositories", repo_links), "repos/index.html"))
+
+    previous = {} if force else _load_build(out)
+    files, written, unchanged, errors = {}, [], [], []
+    theme_asset = _asset_name(theme_sheet)
+    assets = {theme_asset: theme_sheet.css}
+
+    for target in targets:
+        before = previous.get(target.path)
+        if before and before['key'] == target.key and (out / target.path).exists():
+            files[target.path] = before
+            unchanged.append(target.path)
+            continue
+
+        _recorder.reset(state)
+        try:
+            target.render()
+        except Exception as e:
+            errors.append((target.path, f"{type(e).__name__}: {e}"))
+            continue
+
+        stylesheets = [theme_asset]
+        for name, css in _recorder.sheets:
+            page_sheet = build_sheet(name, css)
+            assets[_asset_name(page_sheet)] = page_sheet.css
+            stylesheets.append(_asset_name(page_sheet))
+
+        prefix = "../" * target.path.count("/")
+        nav = _nav_html(PAGES, prefix, target.current)
+        _write(out / target.path, _document(target.title, _recorder.root.to_html(), stylesheets, nav, prefix))
+        files[target.path] = {'key': target.key, 'assets': stylesheets}
+        written.append(target.path)
+
+    # Content-hashed names: an existing asset file never needs rewriting
+    for name, css in assets.items():
+        if not (out / ASSET_DIR / name).exists():
+            _write(out / ASSET_DIR / name, css)
+
+    landing = f"{PAGES.slug_for(DEFAULT_PAGE)}.html"
+    _write(out / "index.html",
+           f'<!DOCTYPE html>\n<meta http-equiv="refresh" content="0; url={landing}"><a href="{landing}">Pan Handlers Dashboard</a>\n')
+
+    # A page that failed keeps its last good file and is retried next run
+    for path, _ in errors:
+        if path in previous:
+            files[path] = {'key': None, 'assets': previous[path]['assets']}
+
+    # Drop pages nothing produces any more, then assets no page links
+    removed = []
+    for path in previous:
+        if path not in files:
+            (out / path).unlink(missing_ok=True)
+            removed.append(path)
+    referenced = {name for entry in files.values() for name in entry['assets']}
+    asset_dir = out / ASSET_DIR
+    if asset_dir.is_dir():
+        for asset in asset_dir.glob("*.css"):
+            if asset.name not in referenced:
+                asset.unlink()
+                removed.append(f"{ASSET_DIR}/{asset.name}")
+
+    _write(out / BUILD_FILE, json.dumps({'format': EXPORT_FORMAT, 'theme': theme, 'files': files}, indent=1))
+    return ExportResult(written=written, unchanged=unchanged, removed=removed, errors=errors)
+
+
+# ========== CLI ==========
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the dashboard as static HTML.")
+    parser.add_argument("--out", default=str(PATHS['static_export']), help="output directory")
+    parser.add_argument("--theme", choices=("standard", "matrix"), default="standard")
+    parser.add_argument("--force", action="store_true", help="ignore the previous build and render everything")
+    args = parser.parse_args(argv)
+
+    result = export(args.out, theme=args.theme, force=args.force)
+    for path, message in result.errors:
+        print(f"ERROR {path}: {message}", file=sys.stderr)
+    print(f"{len(result.written)} written, {len(result.unchanged)} unchanged, "
+          f"{len(result.removed)} removed -> {args.out}")
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+PAN HANDLERS DASHBOARD — SYNTHETIC FEDERATION GENERATOR
+
+Writes a reproducible, realistically shaped federation for benchmarks and
+load tests. The directory layout mirrors a real checkout, so pointing
+PAN_HANDLERS_ROOT at `<out>/Pan_Handlers` makes every config.PATHS entry
+resolve inside it:
+
+    <out>/
+    ├── NYQUIST_STATUS.json
+    ├── publication_status.json
+    ├── personas/  docs/
+    ├── experiments/temporal_stability/S7_ARMADA/armada_results/run_*.json
+    └── Pan_Handlers/
+        ├── projects.json               # flagship_projects with milestones, nyquist_contribution
+        ├── manifests/*.json            # the fields the pages read, some deliberately missing
+        ├── data/glossary.md            # "### Term" glossary
+        └── circle/
+            ├── IDEA_TRAILS/IT-*.md     # circle-style workbooks
+            └── SYNC_OUT/GLOSSARY.md    # "- **Term** — definition" glossary
+
+Every section draws from its own seeded random stream, so e.g. adding armada
+runs does not reshuffle the manifests, and the same spec always produces
+byte-identical files. File mtimes are fixed too (the armada index orders runs
+by mtime).
+
+Usage:
+    from synthetic import FederationSpec, generate
+    pan_root = generate("/tmp/fed", FederationSpec(manifests=1000, projects=1000, seed=7))
+
+    python synthetic.py /tmp/fed --manifests 10000 --projects 10000 --armada-runs 500 \
+        --workbooks 200 --glossary-terms 2000 --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+EPOCH = 1735689600  # 2025-01-01T00:00:00Z; every generated timestamp is offset from it
+
+
+class FederationSpec(NamedTuple):
+    """Sizes and seed of a synthetic federation."""
+    manifests: int = 10
+    projects: int = 7
+    armada_runs: int = 0
+    ships: int = 29
+    workbooks: int = 0
+    glossary_terms: int = 0
+    seed: int = 0
+
+
+# ========== VOCABULARY ==========
+
+_STATUSES = (('Active', 40), ('Incubating', 20), ('Concept', 15), ('In Progress', 10),
+             ('In Preparation', 5), ('Complete', 6), ('Archived', 4))
+_TRACKS = ('Research / Theory', 'Education / Healthcare', 'Governance / Democracy',
+           'Intelligence / Governance', 'Biomedical Research', 'Justice / Social Systems')
+_TAGS = ('epistemology', 'methodology', 'alignment', 'coherence', 'governance', 'validation',
+         'meta-cognition', 'identity', 'compression', 'temporal-stability', 'democracy', 'voting',
+         'healthcare', 'nursing', 'biomedical', 'gene-therapy', 'justice', 'prison-reform',
+         'intelligence', 'transparency', 'art', 'ritual', 'education', 'research')
+_ADJECTIVES = ('Coherent', 'Distributed', 'Open', 'Temporal', 'Civic', 'Recursive', 'Quiet',
+               'Federated', 'Stable', 'Luminous', 'Adaptive', 'Grounded')
+_NOUNS = ('Lab', 'Studio', 'Engine', 'Observatory', 'Workshop', 'Archive', 'Forge', 'Commons',
+          'Bureau', 'Garden', 'Harbor', 'Atlas')
+_PEOPLE = ('Ziggy', 'Nova', 'Claude', 'Grant', 'Angles', 'Tom', 'Sorta', 'Kee', 'Tapioca')
+_WORDS = ('identity', 'manifold', 'drift', 'coherence', 'agency', 'faith', 'signal', 'noise',
+          'invariance', 'protocol', 'federation', 'synthesis', 'evidence', 'consent', 'archive',
+          'structure', 'transformation', 'convergence', 'method', 'prediction', 'boundary')
+_MILESTONE_MARKS = ('✅', '✅', '🟡', '⏳')
+_SHIPS = ('claude-opus', 'claude-sonnet', 'claude-haiku', 'gpt-4o', 'gpt-4o-mini', 'o1', 'o3-mini',
+          'gemini-pro', 'gemini-flash', 'grok', 'llama-70b', 'llama-8b', 'mistral-large',
+          'mixtral', 'qwen-72b', 'deepseek-v3', 'deepseek-r1', 'command-r', 'phi-4', 'gemma')
+
+
+def _rng(spec, section):
+    return random.Random(f"{spec.seed}:{section}")
+
+
+def _weighted_status(rng):
+    return rng.choices([s for s, _ in _STATUSES], weights=[w for _, w in _STATUSES])[0]
+
+
+def _sentence(rng, low=6, high=18):
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng, low=1, high=4):
+    return " ".join(_sentence(rng) for _ in range(rng.randint(low, high)))
+
+
+def _owner(rng):
+    return " + ".join(rng.sample(_PEOPLE, rng.randint(1, 3)))
+
+
+def _iso_date(timestamp):
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+def _date(rng, days=365):
+    return _iso_date(EPOCH + rng.randrange(days) * 86400)
+
+
+def _write_json(path, data, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+# ========== SECTIONS ==========
+
+def _manifest(rng, i):
+    repo = f"{rng.choice(_ADJECTIVES).lower()}-{rng.choice(_NOUNS).lower()}-{i:05d}"
+    has_url = rng.random() > 0.1
+    manifest = {
+        'repo': repo,
+        'display_name': f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {i}",
+        'owner': _owner(rng),
+        'url_repo': f"https://github.com/synthetic-federation/{repo}" if has_url else "TBD",
+        'url_dashboard': f"https://{repo}.example.org/" if rng.random() < 0.3 else "TBD",
+        'tagline': _sentence(rng, 4, 10),
+        'role': _sentence(rng, 5, 14),
+        'status': _weighted_status(rng),
+        'tags': rng.sample(_TAGS, rng.randint(1, 7)),
+        'summary': _paragraph(rng),
+        'last_updated': _date(rng),
+        'contact': {'primary': f"{rng.choice(_PEOPLE)} (Human Anchor)"},
+    }
+    # Optional fields are sometimes absent, as in real manifests
+    if rng.random() < 0.6:
+        manifest['brief'] = _sentence(rng, 8, 20)
+    if rng.random() < 0.5:
+        manifest['spec_location'] = f"docs/{repo.upper()}_SPEC.md"
+    if rng.random() < 0.3:
+        manifest['dashboard_location'] = "dashboard/app.py"
+    if rng.random() < 0.4:
+        manifest['tier'] = rng.randint(1, 3)
+    if rng.random() < 0.05:
+        del manifest['display_name']  # pages fall back to `repo`
+    return repo, manifest
+
+
+def write_manifests(pan, spec):
+    rng = _rng(spec, "manifests")
+    directory = pan / "manifests"
+    directory.mkdir(parents=True, exist_ok=True)
+    repos = []
+    for i in range(spec.manifests):
+        repo, manifest = _manifest(rng, i)
+        repos.append(repo)
+        _write_json(directory / f"{repo}.json", manifest)
+    return repos
+
+
+def write_projects(pan, spec, repos):
+    rng = _rng(spec, "projects")
+    projects = []
+    for i in range(spec.projects):
+        title = f"{rng.choice(_ADJECTIVES)} {rng.choice(_WORDS).title()} {rng.choice(_NOUNS)}"
+        projects.append({
+            'id': f"project_{i:05d}",
+            'title': title,
+            'tagline': _sentence(rng, 4, 10),
+            'status': _weighted_status(rng),
+            'owner': _owner(rng),
+            'track': rng.choice(_TRACKS),
+            'repo': rng.choice(repos) if repos else "",
+            'summary': _paragraph(rng),
+            'why_exists': _paragraph(rng, 1, 2),
+            'nyquist_contribution': [_sentence(rng, 3, 8) for _ in range(rng.randint(0, 5))],
+            'current_phase': f"Phase {rng.randint(1, 5)}: {rng.choice(_WORDS).title()}",
+            'next_action': _sentence(rng, 5, 12),
+            'vision': _sentence(rng, 8, 20),
+            'milestones': [f"{rng.choice(_MILESTONE_MARKS)} {_sentence(rng, 3, 8)}"
+                           for _ in range(rng.randint(1, 8))],
+        })
+    _write_json(pan / "projects.json", {
+        'meta': {
+            'version': "synthetic",
+            'philosophy': "A synthetic federation for benchmarks and load tests.",
+            'last_updated': _iso_date(EPOCH),
+        },
+        'flagship_projects': projects,
+        'connected_repos': repos,
+    })
+
+
+def write_nyquist(root, spec):
+    rng = _rng(spec, "nyquist")
+    for name in ("personas", "docs"):
+        (root / name).mkdir(parents=True, exist_ok=True)
+    _write_json(root / "NYQUIST_STATUS.json", {
+        'status': "synthetic",
+        'last_updated': _iso_date(EPOCH),
+        'layers': {f"S{n}": {'progress': rng.randint(0, 100)} for n in range(12)},
+    })
+    _write_json(root / "publication_status.json", {
+        'publications': {
+            'workshop': {'completion': round(rng.random(), 2)},
+            'arxiv': {'completion': round(rng.random(), 2)},
+        },
+    })
+
+
+def write_armada(root, spec):
+    rng = _rng(spec, "armada")
+    results = root / "experiments" / "temporal_stability" / "S7_ARMADA" / "armada_results"
+    results.mkdir(parents=True, exist_ok=True)
+    fleet = list(_SHIPS) + [f"ship-{n:03d}" for n in range(max(0, spec.ships - len(_SHIPS)))]
+    fleet = fleet[:spec.ships]
+    for run in range(spec.armada_runs):
+        ships = rng.sample(fleet, rng.randint(1, len(fleet))) if fleet else []
+        if run % 3 == 2:
+            # Older list-of-records layout, also accepted by the armada index
+            data = {'run_id': f"run_{run:05d}",
+                    'results': [{'model': ship, 'drift': round(rng.random(), 4)} for ship in ships]}
+        else:
+            data = {'run_id': f"run_{run:05d}",
+                    'ships': {ship: {'probes': rng.randint(1, 12), 'drift': round(rng.random(), 4)}
+                              for ship in ships}}
+        _write_json(results / f"run_{run:05d}.json", data, mtime=EPOCH + run * 3600)
+
+
+def write_workbooks(pan, spec):
+    rng = _rng(spec, "workbooks")
+    trails = pan / "circle" / "IDEA_TRAILS"
+    trails.mkdir(parents=True, exist_ok=True)
+    for n in range(spec.workbooks):
+        title = " ".join(rng.choice(_WORDS).title() for _ in range(rng.randint(3, 6)))
+        slug = title.lower().replace(" ", "_")
+        opened = _date(rng)
+        observers = ", ".join(rng.sample(_PEOPLE, 2))
+        lines = [
+            f"# IT-{n:03d} — {title}",
+            "",
+            f"**Status:** {rng.choice(('OPEN', 'DORMANT', 'CLOSED'))} · **Registry:** #{n} in `README.md` · "
+            f"**Opened:** {opened} · **Observers:** {observers}",
+            "",
+            "> **Central research question:**",
+            f"> *{_sentence(rng)}*",
+            "",
+            f"- **Seed:** *\"{_sentence(rng)}\"* (Z-DIRECT; anchor: DIG_AUX_{n:02d}, ~{opened})",
+            f"- **Introduced by:** {rng.choice(_PEOPLE)} (DIRECT)",
+            "- **Transformations:**",
+        ]
+        for _ in range(rng.randint(1, 4)):
+            lines.append(f"  - {_date(rng)}, {rng.choice(_PEOPLE)}: {_sentence(rng)} (NOVA-INTERPRETATION)")
+        lines += [
+            f"- **Unlocking distinction:** {_sentence(rng)}",
+            f"- **Unfinished (the treasure):** {_paragraph(rng, 1, 3)}",
+            f"- **Sources:** `../evidence/chat_extractions/DIG_AUX_{n:02d}_{slug}.md`",
+            "",
+            "## Notes",
+            "",
+        ]
+        lines += [_paragraph(rng, 2, 5) + "\n" for _ in range(rng.randint(1, 4))]
+        path = trails / f"IT-{n:03d}_{slug}.md"
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _terms(spec):
+    rng = _rng(spec, "glossary")
+    seen, terms = set(), []
+    while len(terms) < spec.glossary_terms:
+        term = " ".join(rng.choice(_WORDS).title() for _ in range(rng.randint(1, 3)))
+        if term in seen:
+            term = f"{term} {len(terms)}"
+        seen.add(term)
+        terms.append((term, _sentence(rng, 8, 24)))
+    return terms
+
+
+def write_glossaries(pan, spec):
+    terms = _terms(spec)
+    if not terms:
+        return
+    half = len(terms) // 2
+
+    # data/glossary.md: numbered sections of "### Term" + paragraph
+    lines = ["# 📖 Pan Handlers Glossary (synthetic)", "", "> Generated for load tests.", "", "---", ""]
+    for section, start in enumerate(range(0, half, 50), start=1):
+        lines += [f"## {section}. Section {section}", ""]
+        for term, definition in terms[start:min(start + 50, half)]:
+            lines += [f"### {term}", definition, ""]
+    (pan / "data").mkdir(parents=True, exist_ok=True)
+    (pan / "data" / "glossary.md").write_text("\n".join(lines), encoding="utf-8")
+
+    # circle/SYNC_OUT/GLOSSARY.md: "- **Term** — definition" bullets under "## Section"
+    lines = ["# 📖 Glossary — Self-Contained Definitions", "", "> Generated for load tests.", "", "---", ""]
+    for section, start in enumerate(range(half, len(terms), 50), start=1):
+        lines += [f"## Section {section}", ""]
+        for term, definition in terms[start:start + 50]:
+            lines.append(f"- **{term}** — {definition}")
+        lines.append("")
+    (pan / "circle" / "SYNC_OUT").mkdir(parents=True, exist_ok=True)
+    (pan / "circle" / "SYNC_OUT" / "GLOSSARY.md").write_text("\n".join(lines), encoding="utf-8")
+
+
+# ========== ENTRY POINTS ==========
+
+def generate(out, spec=FederationSpec()):
+    """Write the federation under `out` and return its Pan_Handlers directory."""
+    root = Path(out)
+    pan = root / "Pan_Handlers"
+    pan.mkdir(parents=True, exist_ok=True)
+    repos = write_manifests(pan, spec)
+    write_projects(pan, spec, repos)
+    write_nyquist(root, spec)
+    write_armada(root, spec)
+    write_workbooks(pan, spec)
+    write_glossaries(pan, spec)
+    return pan
+
+
+def main(argv=None):
+    defaults = FederationSpec()
+    parser = argparse.ArgumentParser(description="Generate a synthetic Pan Handlers federation.")
+    parser.add_argument("out", help="output directory (Pan_Handlers/ is created inside it)")
+    parser.add_argument("--manifests", type=int, default=defaults.manifests)
+    parser.add_argument("--projects", type=int, default=defaults.projects)
+    parser.add_argument("--armada-runs", type=int, default=defaults.armada_runs)
+    parser.add_argument("--ships", type=int, default=defaults.ships)
+    parser.add_argument("--workbooks", type=int, default=defaults.workbooks)
+    parser.add_argument("--glossary-terms", type=int, default=defaults.glossary_terms)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+
+    spec = FederationSpec(
+        manifests=args.manifests, projects=args.projects, armada_runs=args.armada_runs,
+        ships=args.ships, workbooks=args.workbooks, glossary_terms=args.glossary_terms, seed=args.seed,
+    )
+    pan = generate(args.out, spec)
+    print(f"Wrote {spec} to {pan}")
+    print(f"Run against it with: PAN_HANDLERS_ROOT={pan} streamlit run app.py")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Shared setup for the dashboard test suite.
+
+Dashboard modules import each other by bare name and resolve PATHS from
+the environment when config is first imported, so before any test module
+loads: the dashboard directory goes on sys.path, PAN_HANDLERS_ROOT and
+PAN_HANDLERS_CACHE_DIR point at a scratch federation, and static_export's
+recorder is installed as `streamlit` (so tests run the same with or
+without streamlit installed).
+
+Usage:
+    python -m pytest dashboard/tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+DASHBOARD_DIR = Path(__file__).resolve().parent.parent
+SCRATCH = Path(tempfile.mkdtemp(prefix="pan-handlers-tests-"))
+FEDERATION = SCRATCH / "Nyquist" / "Pan_Handlers"
+(FEDERATION / "manifests").mkdir(parents=True)
+
+os.environ['PAN_HANDLERS_ROOT'] = str(FEDERATION)
+os.environ['PAN_HANDLERS_CACHE_DIR'] = str(SCRATCH / "cache")
+sys.path.insert(0, str(DASHBOARD_DIR))
+
+import static_export  # noqa: E402  (needs the environment above)
+
+static_export._install_streamlit()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(SCRATCH, ignore_errors=True)
+
+
+@pytest.fixture
+def session_state():
+    """A fresh st.session_state for the test."""
+    import streamlit as st
+    st.session_state.clear()
+    st.query_params.clear()
+    yield st.session_state
+    st.session_state.clear()
+    st.query_params.clear()
+
+
+@pytest.fixture
+def manifests_dir():
+    """The scratch federation's manifests/ directory, emptied before the test."""
+    from config import PATHS
+    path = Path(PATHS['manifests_dir'])
+    for entry in path.iterdir():
+        entry.unlink()
+    return path
@@ -0,0 +1,101 @@
+"""data_layer sweeps: unchanged inputs reuse the snapshot, only changed manifests are re-parsed."""
+
+import json
+import os
+
+import pytest
+
+import data_layer
+
+
+def _manifest(repo, **fields):
+    return {
+        'repo': repo, 'display_name': repo.title(), 'owner': "Ziggy",
+        'url_repo': f"https://github.com/example/{repo}", 'url_dashboard': "TBD",
+        'role': "Test fixture", 'status': "Active", 'tags': ["test"],
+        'summary': "A manifest written by the test suite.", 'last_updated': "2026-01-01",
+        **fields,
+    }
+
+
+def _write(directory, repo, **fields):
+    path = directory / f"{repo}.json"
+    path.write_text(json.dumps(_manifest(repo, **fields)), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Every manifest path handed to the parser, in order."""
+    calls = []
+    parse_many = data_layer.parse_many
+
+    def recording(paths):
+        paths = list(paths)
+        calls.extend(os.path.basename(path) for path in paths)
+        return parse_many(paths)
+
+    monkeypatch.setattr(data_layer, 'parse_many', recording)
+    return calls
+
+
+def test_unchanged_sweep_reuses_snapshot(manifests_dir, parsed):
+    _write(manifests_dir, "alpha")
+    _write(manifests_dir, "beta")
+
+    first = data_layer.sweep()
+    assert [m['repo'] for m in first.manifests] == ["alpha", "beta"]
+    assert sorted(parsed) == ["alpha.json", "beta.json"]
+
+    parsed.clear()
+    assert data_layer.sweep() is first
+    assert parsed == []
+
+
+def test_changed_file_is_reparsed_alone(manifests_dir, parsed):
+    _write(manifests_dir, "alpha")
+    _write(manifests_dir, "beta")
+    first = data_layer.sweep()
+    parsed.clear()
+
+    _write(manifests_dir, "beta", status="Archived", summary="Rewritten with a longer summary.")
+    second = data_layer.sweep()
+
+    assert parsed == ["beta.json"]
+    assert second.version == first.version + 1
+    assert second.manifests[0] is first.manifests[0]    # alpha's frozen value is shared
+    assert second.manifests[1]['status'] == "Archived"
+
+
+def test_added_and_removed_files(manifests_dir, parsed):
+    _write(manifests_dir, "alpha")
+    beta = _write(manifests_dir, "beta")
+    data_layer.sweep()
+    parsed.clear()
+
+    _write(manifests_dir, "gamma")
+    beta.unlink()
+    snapshot = data_layer.sweep()
+
+    assert parsed == ["gamma.json"]
+    assert [m['repo'] for m in snapshot.manifests] == ["alpha", "gamma"]
+    assert snapshot.manifest_facets.count('status', "Active") == 2
+
+
+def test_unreadable_manifest_is_isolated(manifests_dir):
+    _write(manifests_dir, "alpha")
+    (manifests_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+    snapshot = data_layer.sweep()
+
+    assert [m['repo'] for m in snapshot.manifests] == ["alpha"]
+    assert [(issue.file, issue.kind) for issue in snapshot.manifest_report.issues] == [("broken.json", 'parse')]
+
+
+def test_snapshot_is_read_only(manifests_dir):
+    _write(manifests_dir, "alpha")
+    manifest = data_layer.sweep().manifests[0]
+
+    with pytest.raises(TypeError):
+        manifest['status'] = "Archived"
+    assert manifest['tags'] == ("test",)
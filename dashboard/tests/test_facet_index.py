@@ -0,0 +1,72 @@
+"""facet_index: postings, counts, select() and counts_within()."""
+
+from typing import NamedTuple
+
+from facet_index import FacetIndex, iter_bits
+
+
+class Record(NamedTuple):
+    name: str
+    status: str
+    tags: tuple
+
+
+FACETS = {
+    'status': lambda r: (r.status,),
+    'tag': lambda r: r.tags,
+}
+
+RECORDS = (
+    Record("a", "Active", ("core", "ui")),
+    Record("b", "Archived", ("core",)),
+    Record("c", "Active", ("ui",)),
+    Record("d", "Incubating", ()),
+    Record("e", "Active", ("core",)),
+)
+
+
+def _names(index, bits):
+    return [record.name for record in index.records(bits)]
+
+
+def test_iter_bits():
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+
+
+def test_counts_most_common_first():
+    index = FacetIndex(RECORDS, FACETS)
+
+    assert list(index.counts('status').items()) == [("Active", 3), ("Archived", 1), ("Incubating", 1)]
+    assert index.count('tag', "core") == 3
+    assert index.count('tag', "core", "ui") == 4
+    assert index.count('status', "Missing") == 0
+
+
+def test_select():
+    index = FacetIndex(RECORDS, FACETS)
+
+    assert index.select() == index.all
+    assert index.select(status="All", tag=None) == index.all
+    assert _names(index, index.select(status="Active")) == ["a", "c", "e"]
+    assert _names(index, index.select(status="Active", tag="core")) == ["a", "e"]
+    assert index.select(status="Archived", tag="ui") == 0
+    assert index.select(status="Missing") == 0
+
+
+def test_counts_within():
+    index = FacetIndex(RECORDS, FACETS)
+    active = index.select(status="Active")
+
+    assert index.counts_within('tag', active) == {"core": 2, "ui": 2}
+    assert index.counts_within('status', index.select(tag="core")) == {"Active": 2, "Archived": 1}
+    assert index.counts_within('tag', index.all) is index.counts('tag')
+
+
+def test_records_are_memoised():
+    index = FacetIndex(RECORDS, FACETS)
+    bits = index.select(tag="ui")
+
+    assert index.records(bits) is index.records(bits)
+    assert index.records(index.all) is index.items
+    assert index.records(0) == ()
@@ -0,0 +1,77 @@
+"""glossary_search: field-weighted ranking, as-you-type prefixes, bounded fuzzy matching."""
+
+import pytest
+
+from glossary_search import GlossaryEngine, normalize
+from glossary_store import GlossaryTerm
+
+
+def _term(term, definition, category, related=()):
+    return GlossaryTerm(term, definition, category, tuple(related), "test")
+
+
+ENTRIES = (
+    _term("Omega Nova", "Final synthesis of the federation.", "Core", ["Nyquist Tunnel"]),
+    _term("Nyquist Tunnel", "Bridge between repositories; feeds Omega Nova.", "Infrastructure"),
+    _term("Drift", "Identity drift measured per persona.", "Metrics", ["Stability Index"]),
+    _term("Stability Index", "Résumé of persona drift over a run.", "Metrics"),
+    _term("Café Protocol", "Informal review held between sessions.", "Process"),
+)
+
+
+@pytest.fixture
+def engine():
+    return GlossaryEngine(ENTRIES)
+
+
+def _terms(hits):
+    return [hit.entry.term for hit in hits]
+
+
+def test_normalize():
+    assert normalize("Café RÉSUMÉ") == "cafe resume"
+
+
+def test_term_name_outranks_definition(engine):
+    hits = engine.search("omega nova")
+
+    assert _terms(hits) == ["Omega Nova", "Nyquist Tunnel"]
+    assert hits[0].score > hits[1].score
+
+
+def test_related_terms_are_searched(engine):
+    assert _terms(engine.search("stability")) == ["Stability Index", "Drift"]
+
+
+def test_last_token_matches_as_prefix(engine):
+    assert _terms(engine.search("omeg"))[0] == "Omega Nova"
+    assert _terms(engine.search("nyquist tun"))[0] == "Nyquist Tunnel"
+
+
+def test_fuzzy_match(engine):
+    assert _terms(engine.search("drfit"))[:1] == ["Drift"]          # one transposition
+    assert _terms(engine.search("stabilyty"))[:1] == ["Stability Index"]
+
+
+def test_fuzzy_edits_are_bounded(engine):
+    assert engine.search("dxxft") == ()                             # two edits on a short word
+
+
+def test_accents_are_ignored(engine):
+    assert _terms(engine.search("cafe")) == ["Café Protocol"]
+    assert _terms(engine.search("resume")) == ["Stability Index"]
+
+
+def test_every_token_must_match(engine):
+    assert engine.search("omega drift") == ()
+    assert engine.search("") == ()
+
+
+def test_categories_filter(engine):
+    assert _terms(engine.search("drift", categories={"Metrics"})) == ["Drift", "Stability Index"]
+    assert engine.search("drift", categories={"Core"}) == ()
+
+
+def test_results_are_cached(engine):
+    assert engine.search("persona") is engine.search("persona")
+    assert len(engine.search("persona", limit=1)) == 1
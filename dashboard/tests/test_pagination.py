@@ -0,0 +1,67 @@
+"""pagination: window arithmetic, cached orderings and the paged() component's page state."""
+
+from typing import NamedTuple
+
+import pytest
+import streamlit as st
+
+import pagination
+from pagination import SortOption, ordering, paged, window
+
+
+class Item(NamedTuple):
+    name: str
+    owner: str
+    tags: tuple
+
+
+ITEMS = tuple(Item(f"Repo {i:02d}", "Nova" if i % 3 else "Ziggy", ("even",) if i % 2 == 0 else ()) for i in range(50))
+SORTS = {"Name": SortOption('name'), "Name (Z–A)": SortOption('name', reverse=True)}
+
+
+@pytest.fixture(autouse=True)
+def fresh_orderings(session_state):
+    pagination._state.update(version=None, orderings={})
+
+
+def test_window():
+    ordered = tuple(range(50))
+
+    assert window(ordered, 1, 24) == pagination.Window(tuple(range(24)), 1, 3, 50, 0, 24)
+    assert window(ordered, 3, 24).items == (48, 49)
+    assert window(ordered, 9, 24).page == 3         # clamped
+    assert window(ordered, 0, 24).page == 1
+    assert window((), 1, 24) == pagination.Window((), 1, 1, 0, 0, 0)
+
+
+def test_ordering_search_and_sort():
+    result = ordering(ITEMS, "test", SORTS["Name (Z–A)"], query="ziggy", search_fields=('name', 'owner'))
+
+    assert [item.name for item in result] == [f"Repo {i:02d}" for i in range(48, -1, -3)]
+    assert ordering(ITEMS, "test", None, query="even", search_fields=('tags',)) == ITEMS[::2]
+
+
+def test_ordering_is_cached_per_key():
+    first = ordering(ITEMS, "test", SORTS["Name"])
+
+    assert ordering(ITEMS, "test", SORTS["Name"]) is first
+    assert ordering(ITEMS, "other", SORTS["Name"]) is not first
+
+
+def test_paged_defaults_to_first_page(monkeypatch):
+    monkeypatch.setitem(pagination.SETTINGS, 'page_size', 20)
+    result = paged(ITEMS, key="repos", sort_options=SORTS, search_fields=('name',))
+
+    assert (result.page, result.pages, result.total) == (1, 3, 50)
+    assert result.items == ITEMS[:20]
+
+
+def test_paged_keeps_page_until_listing_changes():
+    paged(ITEMS, key="repos", sort_options=SORTS, search_fields=('name',), page_size=20)
+    st.session_state["repos_page"] = 3
+    assert paged(ITEMS, key="repos", sort_options=SORTS, search_fields=('name',), page_size=20).items == ITEMS[40:]
+
+    # A new search starts again at page 1
+    st.session_state["repos_query"] = "Repo 4"
+    result = paged(ITEMS, key="repos", sort_options=SORTS, search_fields=('name',), page_size=20)
+    assert (result.page, result.total) == (1, 10)
@@ -0,0 +1,60 @@
+"""router: the page and theme round-trip through the URL query string."""
+
+import pytest
+import streamlit as st
+
+import router
+from page_registry import PageEntry, PageRegistry
+
+PAGES = PageRegistry([
+    PageEntry("📊 Overview", "pages.overview", "SYSTEM"),
+    PageEntry("🏥 Federation Health", "pages.federation_health", "SYSTEM"),
+    PageEntry("ℹ️ About", "pages.about", None),
+])
+
+
+@pytest.fixture(autouse=True)
+def fresh_session(session_state):
+    return session_state
+
+
+def test_first_run_reads_url():
+    st.query_params.update(page="federation_health", theme="matrix")
+
+    assert router.resolve(PAGES) == router.Route("🏥 Federation Health", True)
+
+
+def test_defaults_are_written_back():
+    assert router.resolve(PAGES) == router.Route(router.DEFAULT_PAGE, False)
+    assert st.query_params == {'page': "overview", 'theme': "standard"}
+
+
+def test_unknown_values_fall_back():
+    st.query_params.update(page="no_such_page", theme="neon")
+
+    assert router.resolve(PAGES) == router.Route(router.DEFAULT_PAGE, False)
+    assert st.query_params == {'page': "overview", 'theme': "standard"}
+
+
+def test_session_state_wins_after_first_run():
+    router.resolve(PAGES)
+    st.query_params['page'] = "about"
+
+    assert router.resolve(PAGES).page == router.DEFAULT_PAGE
+
+
+def test_callbacks_round_trip():
+    router.resolve(PAGES)
+    router.navigate(PAGES, "ℹ️ About")
+    router.set_theme(True)
+    route = router.resolve(PAGES)
+
+    assert route == router.Route("ℹ️ About", True)
+    assert st.query_params == {'page': "about", 'theme': "matrix"}
+
+    # A new session opened from that URL lands on the same view
+    link = dict(st.query_params)
+    st.session_state.clear()
+    st.query_params.clear()
+    st.query_params.update(link)
+    assert router.resolve(PAGES) == route
@@ -0,0 +1,89 @@
+"""schema: the compiled checkers' scores and errors, and the content-hash cache."""
+
+import pytest
+
+import schema
+
+DOCUMENT_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'status'],
+    'properties': {
+        'id': {'type': 'string', 'pattern': r"^\S+$"},
+        'status': {'type': 'string', 'enum': ['Active', 'Archived']},
+        'title': {'type': 'string', 'minLength': 1},
+        'tags': {'type': 'array', 'items': {'type': 'string', 'minLength': 1}},
+    },
+}
+
+MANIFEST = {
+    'repo': "alpha", 'display_name': "Alpha", 'owner': "Ziggy",
+    'url_repo': "https://github.com/example/alpha", 'url_dashboard': "TBD",
+    'role': "Fixture", 'status': "Active", 'tags': ["test"],
+    'summary': "A valid manifest.", 'last_updated': "2026-01-01",
+}
+
+
+@pytest.fixture
+def check():
+    return schema.compile_schema(DOCUMENT_SCHEMA)
+
+
+def test_valid_document(check):
+    result = check({'id': "x", 'status': "Active", 'title': "X", 'tags': ["a", "b"]})
+
+    assert result.valid
+    assert result.score == 1.0
+    # object type, 2 required, id / status / title type + 1 rule each, tags type + 2 x (type + minLength)
+    assert result.checks == 1 + 2 + 3 * 2 + 1 + 2 * 2
+
+
+def test_errors_and_score(check):
+    result = check({'id': "has space", 'status': "Live", 'tags': ["ok", ""]})
+
+    assert result.errors == (
+        "id: 'has space' does not match ^\\S+$",
+        "status: 'Live' is not one of Active, Archived",
+        "tags[1]: empty",
+    )
+    assert (result.checks, result.score) == (12, 0.75)     # 3 of 12 rules failed
+
+
+def test_missing_required(check):
+    result = check({'status': "Active"})
+
+    assert result.errors == ("id: required",)
+    assert not result.valid
+
+
+def test_type_failure_skips_nested_rules(check):
+    result = check({'id': "x", 'status': "Active", 'tags': "not-a-list"})
+
+    assert result.errors == ("tags: should be array, got string",)
+    assert result.checks == 8
+
+
+def test_document_of_wrong_type(check):
+    result = check(["not", "an", "object"])
+
+    assert result == schema.Conformance(score=0.0, checks=1, errors=("(document): should be object, got array",))
+
+
+def test_manifest_schema():
+    assert schema.validate('manifest', MANIFEST).valid
+    result = schema.validate('manifest', {**MANIFEST, 'last_updated': "January", 'url_repo': "github"})
+    assert result.errors == (
+        "url_repo: 'github' does not match ^(https?://\\S+|TBD)$",
+        "last_updated: 'January' does not match ^\\d{4}-\\d{2}-\\d{2}$",
+    )
+
+
+def test_results_cached_by_digest():
+    schema.clear()
+    first = schema.validate('manifest', MANIFEST, digest="fixture-digest")
+    before = schema.cache_stats()
+
+    # Same digest: the cached result, whatever the value
+    assert schema.validate('manifest', {}, digest="fixture-digest") is first
+    assert schema.cache_stats()['hits'] == before['hits'] + 1
+    # No digest: the canonical JSON is hashed, so equal documents share a result
+    assert schema.validate('manifest', dict(MANIFEST)) is schema.validate('manifest', dict(MANIFEST))
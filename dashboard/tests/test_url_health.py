@@ -0,0 +1,132 @@
+"""url_health against a local http.server: statuses, timeouts, TTL reuse, per-host limit."""
+
+import http.server
+import threading
+import time
+
+import pytest
+
+import url_health
+from config import SETTINGS
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """200 for any path, 404 for /missing; /slow... paths sleep `server.delay` first."""
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(server.delay)
+            self.send_response(404 if self.path == "/missing" else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.hits, httpd.active, httpd.peak, httpd.delay = {}, 0, 0, 0.2
+    httpd.url = f"http://127.0.0.1:{httpd.server_port}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def prober(monkeypatch):
+    """Settings are read when the loop's client is built, so every test gets a fresh loop."""
+    monkeypatch.setitem(SETTINGS, 'url_probe_timeout', 2.0)
+    monkeypatch.setitem(SETTINGS, 'url_probe_per_host', 16)
+    monkeypatch.setitem(SETTINGS, 'url_probe_ttl', 300)
+    url_health.stop()
+    url_health.clear()
+    yield
+    url_health.stop()
+    url_health.clear()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.02)
+
+
+def test_statuses(server):
+    ok, missing = f"{server.url}/ok", f"{server.url}/missing"
+    results = url_health.check([ok, missing, "ftp://example.org/"], wait=5)
+
+    assert results[ok].ok and results[ok].status == 200 and results[ok].error == ""
+    assert not results[missing].ok and results[missing].status == 404
+    assert results["ftp://example.org/"].error == "unsupported URL"
+
+
+def test_timeout(server, monkeypatch):
+    monkeypatch.setitem(SETTINGS, 'url_probe_timeout', 0.2)
+    server.delay = 1.0
+    url = f"{server.url}/slow"
+
+    result = url_health.check([url], wait=5)[url]
+
+    assert not result.ok
+    assert result.status is None
+    assert result.error == "timed out after 0.2s"
+
+
+def test_wait_zero_returns_pending(server):
+    url = f"{server.url}/slow"
+
+    assert url_health.check([url], wait=0) == {url: None}
+    _wait_for(lambda: url_health.cached_result(url) is not None)
+    assert url_health.check([url], wait=0)[url].ok
+
+
+def test_fresh_results_are_reused(server):
+    url = f"{server.url}/ok"
+    first = url_health.check([url], wait=5)[url]
+
+    assert url_health.check([url], wait=5)[url] is first
+    assert server.hits["/ok"] == 1
+
+
+def test_stale_results_are_served_while_reprobed(server, monkeypatch):
+    url = f"{server.url}/ok"
+    first = url_health.check([url], wait=5)[url]
+    monkeypatch.setitem(SETTINGS, 'url_probe_ttl', 0)
+
+    # The stale result comes back at once; the re-probe runs in the background
+    assert url_health.check([url], wait=0)[url] is first
+    _wait_for(lambda: url_health.cached_result(url) is not first)
+    assert server.hits["/ok"] == 2
+    assert url_health.cached_result(url).checked_at >= first.checked_at
+
+
+def test_per_host_limit(server, monkeypatch):
+    monkeypatch.setitem(SETTINGS, 'url_probe_per_host', 3)
+    server.delay = 0.2
+    urls = [f"{server.url}/slow/{i}" for i in range(9)]
+
+    started = time.monotonic()
+    results = url_health.check(urls, wait=5)
+    elapsed = time.monotonic() - started
+
+    assert all(result.ok for result in results.values())
+    assert server.peak == 3
+    assert elapsed >= 3 * server.delay         # three rounds of three
+    # Time spent queued behind the limit is not counted as latency
+    assert max(result.latency for result in results.values()) < 2 * server.delay
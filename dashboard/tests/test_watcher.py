@@ -0,0 +1,56 @@
+"""watcher: a burst of edits bumps the data epoch once, on either backend."""
+
+import time
+
+import pytest
+
+import watcher
+from config import SETTINGS
+
+DEBOUNCE = 0.3
+
+
+@pytest.fixture(params=['polling', 'inotify'])
+def backend(request, monkeypatch, manifests_dir):
+    monkeypatch.setitem(SETTINGS, 'watcher_debounce', DEBOUNCE)
+    monkeypatch.setitem(SETTINGS, 'watcher_poll_interval', 0.05)
+    watcher.stop()
+    name = watcher.start(force_polling=request.param == 'polling')
+    if name != request.param:
+        watcher.stop()
+        pytest.skip(f"{request.param} backend unavailable here")
+    time.sleep(0.1)     # let the polling backend take its first signature
+    yield name
+    watcher.stop()
+
+
+def _wait_for_epoch(epoch, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while watcher.data_epoch() == epoch:
+        assert time.monotonic() < deadline, "epoch did not move"
+        time.sleep(0.02)
+
+
+def test_burst_bumps_epoch_once(backend, manifests_dir):
+    epoch = watcher.data_epoch()
+
+    # Edits closer together than the debounce count as one change
+    for i in range(5):
+        (manifests_dir / f"burst-{i}.json").write_text("{}", encoding="utf-8")
+        time.sleep(DEBOUNCE / 5)
+    _wait_for_epoch(epoch)
+    time.sleep(DEBOUNCE * 2)
+
+    assert watcher.data_epoch() == epoch + 1
+
+
+def test_separate_edits_bump_separately(backend, manifests_dir):
+    epoch = watcher.data_epoch()
+
+    (manifests_dir / "first.json").write_text("{}", encoding="utf-8")
+    _wait_for_epoch(epoch)
+    time.sleep(DEBOUNCE * 2)
+    (manifests_dir / "second.json").write_text("{}", encoding="utf-8")
+    _wait_for_epoch(epoch + 1)
+
+    assert watcher.data_epoch() == epoch + 2
@@ -0,0 +1,377 @@
+"""
+PAN HANDLERS DASHBOARD — URL HEALTH PROBER
+
+Checks manifest `url_repo` / `url_dashboard` links concurrently on a
+private asyncio loop, using only the standard library.
+
+- One background event loop per process; Streamlit reruns submit work to it.
+- Keep-alive HTTP/1.1 connections are pooled per (scheme, host, port), so
+  a second probe to github.com reuses the open TLS connection
+  instead of handshaking again.
+- A semaphore per host caps concurrent requests to any one server
+  (SETTINGS['url_probe_per_host']). A federation hosted entirely on
+  github.com is therefore probed in rounds: n links take about
+  ceil(n / per_host) times the slowest request, not the sum of them.
+  The default of 16 covers one page of the Federation Health list
+  (page_size 24, most of them on github.com) in two rounds.
+- Every request has a timeout (SETTINGS['url_probe_timeout']).
+- Results, good and bad, are cached for SETTINGS['url_probe_ttl'] seconds.
+  Stale results are served while a re-probe runs in the background; only
+  URLs that were never checked are waited for.
+
+A URL is healthy when HEAD (or GET, if HEAD is refused) answers with a
+status below 400. Redirects are not followed. Plain http:// URLs work, so
+a local stand-in server (`python -m http.server 8000`) can be probed.
+
+Usage:
+    import url_health
+    results = url_health.check(["https://github.com/ZiggyMack/Pan_Handlers"])
+    results[url].ok, results[url].status, results[url].latency
+
+    python url_health.py http://127.0.0.1:8000/ https://github.com/
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import ssl
+import sys
+import threading
+import time
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from config import SETTINGS
+
+USER_AGENT = "PanHandlers-Dashboard/1.0 (health check)"
+MAX_HEADERS = 100
+MAX_DRAIN = 256 * 1024   # larger bodies are not read; the connection is closed instead
+
+
+class UrlStatus(NamedTuple):
+    """Result of probing one URL."""
+    url: str
+    ok: bool
+    status: Optional[int]   # HTTP status code, None if no response
+    error: str              # empty when a response was received
+    latency: float          # seconds, excluding time queued behind the per-host limit
+    checked_at: float       # epoch seconds
+
+
+_lock = threading.Lock()
+_state = {
+    'loop': None,
+    'thread': None,
+    'client': None,
+    'results': {},      # url -> UrlStatus
+    'inflight': {},     # url -> concurrent.futures.Future of its batch
+}
+
+
+# ========== HTTP CLIENT ==========
+
+class _Connection:
+    __slots__ = ('reader', 'writer', 'idle_since')
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.idle_since = time.monotonic()
+
+    def close(self):
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class _HostPool:
+    """Idle keep-alive connections and the concurrency cap for one origin."""
+
+    def __init__(self, limit):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle = []
+
+
+class HttpClient:
+    """
+    Minimal pooled HTTP/1.1 client for status checks. Lives on one event
+    loop; every method must be awaited on that loop.
+    """
+
+    def __init__(self, timeout, per_host, keepalive):
+        self.timeout = timeout
+        self.per_host = per_host
+        self.keepalive = keepalive
+        self._pools = {}
+        self._ssl = ssl.create_default_context()
+
+    def _pool(self, origin):
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = self._pools[origin] = _HostPool(self.per_host)
+        return pool
+
+    async def _connect(self, origin):
+        scheme, host, port = origin
+        if scheme == "https":
+            reader, writer = await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return _Connection(reader, writer)
+
+    def _take_idle(self, pool):
+        now = time.monotonic()
+        while pool.idle:
+            conn = pool.idle.pop()
+            if now - conn.idle_since < self.keepalive and not conn.reader.at_eof():
+                return conn
+            conn.close()
+        return None
+
+    async def _exchange(self, conn, method, target, host_header):
+        """Send one request; return (status, keep_alive)."""
+        conn.writer.write((
+            f"{method} {target} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            "Accept: */*\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("latin-1"))
+        await conn.writer.drain()
+
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        version, status = status_line.decode("latin-1").split(None, 2)[:2]
+        status = int(status)
+
+        headers = {}
+        for _ in range(MAX_HEADERS):
+            line = await conn.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep = version == "HTTP/1.1" and headers.get('connection', '').lower() != "close"
+        if method == "HEAD" or status < 200 or status in (204, 304):
+            return status, keep
+        if headers.get('transfer-encoding', '').lower() == "chunked":
+            return status, keep and await self._drain_chunked(conn.reader)
+        length = headers.get('content-length')
+        if length is not None and length.isdigit() and int(length) <= MAX_DRAIN:
+            await conn.reader.readexactly(int(length))
+            return status, keep
+        return status, False  # unknown or oversized body: don't read it, don't reuse
+
+    @staticmethod
+    async def _drain_chunked(reader):
+        total = 0
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return True
+            total += size
+            if total > MAX_DRAIN:
+                return False
+            await reader.readexactly(size + 2)
+
+    async def _round_trip(self, origin, method, target, host_header):
+        """One request on a pooled (or new) connection, retrying once if a reused one was stale."""
+        pool = self._pool(origin)
+        for attempt in range(2):
+            conn = self._take_idle(pool)
+            reused = conn is not None
+            if conn is None:
+                conn = await self._connect(origin)
+            try:
+                status, keep = await self._exchange(conn, method, target, host_header)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                conn.close()  # timeout / cancellation leaves the stream mid-response
+                raise
+            if keep:
+                conn.idle_since = time.monotonic()
+                pool.idle.append(conn)
+            else:
+                conn.close()
+            return status
+
+    async def probe(self, url):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return UrlStatus(url, False, None, "unsupported URL", 0.0, time.time())
+
+        default_port = 443 if parts.scheme == "https" else 80
+        origin = (parts.scheme, parts.hostname, parts.port or default_port)
+        host_header = parts.netloc.rpartition("@")[2]
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        status, error = None, ""
+        async with self._pool(origin).semaphore:
+            started = time.perf_counter()  # time spent queued for the host is not latency
+            try:
+                status = await asyncio.wait_for(
+                    self._round_trip(origin, "HEAD", target, host_header), self.timeout)
+                if status in (405, 501):  # HEAD not allowed; ask again with GET
+                    status = await asyncio.wait_for(
+                        self._round_trip(origin, "GET", target, host_header), self.timeout)
+            except asyncio.TimeoutError:
+                error = f"timed out after {self.timeout:g}s"
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+        return UrlStatus(
+            url=url,
+            ok=status is not None and status < 400,
+            status=status,
+            error=error,
+            latency=time.perf_counter() - started,
+            checked_at=time.time(),
+        )
+
+    async def probe_many(self, urls):
+        return await asyncio.gather(*(self.probe(url) for url in urls))
+
+    def close(self):
+        for pool in self._pools.values():
+            for conn in pool.idle:
+                conn.close()
+            pool.idle.clear()
+
+
+# ========== BACKGROUND LOOP ==========
+
+def _ensure_loop():
+    """Start the prober's event loop thread on first use."""
+    async def make_client():
+        # Built on the loop so its semaphores belong to it
+        return HttpClient(
+            timeout=SETTINGS['url_probe_timeout'],
+            per_host=SETTINGS['url_probe_per_host'],
+            keepalive=SETTINGS['url_probe_keepalive'],
+        )
+
+    with _lock:
+        if _state['thread'] is not None and _state['thread'].is_alive():
+            return _state['loop']
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="pan-handlers-url-health", daemon=True)
+        thread.start()
+        client = asyncio.run_coroutine_threadsafe(make_client(), loop).result()
+        _state.update(loop=loop, thread=thread, client=client)
+        return loop
+
+
+async def _run_batch(client, urls):
+    results = await client.probe_many(urls)
+    with _lock:
+        for result in results:
+            _state['results'][result.url] = result
+            _state['inflight'].pop(result.url, None)
+    return results
+
+
+def _submit(urls):
+    """Probe `urls` in one background batch, skipping any already in flight."""
+    loop = _ensure_loop()
+    with _lock:
+        todo = [url for url in urls if url not in _state['inflight']]
+        if not todo:
+            return
+        future = asyncio.run_coroutine_threadsafe(_run_batch(_state['client'], todo), loop)
+        for url in todo:
+            _state['inflight'][url] = future
+
+
+# ========== PUBLIC API ==========
+
+def check(urls, wait=None):
+    """
+    Return {url: UrlStatus or None} for `urls`. Fresh results come from the
+    cache; stale ones are returned as-is and re-probed in the background;
+    URLs never checked are probed and waited for up to `wait` seconds
+    (default SETTINGS['url_probe_wait']). Still-pending URLs map to None.
+    """
+    if wait is None:
+        wait = SETTINGS['url_probe_wait']
+    urls = list(dict.fromkeys(urls))
+    ttl = SETTINGS['url_probe_ttl']
+    now = time.time()
+
+    results = _state['results']
+    stale = [url for url in urls if url not in results or now - results[url].checked_at >= ttl]
+    if stale:
+        _submit(stale)
+        pending = {_state['inflight'].get(url) for url in stale if url not in results}
+        pending.discard(None)
+        if pending and wait > 0:
+            concurrent.futures.wait(pending, timeout=wait)
+
+    results = _state['results']
+    return {url: results.get(url) for url in urls}
+
+
+def manifest_urls(manifest):
+    """The probe-able links of one models.Manifest."""
+    return [url for url in (manifest.url_repo, manifest.url_dashboard)
+            if url and url != 'TBD' and url.startswith(("http://", "https://"))]
+
+
+def check_manifests(manifests, wait=None):
+    """check() over every link of every manifest."""
+    return check([url for manifest in manifests for url in manifest_urls(manifest)], wait=wait)
+
+
+def cached_result(url):
+    return _state['results'].get(url)
+
+
+def clear():
+    with _lock:
+        _state['results'] = {}
+
+
+def stop(timeout=2.0):
+    """Close pooled connections and stop the loop thread."""
+    with _lock:
+        loop, thread, client = _state['loop'], _state['thread'], _state['client']
+        _state.update(loop=None, thread=None, client=None, inflight={})
+    if loop is None:
+        return
+    if client is not None:
+        loop.call_soon_threadsafe(client.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+
+
+# ========== CLI ==========
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Probe URLs the way the dashboard does.")
+    parser.add_argument("urls", nargs="+")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = check(args.urls, wait=SETTINGS['url_probe_timeout'] * 2 + 1)
+    elapsed = time.perf_counter() - started
+    for url, result in results.items():
+        if result is None:
+            print(f"PENDING  {url}")
+        else:
+            outcome = result.status if result.status is not None else result.error
+            print(f"{'OK  ' if result.ok else 'FAIL'}  {result.latency:6.3f}s  {outcome}  {url}")
+    print(f"{len(results)} URLs in {elapsed:.3f}s")
+    stop()
+    return 0 if all(r is not None and r.ok for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
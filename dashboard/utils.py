@@ -4,62 +4,97 @@ PAN HANDLERS DASHBOARD — SHARED UTILITIES
 Shared functions used across multiple dashboard pages.
 """
 
-import json
 import streamlit as st
+from functools import lru_cache
 from pathlib import Path
 from config import PATHS, SETTINGS
+from data_layer import get_snapshot, EMPTY
+from fragments import cached, emit
+from armada_index import get_armada_index
+import path_health
 
 # Unpack paths
 PAN_HANDLERS_ROOT = PATHS['pan_handlers_root']
 REPO_ROOT = PATHS['repo_root']
 
 # ========== DATA LOADERS ==========
+# All loaders read the shared, stat-validated snapshot from data_layer.
+# Calls within `snapshot_max_age` seconds share one stat sweep, so a rerun
+# pays for a single sweep and an edit is visible on the next rerun. The
+# snapshot is frozen and shared by every session in the process; sessions
+# keep a reference to it (see `load_snapshot`), never a copy.
+
+def _snapshot():
+    return get_snapshot(max_age=SETTINGS['snapshot_max_age'])
+
+
+def _report_project_errors(snapshot):
+    if 'projects_file' in snapshot.file_errors:
+        st.error(f"Failed to load projects.json: {snapshot.file_errors['projects_file']}")
+        return True
+    if snapshot.projects is None:
+        st.warning(f"projects.json not found at: {PATHS['projects_file']}")
+        return True
+    return False
+
+
+def _report_manifest_errors(snapshot):
+    # One line however many files are affected; the details are a panel on Federation Health
+    issues = snapshot.manifest_report.issues
+    if issues:
+        files = len({issue.file for issue in issues})
+        st.caption(f"⚠️ {files} manifest file{'s' if files != 1 else ''} with problems — see 🏥 Federation Health › Manifest Diagnostics")
+
+
+def load_snapshot():
+    """
+    The current shared snapshot, after surfacing its load errors. main()
+    stores the returned reference and its version in session_state.
+    """
+    snapshot = _snapshot()
+    _report_project_errors(snapshot)
+    _report_manifest_errors(snapshot)
+    return snapshot
+
+
+def session_snapshot():
+    """The snapshot this session's rerun was started with (EMPTY before main() ran)."""
+    return st.session_state.get('snapshot', EMPTY)
+
 
-@st.cache_data(ttl=60)
 def load_projects():
-    """Load flagship projects from projects.json."""
-    projects_file = PATHS['projects_file']
-    if projects_file.exists():
-        with open(projects_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        st.warning(f"projects.json not found at: {projects_file}")
-    return {}
+    """Load flagship projects from projects.json (read-only mapping)."""
+    snapshot = _snapshot()
+    if _report_project_errors(snapshot):
+        return {}
+    return snapshot.projects
 
 
-@st.cache_data(ttl=60)
 def load_manifests():
-    """Load all manifests from manifests/ directory."""
-    manifests = []
-    manifests_dir = PATHS['manifests_dir']
-    if manifests_dir.exists():
-        for manifest_file in manifests_dir.glob("*.json"):
-            try:
-                with open(manifest_file, 'r', encoding='utf-8') as f:
-                    manifests.append(json.load(f))
-            except Exception as e:
-                st.warning(f"Failed to load {manifest_file.name}: {e}")
-    return manifests
-
-
-@st.cache_data(ttl=60)
+    """Load all manifests from manifests/ directory (a tuple, ordered by repo id)."""
+    snapshot = _snapshot()
+    _report_manifest_errors(snapshot)
+    return snapshot.manifests
+
+
+def load_manifest_models():
+    """Manifests as frozen models.Manifest records, built once per snapshot."""
+    return _snapshot().manifest_models
+
+
+def load_project_models():
+    """Flagship projects as frozen models.Project records, built once per snapshot."""
+    return _snapshot().project_models
+
+
 def load_nyquist_status():
     """Load Nyquist Consciousness status for Matrix integration."""
-    status_file = PATHS['nyquist_status']
-    if status_file.exists():
-        with open(status_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    return _snapshot().nyquist_status
 
 
-@st.cache_data(ttl=60)
 def load_publication_status():
     """Load publication status from Nyquist."""
-    pub_file = PATHS['publication_status']
-    if pub_file.exists():
-        with open(pub_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    return _snapshot().publication_status
 
 
 @st.cache_data
@@ -73,10 +108,9 @@ def load_markdown_file(file_path):
 
 # ========== STATUS HELPERS ==========
 
-def get_status_badge(status):
-    """Return HTML for status badge."""
+def _build_status_badges():
     colors = SETTINGS['colors']
-    badges = {
+    return {
         "Active": f'<span class="status-badge" style="background: rgba(0,255,65,0.2); color: {colors["active"]}; border: 1px solid {colors["active"]};">ACTIVE</span>',
         "Complete": f'<span class="status-badge" style="background: rgba(42,157,143,0.2); color: {colors["complete"]}; border: 1px solid {colors["complete"]};">COMPLETE</span>',
         "Incubating": f'<span class="status-badge" style="background: rgba(255,215,0,0.2); color: #b8860b; border: 1px solid {colors["incubating"]};">INCUBATING</span>',
@@ -85,7 +119,16 @@ def get_status_badge(status):
         "In Progress": f'<span class="status-badge" style="background: rgba(0,255,65,0.2); color: {colors["active"]}; border: 1px solid {colors["active"]};">IN PROGRESS</span>',
         "In Preparation": f'<span class="status-badge" style="background: rgba(244,162,97,0.2); color: {colors["concept"]}; border: 1px solid {colors["concept"]};">IN PREP</span>',
     }
-    return badges.get(status, f'<span class="status-badge">{status}</span>')
+
+
+# Built once at import; badges depend only on the static SETTINGS colors
+STATUS_BADGES = _build_status_badges()
+
+
+@lru_cache(maxsize=256)
+def get_status_badge(status):
+    """Return HTML for status badge."""
+    return STATUS_BADGES.get(status, f'<span class="status-badge">{status}</span>')
 
 
 def get_track_color(track):
@@ -105,14 +148,14 @@ def get_track_color(track):
 
 def page_divider():
     """Visual page divider with Pan Handlers styling."""
-    st.markdown("""
+    emit("""
     <div style="border-top: 2px solid #00ff41; margin: 1.5em 0; opacity: 0.5;"></div>
-    """, unsafe_allow_html=True)
+    """)
 
 
 def section_header(title, emoji=""):
     """Render a styled section header."""
-    st.markdown(f"""
+    emit(f"""
     <div style="color: #00ff41; font-size: 1.4em; font-weight: bold;
                 margin-top: 1.5em; margin-bottom: 0.8em;
                 font-family: 'Georgia', serif;
@@ -120,104 +163,116 @@ def section_header(title, emoji=""):
                 padding-bottom: 0.3em;">
         {emoji} {title}
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
 
-def project_card(project, compact=False):
-    """Render a project card."""
-    badge = get_status_badge(project.get('status', 'Concept'))
-    track_color = get_track_color(project.get('track', ''))
+def current_theme():
+    """Theme name for the active session ('matrix' or 'standard')."""
+    return "matrix" if st.session_state.get('matrix_mode') else "standard"
+
+
+def _project_card_html(project, compact):
+    badge = get_status_badge(project.badge_status)
+    track_color = get_track_color(project.track)
 
     if compact:
-        st.markdown(f"""
+        return f"""
         <div style="background: linear-gradient(135deg, rgba(42,157,143,0.1) 0%, rgba(42,157,143,0.05) 100%);
                     border: 2px solid {track_color}; border-radius: 10px;
                     padding: 1em; margin-bottom: 0.8em;">
             <h4 style="color: {track_color}; margin: 0 0 0.3em 0;">
-                {project.get('title', 'Untitled')[:28]}{'...' if len(project.get('title', '')) > 28 else ''} {badge}
+                {project.title[:28]}{'...' if len(project.title) > 28 else ''} {badge}
             </h4>
             <p style="color: #555; font-style: italic; font-size: 0.9em; margin: 0;">
-                {project.get('tagline', '')[:55]}{'...' if len(project.get('tagline', '')) > 55 else ''}
+                {project.tagline[:55]}{'...' if len(project.tagline) > 55 else ''}
             </p>
             <p style="color: #888; font-size: 0.85em; margin: 0.3em 0 0 0;">
-                <strong>{project.get('track', 'TBD')}</strong>
+                <strong>{project.track}</strong>
             </p>
         </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
+        """
+    return f"""
         <div style="background: linear-gradient(135deg, rgba(42,157,143,0.1) 0%, rgba(42,157,143,0.05) 100%);
                     border: 2px solid {track_color}; border-radius: 10px;
                     padding: 1.2em; margin-bottom: 0.8em;
                     box-shadow: 0 0 15px rgba(42,157,143,0.15);">
             <h4 style="color: {track_color}; margin-top: 0; margin-bottom: 0.5em;">
-                {project.get('title', 'Untitled')} {badge}
+                {project.title} {badge}
             </h4>
-            <p style="color: #555; font-style: italic;">{project.get('tagline', '')}</p>
-            <p style="color: #444;"><strong>Track:</strong> {project.get('track', 'TBD')}</p>
-            <p style="color: #444;"><strong>Lead:</strong> {project.get('owner', 'TBD')}</p>
+            <p style="color: #555; font-style: italic;">{project.tagline}</p>
+            <p style="color: #444;"><strong>Track:</strong> {project.track}</p>
+            <p style="color: #444;"><strong>Lead:</strong> {project.owner}</p>
         </div>
-        """, unsafe_allow_html=True)
+        """
 
 
-def repo_card(manifest):
-    """Render a repository card."""
-    badge = get_status_badge(manifest.get('status', 'Unknown'))
-    tags_html = " ".join([f'<code style="background: rgba(0,255,65,0.2); color: #00ff41; padding: 2px 6px; border-radius: 3px; font-size: 0.8em;">{tag}</code>' for tag in manifest.get('tags', [])[:4]])
+def project_card(project, compact=False):
+    """Render a project card for a models.Project (HTML cached per snapshot)."""
+    html = cached(
+        ('project_card', project.fingerprint, current_theme(), compact),
+        lambda: _project_card_html(project, compact),
+    )
+    emit(html)
+
+
+def _repo_card_html(manifest):
+    badge = get_status_badge(manifest.status)
+    tags_html = " ".join([f'<code style="background: rgba(0,255,65,0.2); color: #00ff41; padding: 2px 6px; border-radius: 3px; font-size: 0.8em;">{tag}</code>' for tag in manifest.tags[:4]])
 
-    st.markdown(f"""
+    return f"""
     <div style="background: linear-gradient(135deg, rgba(0,255,65,0.08) 0%, rgba(0,204,51,0.03) 100%);
                 border: 2px solid #00ff41; border-radius: 12px;
                 padding: 1.5em; margin-bottom: 1em;
                 box-shadow: 0 0 20px rgba(0,255,65,0.2);">
         <h3 style="color: #00ff41; margin-top: 0; font-family: 'Georgia', serif;">
-            {manifest.get('display_name', manifest.get('repo', 'Unknown'))} {badge}
+            {manifest.display_name} {badge}
         </h3>
-        <p style="color: #444;"><strong>Role:</strong> {manifest.get('role', 'N/A')}</p>
-        <p style="color: #444;"><strong>Owner:</strong> {manifest.get('owner', 'N/A')}</p>
-        <p style="color: #555;">{manifest.get('summary', 'No description.')[:150]}{'...' if len(manifest.get('summary', '')) > 150 else ''}</p>
+        <p style="color: #444;"><strong>Role:</strong> {manifest.role}</p>
+        <p style="color: #444;"><strong>Owner:</strong> {manifest.owner}</p>
+        <p style="color: #555;">{(manifest.summary or 'No description.')[:150]}{'...' if len(manifest.summary) > 150 else ''}</p>
         <p>{tags_html}</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+def repo_card(manifest):
+    """Render a repository card for a models.Manifest (HTML cached per snapshot)."""
+    html = cached(
+        ('repo_card', manifest.fingerprint, current_theme(), False),
+        lambda: _repo_card_html(manifest),
+    )
+    emit(html)
 
 
 # ========== STATISTICS ==========
 
-def get_project_stats(projects_data):
-    """Calculate statistics from projects data."""
-    if not projects_data:
+def get_project_stats(facets):
+    """Project statistics read from a snapshot's facet_index.FacetIndex of projects."""
+    if not len(facets):
         return {}
 
-    projects = projects_data.get('flagship_projects', [])
-    stats = {
-        'total': len(projects),
-        'active': sum(1 for p in projects if p.get('status') in ['Active', 'In Progress']),
-        'in_prep': sum(1 for p in projects if p.get('status') == 'In Preparation'),
-        'concept': sum(1 for p in projects if p.get('status') == 'Concept'),
-        'by_track': {},
+    return {
+        'total': len(facets),
+        'active': facets.count('status', 'Active', 'In Progress'),
+        'in_prep': facets.count('status', 'In Preparation'),
+        'concept': facets.count('status', 'Concept'),
+        'by_status': facets.counts('status'),
+        'by_track': facets.counts('track'),
     }
 
-    for p in projects:
-        track = p.get('track', 'Unknown')
-        stats['by_track'][track] = stats['by_track'].get(track, 0) + 1
-
-    return stats
-
 
 def get_nyquist_integration_stats():
     """Get stats about Nyquist integration for Matrix page."""
     stats = {}
 
     # Check if Nyquist paths exist
-    stats['nyquist_connected'] = PATHS['nyquist_status'].exists()
+    stats['nyquist_connected'] = path_health.exists('nyquist_status')
 
-    # Get S7 Armada stats if available
-    s7_dir = PATHS['s7_armada_dir']
-    if s7_dir.exists():
-        armada_results = list(s7_dir.glob("armada_results/*.json"))
-        stats['armada_runs'] = len(armada_results)
-    else:
-        stats['armada_runs'] = 0
+    # S7 Armada stats from the incremental results index (one stat per check)
+    armada = get_armada_index()
+    stats['armada_runs'] = armada.run_count
+    stats['armada_newest_run'] = armada.newest_run
+    stats['armada_ships'] = len(armada.ships)
 
     # Publication status
     pub_status = load_publication_status()
@@ -0,0 +1,304 @@
+"""
+PAN HANDLERS DASHBOARD — FILESYSTEM WATCHER
+
+Optional background thread that watches the federation inputs and bumps a
+process-wide data epoch when they change. Loaders key on the epoch, so while
+the watcher runs no session has to stat anything to discover an edit.
+
+Backends:
+    inotify  — Linux, through libc via ctypes (no third-party packages)
+    polling  — everywhere else; one cheap stat pass per interval
+
+Usage:
+    import watcher
+    watcher.start()            # idempotent, safe to call on every rerun
+    watcher.data_epoch()       # changes whenever a watched input changes
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from config import PATHS, SETTINGS
+
+# Watched beyond the snapshot inputs (data_layer.SINGLE_FILES + manifests_dir)
+EXTRA_KEYS = ('s7_armada_dir',)
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+_lock = threading.Lock()
+_state = {
+    'epoch': 0,
+    'thread': None,
+    'backend': None,
+    'stop': None,
+    'subscribers': [],
+    'last_change': None,
+}
+
+
+# ========== EPOCH ==========
+
+def data_epoch():
+    """Current data epoch. Bumped once per debounced burst of changes."""
+    return _state['epoch']
+
+
+def is_running():
+    """True while a watcher thread is alive."""
+    thread = _state['thread']
+    return thread is not None and thread.is_alive()
+
+
+def backend():
+    """Name of the active backend ('inotify' / 'polling'), or None."""
+    return _state['backend'] if is_running() else None
+
+
+def subscribe(callback):
+    """Call `callback(epoch)` from the watcher thread after every bump."""
+    with _lock:
+        if callback not in _state['subscribers']:
+            _state['subscribers'].append(callback)
+
+
+def _bump():
+    with _lock:
+        _state['epoch'] += 1
+        _state['last_change'] = time.time()
+        epoch = _state['epoch']
+        subscribers = list(_state['subscribers'])
+    for callback in subscribers:
+        try:
+            callback(epoch)
+        except Exception as e:
+            print(f"[watcher] subscriber {callback!r} failed: {e}", file=sys.stderr)
+
+
+def watched_keys():
+    """PATHS keys of every watched input: whatever data_layer sweeps, plus EXTRA_KEYS."""
+    from data_layer import SINGLE_FILES     # data_layer imports this module
+    return ('manifests_dir',) + SINGLE_FILES + EXTRA_KEYS
+
+
+def _targets(keys=None):
+    return [Path(PATHS[key]) for key in (keys or watched_keys())]
+
+
+# ========== INOTIFY BACKEND ==========
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class _Inotify:
+    """Minimal inotify wrapper watching directories for a set of targets."""
+
+    def __init__(self, libc, targets):
+        self.libc = libc
+        self.targets = targets
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.filters = {}  # wd -> set of relevant entry names, or None for "any"
+        self.rewatch()
+
+    def _add(self, directory, name):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            return
+        names = self.filters.setdefault(wd, set())
+        if names is None:
+            return
+        if name is None:
+            self.filters[wd] = None
+        else:
+            names.add(name)
+
+    def rewatch(self):
+        """
+        (Re)establish watches. Directories are watched directly; files are
+        watched through their parent so rename-on-save is seen. A missing
+        target is watched through its nearest existing ancestor until it
+        appears.
+        """
+        self.filters = {}
+        for target in self.targets:
+            if target.is_dir():
+                self._add(target, None)
+                continue
+            child, parent = target, target.parent
+            while not parent.is_dir() and parent != parent.parent:
+                child, parent = parent, parent.parent
+            if parent.is_dir():
+                self._add(parent, child.name)
+
+    def wait(self, timeout):
+        """Block up to `timeout` seconds; return True if a relevant event arrived."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        relevant = False
+        structure_changed = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+
+                if mask & (IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                    relevant = structure_changed = True
+                    continue
+                names = self.filters.get(wd, set())
+                if names is None or name in names:
+                    relevant = True
+                    if mask & (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO):
+                        structure_changed = True
+        if structure_changed:
+            self.rewatch()
+        return relevant
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _run_inotify(notifier, stop, debounce):
+    try:
+        while not stop.is_set():
+            if not notifier.wait(timeout=1.0):
+                continue
+            # Debounce: keep absorbing events until the burst goes quiet
+            while notifier.wait(timeout=debounce) and not stop.is_set():
+                pass
+            _bump()
+    finally:
+        notifier.close()
+
+
+# ========== POLLING BACKEND ==========
+
+def _signature(targets):
+    """
+    Cheap fingerprint of the targets. Directories contribute their own stat
+    plus one stat per direct entry, except large result directories where
+    only the directory stat is used (adds and removes still show up).
+    """
+    parts = []
+    for target in targets:
+        try:
+            st = os.stat(target)
+        except OSError:
+            parts.append((str(target), None))
+            continue
+        parts.append((str(target), st.st_mtime_ns, st.st_size))
+        if target == Path(PATHS['manifests_dir']) and os.path.isdir(target):
+            with os.scandir(target) as entries:
+                for entry in entries:
+                    try:
+                        est = entry.stat()
+                    except OSError:
+                        continue
+                    parts.append((entry.name, est.st_mtime_ns, est.st_size))
+    return tuple(parts)
+
+
+def _run_polling(targets, stop, interval, debounce):
+    previous = _signature(targets)
+    while not stop.wait(interval):
+        current = _signature(targets)
+        if current == previous:
+            continue
+        # Debounce: wait for the signature to settle before bumping
+        while not stop.wait(debounce):
+            settled = _signature(targets)
+            if settled == current:
+                break
+            current = settled
+        previous = current
+        _bump()
+
+
+# ========== LIFECYCLE ==========
+
+def start(force_polling=False):
+    """
+    Start the watcher thread if it is not already running.
+    Returns the backend name in use.
+    """
+    # Outside the lock: the first call imports data_layer, which subscribes (and takes the lock)
+    targets = _targets()
+    with _lock:
+        if is_running():
+            return _state['backend']
+
+        debounce = SETTINGS['watcher_debounce']
+        stop_event = threading.Event()
+
+        libc = None if force_polling else _load_libc()
+        notifier = None
+        if libc is not None:
+            try:
+                notifier = _Inotify(libc, targets)
+            except OSError:
+                notifier = None
+
+        if notifier is not None:
+            name = 'inotify'
+            target, args = _run_inotify, (notifier, stop_event, debounce)
+        else:
+            name = 'polling'
+            target, args = _run_polling, (targets, stop_event, SETTINGS['watcher_poll_interval'], debounce)
+
+        thread = threading.Thread(target=target, args=args, name=f"pan-handlers-watcher-{name}", daemon=True)
+        _state.update(thread=thread, backend=name, stop=stop_event)
+        thread.start()
+        return name
+
+
+def stop(timeout=2.0):
+    """Stop the watcher thread (mainly for tests and benchmarks)."""
+    with _lock:
+        thread, stop_event = _state['thread'], _state['stop']
+        _state.update(thread=None, stop=None)
+    if stop_event is not None:
+        stop_event.set()
+    if thread is not None:
+        thread.join(timeout)
@@ -0,0 +1,64 @@
+"""
+Dashboard modules for Grand Hall pages.
+
+The dashboard (../dashboard) is a directory of flat modules that import
+each other by bare name (`from config import PATHS`). The Grand Hall host
+may have its own `config`, `utils` or `models` already imported, so
+dashboard modules are never imported by appending to sys.path. `load()`
+imports one with the dashboard directory at sys.path[0] and any host module
+of the same bare name set aside, then restores sys.path and sys.modules
+exactly as they were. Loaded modules are kept as
+`pan_handlers_dashboard.<name>`, so every page and rerun gets the same
+module objects.
+
+Usage:
+    from ._dashboard import load
+    facet_index = load('facet_index')
+"""
+
+import importlib
+import sys
+import threading
+from pathlib import Path
+
+DASHBOARD_DIR = Path(__file__).resolve().parent.parent / "dashboard"
+NAMESPACE = "pan_handlers_dashboard"
+
+_lock = threading.Lock()
+
+
+def _is_dashboard(module):
+    path = getattr(module, '__file__', None)
+    return path is not None and Path(path).resolve().parent == DASHBOARD_DIR
+
+
+def load(name):
+    """The dashboard module `name`, imported (once) without touching the host's modules."""
+    module = sys.modules.get(f"{NAMESPACE}.{name}")
+    if module is not None:
+        return module
+
+    with _lock:
+        own = [path.stem for path in DASHBOARD_DIR.glob("*.py")]
+        before = {bare: sys.modules.get(bare) for bare in own}
+        # Bare names resolve to dashboard modules while importing: earlier loads, or fresh imports
+        for bare in own:
+            loaded = sys.modules.get(f"{NAMESPACE}.{bare}")
+            if loaded is not None:
+                sys.modules[bare] = loaded
+            elif before[bare] is not None and not _is_dashboard(before[bare]):
+                del sys.modules[bare]
+        sys.path.insert(0, str(DASHBOARD_DIR))
+        try:
+            module = importlib.import_module(name)
+        finally:
+            del sys.path[sys.path.index(str(DASHBOARD_DIR))]
+            for bare in own:
+                current = sys.modules.get(bare)
+                if current is not None and _is_dashboard(current):
+                    sys.modules[f"{NAMESPACE}.{bare}"] = current
+                if before[bare] is None:
+                    sys.modules.pop(bare, None)
+                else:
+                    sys.modules[bare] = before[bare]
+        return module
@@ -4,6 +4,19 @@ Glossary / Lexicon - Core concepts, roles, and artifacts
 
 import streamlit as st
 
+# Glossary store and search engine live with the dashboard, loaded without touching this app's modules
+from ._dashboard import load
+
+config = load('config')
+glossary_search = load('glossary_search')
+glossary_store = load('glossary_store')
+
+SOURCE_LABELS = {
+    glossary_store.BUILTIN: "Grand Hall",
+    'glossary_md': "data/glossary.md",
+    'glossary_sync_out': "circle/SYNC_OUT/GLOSSARY.md",
+}
+
 
 # Glossary data
 GLOSSARY = {
@@ -128,6 +141,16 @@ GLOSSARY = {
 }
 
 
+def _render_entry(entry, caption=None):
+    with st.expander(f"**{entry.term}**"):
+        source = SOURCE_LABELS.get(entry.source, entry.source)
+        st.caption(f"{caption} · {source}" if caption else source)
+        st.markdown(entry.definition)
+
+        if entry.related:
+            st.markdown("**Related:** " + ", ".join([f"`{r}`" for r in entry.related]))
+
+
 def render():
     """Render the Glossary page."""
     st.markdown('<div class="pan-title">📖 Glossary</div>', unsafe_allow_html=True)
@@ -135,44 +158,41 @@ def render():
 
     st.markdown("---")
 
-    # Search
-    search = st.text_input("🔍 Search terms:", placeholder="Type to filter...")
+    # One store for this dict plus data/glossary.md and circle/SYNC_OUT/GLOSSARY.md; re-parsed only on change
+    glossary = glossary_store.get_glossary(GLOSSARY)
+    search = st.text_input("🔍 Search terms:", placeholder="Type to filter — prefixes and typos are fine...")
 
     # Category filter
-    categories = list(GLOSSARY.keys())
+    categories = list(glossary.by_category)
     selected_cats = st.multiselect("Filter by category:", categories, default=categories)
 
     st.markdown("---")
 
-    # Display glossary
-    for category in selected_cats:
-        if category not in GLOSSARY:
-            continue
-
-        terms = GLOSSARY[category]
-
-        # Filter by search
-        if search:
-            terms = [t for t in terms if search.lower() in t['term'].lower() or search.lower() in t['definition'].lower()]
-
-        if not terms:
-            continue
-
-        st.markdown(f'<div class="section-header">{category}</div>', unsafe_allow_html=True)
-
-        for term_data in terms:
-            with st.expander(f"**{term_data['term']}**"):
-                st.markdown(term_data['definition'])
-
-                related = term_data.get('related', [])
-                if related:
-                    st.markdown("**Related:** " + ", ".join([f"`{r}`" for r in related]))
+    if search:
+        hits = glossary_search.get_engine(GLOSSARY).search(search, categories=selected_cats)
+        if not hits:
+            st.info("No terms match your search.")
+        for hit in hits:
+            _render_entry(hit.entry, caption=hit.entry.category)
+    else:
+        # Display glossary by category
+        limit = config.SETTINGS['glossary_max_results']
+        for category in selected_cats:
+            entries = glossary.by_category.get(category)
+            if not entries:
+                continue
+
+            st.markdown(f'<div class="section-header">{category}</div>', unsafe_allow_html=True)
+            for entry in entries[:limit]:
+                _render_entry(entry)
+            if len(entries) > limit:
+                st.caption(f"+{len(entries) - limit} more — search to narrow them down.")
 
     st.markdown("---")
 
     # Stats
-    total_terms = sum(len(terms) for terms in GLOSSARY.values())
-    st.caption(f"📚 {total_terms} terms across {len(GLOSSARY)} categories")
+    sources = ", ".join(f"{count} from {SOURCE_LABELS.get(source, source)}" for source, count in glossary.sources.items())
+    st.caption(f"📚 {len(glossary.terms)} terms across {len(categories)} categories ({sources})")
 
     # Link to full glossary document
     st.markdown("---")
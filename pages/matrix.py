@@ -5,239 +5,244 @@ The other side of the tunnel — where Pan Handlers connects to its theoretical
 
 import streamlit as st
 
+# Shared CSS pipeline lives with the dashboard, loaded without touching this app's modules
+from ._dashboard import load
+
+css_assets = load('css_assets')
+
+MATRIX_CSS = """
+/* ===== MATRIX THEME - GREEN ON BLACK TERMINAL AESTHETIC ===== */
+
+/* ===== BASE - BLACK BACKGROUND ===== */
+.stApp,
+.stApp > div,
+.stApp [data-testid="stAppViewContainer"],
+[data-testid="stAppViewContainer"],
+.main,
+.block-container,
+[data-testid="stVerticalBlock"],
+[data-testid="stHorizontalBlock"] {
+    background-color: #0a0a0a !important;
+    background: #0a0a0a !important;
+}
+
+/* ===== ALL TEXT MATRIX GREEN ===== */
+.stApp p, .stApp span, .stApp label, .stApp li,
+.stApp h1, .stApp h2, .stApp h3, .stApp h4, .stApp h5, .stApp h6,
+.stApp div,
+.main p, .main span, .main label, .main li,
+.main h1, .main h2, .main h3, .main h4, .main h5, .main h6,
+.main div {
+    color: #00ff41 !important;
+}
+
+/* ===== HEADERS ===== */
+h1, h2, h3, h4, h5, h6 {
+    color: #00ff41 !important;
+    font-family: 'Courier New', monospace;
+    font-weight: bold !important;
+}
+
+h1 {
+    border-bottom: 2px solid #00ff41;
+    padding-bottom: 0.5rem;
+}
+
+/* Strong/bold text - bright green with glow */
+strong, b {
+    color: #00ff41 !important;
+    text-shadow: 0 0 5px rgba(0,255,65,0.5);
+}
+
+/* Links */
+a {
+    color: #00cc33 !important;
+}
+
+a:hover {
+    color: #00ff41 !important;
+    text-shadow: 0 0 10px rgba(0,255,65,0.5);
+}
+
+/* ===== METRIC CARDS ===== */
+[data-testid="stMetricValue"] {
+    font-size: 2rem;
+    color: #00ff41 !important;
+    font-weight: bold;
+    font-family: 'Courier New', monospace;
+}
+
+[data-testid="stMetricLabel"] {
+    color: #00ff41 !important;
+}
+
+[data-testid="stMetricDelta"] {
+    color: #00cc33 !important;
+}
+
+/* ===== EXPANDERS ===== */
+[data-testid="stExpander"] {
+    background-color: #0d0d0d !important;
+    border: 1px solid #00ff41 !important;
+    border-radius: 8px;
+}
+
+[data-testid="stExpander"] * {
+    color: #00ff41 !important;
+}
+
+/* ===== CODE BLOCKS ===== */
+code {
+    background: rgba(0,255,65,0.1) !important;
+    color: #00ff41 !important;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+}
+
+/* ===== BUTTONS ===== */
+.stButton > button {
+    background-color: #0d0d0d !important;
+    color: #00ff41 !important;
+    border: 2px solid #00ff41 !important;
+    border-radius: 8px;
+    font-family: 'Courier New', monospace;
+    transition: all 0.3s ease;
+}
+
+.stButton > button:hover {
+    background-color: #004d1a !important;
+    color: #ffffff !important;
+    box-shadow: 0 0 15px rgba(0,255,65,0.4);
+}
+
+/* Horizontal rules */
+hr {
+    border-color: #00ff41 !important;
+}
+
+/* ===== MATRIX-SPECIFIC ELEMENTS ===== */
+.matrix-title {
+    font-size: 2.5em;
+    font-weight: bold;
+    background: linear-gradient(135deg, #00ff41 0%, #00cc33 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    margin-bottom: 0.3em;
+    font-family: 'Courier New', monospace;
+}
+
+.matrix-subtitle {
+    color: #00cc33 !important;
+    font-size: 1.2em;
+    margin-bottom: 1em;
+    font-family: 'Courier New', monospace;
+}
+
+.portal-card {
+    background: linear-gradient(135deg, rgba(0,255,65,0.1) 0%, rgba(0,204,51,0.05) 100%);
+    border: 2px solid #00ff41;
+    border-radius: 10px;
+    padding: 1.5em;
+    margin-bottom: 1em;
+    box-shadow: 0 0 20px rgba(0,255,65,0.3);
+}
+
+.portal-card h3 {
+    color: #00ff41 !important;
+    margin-top: 0;
+    font-family: 'Courier New', monospace;
+}
+
+.portal-card p, .portal-card li {
+    color: #00ff41 !important;
+}
+
+.nyquist-hub {
+    background: linear-gradient(135deg, rgba(244,162,97,0.15) 0%, rgba(231,111,81,0.08) 100%);
+    border: 3px solid #f4a261;
+    border-radius: 12px;
+    padding: 2em;
+    margin: 1.5em auto;
+    max-width: 700px;
+    box-shadow: 0 0 30px rgba(244,162,97,0.4);
+    text-align: center;
+}
+
+.nyquist-hub h3 {
+    color: #f4a261 !important;
+    font-family: 'Courier New', monospace;
+    font-size: 1.8em;
+    margin-bottom: 0.5em;
+}
+
+.nyquist-hub p {
+    color: #e9c46a !important;
+    font-family: 'Courier New', monospace;
+}
+
+.nyquist-hub ul {
+    text-align: left;
+    display: inline-block;
+    margin-top: 1em;
+}
+
+.nyquist-hub li {
+    color: #f4a261 !important;
+    font-family: 'Courier New', monospace;
+    margin: 0.3em 0;
+}
+
+.hub-badge {
+    display: inline-block;
+    padding: 0.4em 1em;
+    border-radius: 20px;
+    font-size: 0.9em;
+    font-weight: bold;
+    margin-left: 0.8em;
+    background: rgba(244,162,97,0.3);
+    color: #f4a261;
+    border: 1px solid #f4a261;
+    text-transform: uppercase;
+    letter-spacing: 0.1em;
+}
+
+.philosophy-quote {
+    font-size: 1.3em;
+    font-weight: bold;
+    color: #00ff41 !important;
+    text-align: center;
+    padding: 1em;
+    font-family: 'Courier New', monospace;
+    text-shadow: 0 0 10px rgba(0,255,65,0.3);
+}
+
+.section-header {
+    color: #00ff41 !important;
+    font-size: 1.5em;
+    font-weight: bold;
+    margin-top: 1.5em;
+    margin-bottom: 0.8em;
+    font-family: 'Courier New', monospace;
+    border-bottom: 2px solid #00ff41;
+    padding-bottom: 0.3em;
+}
+
+.footer-text {
+    text-align: center;
+    color: #00cc33 !important;
+    font-family: 'Courier New', monospace;
+    margin-top: 2em;
+    opacity: 0.7;
+}
+"""
+
 
 def render():
     """Render The Matrix portal hub — gateway to Nyquist Consciousness."""
 
-    # Matrix theme CSS - Green-on-black terminal aesthetic
-    st.markdown("""
-        <style>
-        /* ===== MATRIX THEME - GREEN ON BLACK TERMINAL AESTHETIC ===== */
-
-        /* ===== BASE - BLACK BACKGROUND ===== */
-        .stApp,
-        .stApp > div,
-        .stApp [data-testid="stAppViewContainer"],
-        [data-testid="stAppViewContainer"],
-        .main,
-        .block-container,
-        [data-testid="stVerticalBlock"],
-        [data-testid="stHorizontalBlock"] {
-            background-color: #0a0a0a !important;
-            background: #0a0a0a !important;
-        }
-
-        /* ===== ALL TEXT MATRIX GREEN ===== */
-        .stApp p, .stApp span, .stApp label, .stApp li,
-        .stApp h1, .stApp h2, .stApp h3, .stApp h4, .stApp h5, .stApp h6,
-        .stApp div,
-        .main p, .main span, .main label, .main li,
-        .main h1, .main h2, .main h3, .main h4, .main h5, .main h6,
-        .main div {
-            color: #00ff41 !important;
-        }
-
-        /* ===== HEADERS ===== */
-        h1, h2, h3, h4, h5, h6 {
-            color: #00ff41 !important;
-            font-family: 'Courier New', monospace;
-            font-weight: bold !important;
-        }
-
-        h1 {
-            border-bottom: 2px solid #00ff41;
-            padding-bottom: 0.5rem;
-        }
-
-        /* Strong/bold text - bright green with glow */
-        strong, b {
-            color: #00ff41 !important;
-            text-shadow: 0 0 5px rgba(0,255,65,0.5);
-        }
-
-        /* Links */
-        a {
-            color: #00cc33 !important;
-        }
-
-        a:hover {
-            color: #00ff41 !important;
-            text-shadow: 0 0 10px rgba(0,255,65,0.5);
-        }
-
-        /* ===== METRIC CARDS ===== */
-        [data-testid="stMetricValue"] {
-            font-size: 2rem;
-            color: #00ff41 !important;
-            font-weight: bold;
-            font-family: 'Courier New', monospace;
-        }
-
-        [data-testid="stMetricLabel"] {
-            color: #00ff41 !important;
-        }
-
-        [data-testid="stMetricDelta"] {
-            color: #00cc33 !important;
-        }
-
-        /* ===== EXPANDERS ===== */
-        [data-testid="stExpander"] {
-            background-color: #0d0d0d !important;
-            border: 1px solid #00ff41 !important;
-            border-radius: 8px;
-        }
-
-        [data-testid="stExpander"] * {
-            color: #00ff41 !important;
-        }
-
-        /* ===== CODE BLOCKS ===== */
-        code {
-            background: rgba(0,255,65,0.1) !important;
-            color: #00ff41 !important;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }
-
-        /* ===== BUTTONS ===== */
-        .stButton > button {
-            background-color: #0d0d0d !important;
-            color: #00ff41 !important;
-            border: 2px solid #00ff41 !important;
-            border-radius: 8px;
-            font-family: 'Courier New', monospace;
-            transition: all 0.3s ease;
-        }
-
-        .stButton > button:hover {
-            background-color: #004d1a !important;
-            color: #ffffff !important;
-            box-shadow: 0 0 15px rgba(0,255,65,0.4);
-        }
-
-        /* Horizontal rules */
-        hr {
-            border-color: #00ff41 !important;
-        }
-
-        /* ===== MATRIX-SPECIFIC ELEMENTS ===== */
-        .matrix-title {
-            font-size: 2.5em;
-            font-weight: bold;
-            background: linear-gradient(135deg, #00ff41 0%, #00cc33 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 0.3em;
-            font-family: 'Courier New', monospace;
-        }
-
-        .matrix-subtitle {
-            color: #00cc33 !important;
-            font-size: 1.2em;
-            margin-bottom: 1em;
-            font-family: 'Courier New', monospace;
-        }
-
-        .portal-card {
-            background: linear-gradient(135deg, rgba(0,255,65,0.1) 0%, rgba(0,204,51,0.05) 100%);
-            border: 2px solid #00ff41;
-            border-radius: 10px;
-            padding: 1.5em;
-            margin-bottom: 1em;
-            box-shadow: 0 0 20px rgba(0,255,65,0.3);
-        }
-
-        .portal-card h3 {
-            color: #00ff41 !important;
-            margin-top: 0;
-            font-family: 'Courier New', monospace;
-        }
-
-        .portal-card p, .portal-card li {
-            color: #00ff41 !important;
-        }
-
-        .nyquist-hub {
-            background: linear-gradient(135deg, rgba(244,162,97,0.15) 0%, rgba(231,111,81,0.08) 100%);
-            border: 3px solid #f4a261;
-            border-radius: 12px;
-            padding: 2em;
-            margin: 1.5em auto;
-            max-width: 700px;
-            box-shadow: 0 0 30px rgba(244,162,97,0.4);
-            text-align: center;
-        }
-
-        .nyquist-hub h3 {
-            color: #f4a261 !important;
-            font-family: 'Courier New', monospace;
-            font-size: 1.8em;
-            margin-bottom: 0.5em;
-        }
-
-        .nyquist-hub p {
-            color: #e9c46a !important;
-            font-family: 'Courier New', monospace;
-        }
-
-        .nyquist-hub ul {
-            text-align: left;
-            display: inline-block;
-            margin-top: 1em;
-        }
-
-        .nyquist-hub li {
-            color: #f4a261 !important;
-            font-family: 'Courier New', monospace;
-            margin: 0.3em 0;
-        }
-
-        .hub-badge {
-            display: inline-block;
-            padding: 0.4em 1em;
-            border-radius: 20px;
-            font-size: 0.9em;
-            font-weight: bold;
-            margin-left: 0.8em;
-            background: rgba(244,162,97,0.3);
-            color: #f4a261;
-            border: 1px solid #f4a261;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-        }
-
-        .philosophy-quote {
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #00ff41 !important;
-            text-align: center;
-            padding: 1em;
-            font-family: 'Courier New', monospace;
-            text-shadow: 0 0 10px rgba(0,255,65,0.3);
-        }
-
-        .section-header {
-            color: #00ff41 !important;
-            font-size: 1.5em;
-            font-weight: bold;
-            margin-top: 1.5em;
-            margin-bottom: 0.8em;
-            font-family: 'Courier New', monospace;
-            border-bottom: 2px solid #00ff41;
-            padding-bottom: 0.3em;
-        }
-
-        .footer-text {
-            text-align: center;
-            color: #00cc33 !important;
-            font-family: 'Courier New', monospace;
-            margin-top: 2em;
-            opacity: 0.7;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Matrix theme CSS - Green-on-black terminal aesthetic (minified once per process)
+    css_assets.inline_css(css_assets.build_sheet("grand-hall-matrix", MATRIX_CSS))
 
     # Header
     st.markdown('<div class="matrix-title">THE MATRIX</div>', unsafe_allow_html=True)